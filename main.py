@@ -2,15 +2,20 @@ import platform
 import argparse
 import traceback
 import time
+import sys
 import os
 
+from selenium.common.exceptions import WebDriverException
+
 import zalando_de
-from zalando_de.scrape.main import Scraper
-from zalando_de.scrape.commun.assistants import ScraperAssistant
+from zalando_de.scrape.main import MAIN_LINK, OUTPUT_FILENAME
+from zalando_de.scrape.categories import CategoryCrawler, load_manifest
+from zalando_de.scrape.coordinators import ShardWorker, CoordinatorClient
+from zalando_de.scrape.commun.drivers import RecyclePolicy
 from zalando_de.scrape.commun.exceptions import (WindowAlreadyClosedException,
                                                  UnableToConnectException)
 from zalando_de.utils.logging import Logger
-from zalando_de.utils.helpers import create_directory
+from zalando_de.utils.helpers import create_directory, backoff_delay
 
 
 trunc_conformation_msg = ("\nYou specified to truncate the output "
@@ -20,6 +25,13 @@ continuing_msg = ("\nThe browser was recently forcibly closed "
                   "or the internet connection was instable.\n"
                   "Do you want to re-try ? (y/n) : ")
 
+# Exit status codes.
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+EXIT_RETRIES_EXHAUSTED = 2
+EXIT_ABORTED = 3
+EXIT_INTERRUPTED = 130
+
 
 def parse_arguments():
     """
@@ -39,12 +51,201 @@ def parse_arguments():
     parser.add_argument('--log_level', type=int, default=10,
                         help=('Specifies the minimum logging level (must '
                               'be used reduce the logging memory.)'))
+    # Categories manifest.
+    parser.add_argument('--manifest', type=str, default=None,
+                        help=('Specifies a json manifest of the categories '
+                              'to crawl (defaults to the men\'s shirts). An '
+                              'article listed in several categories is only '
+                              'saved to the outputs of the first category '
+                              'that processes it.'))
+    parser.add_argument('--workers', type=int, default=1,
+                        help=('Specifies the number of categories to crawl '
+                              'at once (each in its own browser).'))
+    # Browser profile directory.
+    parser.add_argument('--profile_dir', type=str, default=None,
+                        help=('Specifies the persistent browser profile '
+                              'directory (defaults to <odir>/profile).'))
+    # Browser recycling policy.
+    parser.add_argument('--recycle_every', type=int, default=None,
+                        help=('Recycles (restarts) the browser every N '
+                              'processed articles.'))
+    parser.add_argument('--recycle_rss', type=float, default=None,
+                        help=('Recycles (restarts) the browser once its '
+                              'resident memory exceeds N MB.'))
+    # Articles prefetching.
+    parser.add_argument('--prefetch', type=int, default=0,
+                        help=('Specifies the number of articles\' tabs to '
+                              'pre-open while the current one is processed '
+                              '(0 disables the prefetching).'))
+    # Off-thread parsing.
+    parser.add_argument('--parse_workers', type=int, default=0,
+                        help=('Specifies the number of worker processes '
+                              'parsing the articles\' page snapshots (0 '
+                              'scrapes each article through the browser).'))
+    # Network capture mode.
+    parser.add_argument('--capture', action='store_true',
+                        help=('Decodes the articles from the catalog/product '
+                              'JSON responses captured while walking through '
+                              'the listing pages, instead of opening them.'))
+    # Sitemap discovery mode.
+    parser.add_argument('--sitemap', type=str, action='append', default=None,
+                        help=('Discovers the articles from a sitemap (url or '
+                              'local path, gzipped or not) instead of the '
+                              'listing pages. Can be repeated.'))
+    # Re-crawl mode.
+    parser.add_argument('--recrawl', action='store_true',
+                        help=('Re-scrapes the already scraped articles, the '
+                              'most likely to have changed first.'))
+    parser.add_argument('--budget_articles', type=int, default=None,
+                        help=('Specifies the maximum number of articles to '
+                              're-scrape per category (re-crawl mode).'))
+    parser.add_argument('--budget_seconds', type=float, default=None,
+                        help=('Specifies the maximum time in seconds spent '
+                              're-scraping per category (re-crawl mode).'))
+    # In-run re-tries of the timed out articles.
+    parser.add_argument('--retry_attempts', type=int, default=2,
+                        help=('Specifies the maximum number of re-tries of '
+                              'a timed out article in the same run (0 '
+                              'disables the re-tries).'))
+    # Selectors config.
+    parser.add_argument('--selectors', type=str, default=None,
+                        help=('Specifies a json config overriding the '
+                              'elements\' class names (reloaded as soon '
+                              'as it\'s modified).'))
+    # Connection outages.
+    parser.add_argument('--max_outage', type=float, default=600,
+                        help=('Specifies the time in seconds the connection '
+                              'may be down (the crawl waiting for it) before '
+                              'giving up.'))
+    # Partially processed articles.
+    parser.add_argument('--field_retries', type=int, default=1,
+                        help=('Specifies the number of re-tries of each '
+                              'article\'s field before saving it partially.'))
+    parser.add_argument('--complete', action='store_true',
+                        help=('Extracts only the missing fields of the '
+                              'partially processed articles.'))
+    # Storage backend.
+    parser.add_argument('--backend', type=str, default='csv',
+                        choices=['csv', 'sqlite', 'parquet'],
+                        help=('Specifies where the cleaned articles are saved : '
+                              'a CSV file, a SQLite database (upserted by ID), '
+                              'or a Parquet dataset (partitioned by scrape day, '
+                              'requires pyarrow).'))
+    parser.add_argument('--history', action='store_true',
+                        help=('Records the articles\' price, discount, and '
+                              'sizes\' availability over time (a point per '
+                              'change) into <output>.history.sqlite.'))
+    parser.add_argument('--long_tables', action='store_true',
+                        help=('Also saves the articles\' sizes (availability, '
+                              'stock, and price) and colors as long-format '
+                              'tables (a row per size or color).'))
+    parser.add_argument('--compression', type=str, default=None,
+                        choices=['gzip', 'zstd'],
+                        help=('Compresses the JSON and CSV outputs on the fly '
+                              '(zstd requires zstandard). The compressed '
+                              'outputs are detected on reading.'))
+    # Distributed crawl (worker mode).
+    parser.add_argument('--coordinator', type=str, default=None,
+                        help=('Crawls the shards leased from the coordinator '
+                              'at this url (see `python3 -m '
+                              'zalando_de.scrape.coordinators`).'))
+    parser.add_argument('--worker_id', type=str, default=None,
+                        help=('Specifies the worker\'s name (defaults to '
+                              '<hostname>-<pid>).'))
+    # Unattended (supervisor) mode.
+    parser.add_argument('--unattended', action='store_true',
+                        help=('Never waits for a confirmation : truncation '
+                              'is confirmed, and failures are re-tried '
+                              'automatically with an exponential backoff.'))
+    parser.add_argument('--max_retries', type=int, default=10,
+                        help=('Specifies the maximum number of successive '
+                              're-tries without progress (unattended mode).'))
+    parser.add_argument('--backoff', type=float, default=5,
+                        help=('Specifies the base delay in seconds before '
+                              're-trying (unattended mode).'))
+    parser.add_argument('--max_backoff', type=float, default=600,
+                        help=('Specifies the maximum delay in seconds before '
+                              're-trying (unattended mode).'))
     # Parse the arguments.
     args = parser.parse_args()
     # Retuen them.
     return args
 
 
+def crawl_with_retries(crawler, logger: Logger,
+                       unattended: bool = False,
+                       max_retries: int = 10,
+                       backoff: float = 5,
+                       max_backoff: float = 600):
+    """
+    Crawl, and re-try after the recoverable failures (the browser was
+    closed, or the connection was lost) : once confirmed in the console,
+    or automatically with an exponential backoff in `unattended` mode,
+    until `max_retries` successive re-tries made no progress.
+
+    Return the exit status code.
+
+    """
+    with crawler:
+
+        # The number of successive re-tries without progress.
+        attempt = 0
+
+        while True:
+
+            # Start Processing (Scrapping)
+            try:
+                crawler.crawl()
+                logger.info("Processing finished successfully.",
+                            _lbr=True, _rbr=True)
+                return EXIT_SUCCESS
+
+            except KeyboardInterrupt:
+                logger.error("Processing forcibly stopped using "
+                            "keyboard : Ctrl + C",
+                            _lbr=True, _rbr=True)
+                logger.error(traceback.format_exc(), show_details=False)
+                return EXIT_INTERRUPTED
+
+            # NOTE : A bare `WebDriverException` can only be raised while
+            # launching the browser, all the others are wrapped by the scraper.
+            except (WindowAlreadyClosedException,
+                    UnableToConnectException,
+                    WebDriverException) as exc:
+                logger.error("Processing Failed with the following Error :",
+                            _lbr=True, _rbr=True)
+                if isinstance(exc, WebDriverException):
+                    logger.error(traceback.format_exc(), show_details=False)
+                else:
+                    exc.err()
+                # Re-try
+                if not unattended:
+                    time.sleep(2)
+                    if not input(continuing_msg).lower().startswith('y'):
+                        return EXIT_ABORTED
+                    continue
+                # In unattended mode, only the re-tries that made no progress
+                # count toward the cap. The progress itself is preserved by the
+                # saved outputs and the persisted crawl position.
+                if crawler.processed_articles:
+                    attempt = 0
+                attempt += 1
+                if attempt > max_retries:
+                    logger.error("Giving up after {} re-tries without progress."
+                                 "".format(max_retries), _lbr=True)
+                    return EXIT_RETRIES_EXHAUSTED
+                delay = backoff_delay(attempt, backoff, max_backoff)
+                logger.warn("Re-trying ({}/{}) in {:.1f} seconds ..."
+                            "".format(attempt, max_retries, delay), _lbr=True)
+                time.sleep(delay)
+
+            except BaseException as exc:
+                logger.error("Processing Failed with the following Unknown Exception :",
+                            _lbr=True, _rbr=True)
+                logger.error(traceback.format_exc(), show_details=False)
+                return EXIT_FAILURE
+
+
 def run():
 
     print("Script started ...")
@@ -64,7 +265,7 @@ def run():
 
     truncate_output = False
     if args.trunc:
-        if input(trunc_conformation_msg).lower().startswith('y'):
+        if args.unattended or input(trunc_conformation_msg).lower().startswith('y'):
             truncate_output = True
 
     # Handle the data and logs folders.
@@ -75,6 +276,10 @@ def run():
     
     log_output_file = f"{output_dir}/logs/logging.log"
 
+    # NOTE : The profile directory is not truncated, to retain the
+    # browser's disk cache and cookies.
+    profile_dir = create_directory(args.profile_dir or f"{output_dir}/profile", False)
+
     print()
     print("Output directory : {}".format(data_output_dir))
     print("Logs destination :  {}".format(log_output_file))
@@ -82,40 +287,53 @@ def run():
     # Define the logger
     logger = Logger(log_output_file, args.log_level)
 
-    while True:
+    # The categories to crawl.
+    categories = (load_manifest(args.manifest)
+                  if args.manifest
+                  else [(MAIN_LINK, OUTPUT_FILENAME)])
 
-        # Start Processing (Scrapping)
-        with ScraperAssistant(logger=logger) as assistant:
+    # The scrapers' options.
+    scraper_options = dict(recycle_policy=RecyclePolicy(args.recycle_every,
+                                                        args.recycle_rss),
+                           prefetch=args.prefetch,
+                           parse_workers=args.parse_workers,
+                           recrawl_budget=args.budget_articles,
+                           recrawl_time=args.budget_seconds,
+                           retry_attempts=args.retry_attempts,
+                           max_outage=args.max_outage,
+                           field_retries=args.field_retries,
+                           backend=args.backend,
+                           history=args.history,
+                           long_tables=args.long_tables,
+                           compression=args.compression)
 
-            try:
-                scraper = Scraper(assistant=assistant, out=data_output_dir)
-                scraper.scrape()
-                logger.info("Processing finished successfully.",
-                            _lbr=True, _rbr=True)
-                break
-                
-            except KeyboardInterrupt:
-                logger.error("Processing forcibly stopped using "
-                            "keyboard : Ctrl + C",
-                            _lbr=True, _rbr=True)
-                logger.error(traceback.format_exc(), show_details=False)
-                break
-                
-            except (WindowAlreadyClosedException,
-                    UnableToConnectException) as exc:
-                logger.error("Processing Failed with the following Error :",
-                            _lbr=True, _rbr=True)
-                exc.err()
-                # Re-try
-                time.sleep(2)
-                if not input(continuing_msg).lower().startswith('y'):
-                    break
+    # NOTE : The browsers are owned by the crawler, so that they're
+    # reused (warm) across the re-tries.
+    if args.coordinator:
+        crawler = ShardWorker(CoordinatorClient(args.coordinator, args.worker_id),
+                              data_output_dir, logger,
+                              profile_dir=profile_dir,
+                              selectors=args.selectors,
+                              **scraper_options)
+    else:
+        crawler = CategoryCrawler(categories, data_output_dir, logger,
+                                  profile_dir=profile_dir,
+                                  workers=args.workers,
+                                  how=('capture' if args.capture
+                                       else 'sitemap' if args.sitemap
+                                       else 'recrawl' if args.recrawl
+                                       else 'complete' if args.complete
+                                       else 'all'),
+                                  links=args.sitemap or [],
+                                  selectors=args.selectors,
+                                  **scraper_options)
+
+    return crawl_with_retries(crawler, logger,
+                              unattended=args.unattended,
+                              max_retries=args.max_retries,
+                              backoff=args.backoff,
+                              max_backoff=args.max_backoff)
 
-            except BaseException as exc:
-                logger.error("Processing Failed with the following Unknown Exception :",
-                            _lbr=True, _rbr=True)
-                logger.error(traceback.format_exc(), show_details=False)
-                break
 
 if __name__ == '__main__':
-    run()
+    sys.exit(run())
@@ -0,0 +1,187 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from zalando_de.scrape.main import Scraper, read_processed_ids, articles_path
+from zalando_de.scrape.commun.assistants import ScraperAssistant
+from zalando_de.scrape.commun.drivers import DriverManager
+from zalando_de.scrape.commun.indexes import ProcessedIndex
+from zalando_de.scrape.commun.selectors import SelectorRegistry
+from zalando_de.utils.logging import Logger
+from zalando_de.utils.helpers import create_directory
+
+
+def load_manifest(path: str):
+    """
+    Read a categories manifest : a json list of categories, each with
+    the listing `url` to crawl and the `output` file name to save to.
+
+    ```json
+    [
+        {"url": "https://en.zalando.de/mens-clothing-shirts/",
+         "output": "zalando_de_mens_shirts"},
+        {"url": "https://en.zalando.de/mens-clothing-jeans/",
+         "output": "zalando_de_mens_jeans"}
+    ]
+    ```
+
+    Return a list of (url, output) tuples.
+
+    """
+    with open(path, 'r', encoding='utf-8') as mf:
+        manifest = json.load(mf)
+    if not isinstance(manifest, list):
+        raise ValueError("Invalid manifest (a list of categories is "
+                         "expected) : {}".format(path))
+    categories = []
+    for category in manifest:
+        if (not isinstance(category, dict)
+            or not category.get('url') or not category.get('output')):
+            raise ValueError("Invalid category (both 'url' and 'output' "
+                             "are required) : {}".format(category))
+        categories.append((category['url'], category['output']))
+    # The outputs must be distinct.
+    outputs = [output for _, output in categories]
+    if len(set(outputs)) != len(outputs):
+        raise ValueError("The categories' outputs must be distinct.")
+    return categories
+
+
+class CategoryCrawler():
+
+    """
+    A context manager to crawl several categories in one run, each in
+    its own browser, with up to `workers` categories crawled at once.
+
+    The categories share the same processed articles' index, so the
+    articles appearing in several categories are fetched only once,
+    while each category is saved to its own outputs.
+
+    NOTE : Hence an article appearing in several categories is only
+    saved to the outputs of the first category that processes it.
+
+    The crawled categories are remembered, so calling :meth:`crawl`
+    again (e.g. after a failure) only crawls the remaining ones.
+
+    """
+
+    def __init__(self, categories: list, out: str, logger = None,
+                 profile_dir: str = None, workers: int = 1,
+                 how: str = 'all', links: list = [],
+                 selectors: str = None,
+                 **scraper_options) -> None:
+        self._categories = categories
+        self._output_directory = out
+        self.logger: Logger = logger or Logger()
+        self._profile_dir = profile_dir
+        self._workers = max(workers, 1)
+        # How to scrape each category (see :meth:`Scraper.scrape`).
+        self._how = how
+        self._links = links
+        self._capture = how == 'capture'
+        self._scraper_options = scraper_options
+        # The storage backend (see :class:`Scraper`).
+        self._backend = scraper_options.get('backend', 'csv')
+        # The selectors (the default ones, overridden by the `selectors`
+        # json config, if specified), shared by all the categories.
+        self._selectors = SelectorRegistry(selectors, self.logger)
+        # Load the shared index with all the categories' processed articles.
+        self._index = ProcessedIndex()
+        for _, output in categories:
+            self._index.update(read_processed_ids(articles_path(out, output,
+                                                                self._backend)))
+        self.logger.info("Processed articles read : {} articles."
+                         "".format(len(self._index)))
+        # The driver managers (one per category), kept warm across the
+        # re-tries.
+        self._driver_managers = {}
+        self._crawled = set()
+        self._scrapers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    @property
+    def processed_articles(self):
+        """
+        The number of articles processed by the last crawl.
+
+        """
+        return sum(scraper._metadata.get('processed_articles', 0)
+                   for scraper in self._scrapers.values())
+
+    def _driver_manager(self, output: str):
+        """
+        Get the driver manager of a category.
+
+        NOTE : The browsers can't share the same profile at once, hence
+        each category uses its own one.
+
+        """
+        if output not in self._driver_managers:
+            profile_dir = (create_directory(f"{self._profile_dir}/{output}", False)
+                           if self._profile_dir else None)
+            self._driver_managers[output] = DriverManager(profile_dir,
+                                                          self.logger,
+                                                          self._capture)
+        return self._driver_managers[output]
+
+    def _crawl_category(self, url: str, output: str):
+        """
+        Crawl a single category.
+
+        """
+        self.logger.info("Crawling the category {} : {}".format(output, url),
+                         _lbr=True)
+        with ScraperAssistant(logger=self.logger,
+                              driver_manager=self._driver_manager(output),
+                              selectors=self._selectors) as assistant:
+            scraper = Scraper(assistant=assistant,
+                              out=self._output_directory,
+                              main_link=url,
+                              output_filename=output,
+                              index=self._index,
+                              **self._scraper_options)
+            self._scrapers[output] = scraper
+            scraper.scrape(self._how, self._links)
+        self._crawled.add(output)
+
+    def crawl(self):
+        """
+        Crawl the remaining categories.
+
+        If some categories failed, the first failure is raised once
+        all the others are done.
+
+        """
+        self._scrapers = {}
+        pending = [(url, output) for url, output in self._categories
+                   if output not in self._crawled]
+        # Crawl a single category in the current thread.
+        if len(pending) == 1 or self._workers == 1:
+            for url, output in pending:
+                self._crawl_category(url, output)
+            return
+        # Otherwise, crawl the categories concurrently.
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            futures = [executor.submit(self._crawl_category, url, output)
+                       for url, output in pending]
+            try:
+                exceptions = [future.exception() for future in futures]
+            except KeyboardInterrupt as e:
+                # Stop the workers by closing their browsers.
+                self.close()
+                raise e
+        for exception in exceptions:
+            if exception is not None:
+                raise exception
+
+    def close(self):
+        """
+        Tear down all the browsers.
+
+        """
+        for driver_manager in self._driver_managers.values():
+            driver_manager.quit()
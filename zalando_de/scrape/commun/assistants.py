@@ -10,14 +10,22 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as ec
+from selenium.common.exceptions import (WebDriverException,
+                                        TimeoutException,
+                                        NoSuchElementException)
 
 
 from zalando_de.utils.logging import Logger
 from zalando_de.utils.helpers import *
+from zalando_de.scrape.commun.drivers import (WEB_DRIVER,
+                                              OPTIONS,
+                                              DriverManager,
+                                              init_driver)
+from zalando_de.scrape.commun.selectors import SelectorRegistry
+
+ROOT_URL = "https://en.zalando.de/"
 
 PROFILE = webdriver
-WEB_DRIVER = webdriver.Chrome
-OPTIONS = webdriver.ChromeOptions
 WEB_ELEMENT = WebElement
 
 XLONG_WAIT = 20
@@ -28,10 +36,24 @@ SHORT_WAIT = 5
 
 class ScraperAssistant():
 
-    def __init__(self, driver = None, logger = None) -> None:
+    def __init__(self, driver = None, logger = None,
+                 driver_manager: DriverManager = None,
+                 capture: bool = False,
+                 selectors: SelectorRegistry = None) -> None:
         # Configure the helper tool
         self.__pend_driver = driver
         self.__pend_logger = logger
+        # NOTE : If a driver manager is provided, the driver is owned
+        # by it, and hence it's not quit when exiting the context.
+        self._driver_manager = driver_manager
+        self._consent_handled = False
+        # Whether to enable the network responses capture.
+        self._capture = capture
+        # The factor applied to the pages' loading waits (raised to
+        # slow down when the connection is unstable).
+        self.pace = 1.0
+        # The fields' selectors.
+        self.selectors: SelectorRegistry = selectors or SelectorRegistry()
     
     def __enter__(self):
         self.__config()
@@ -44,7 +66,12 @@ class ScraperAssistant():
         self.__config_wait( *args, **kwargs)
 
     def __config_driver(self):
-        self.driver: WEB_DRIVER = self.__pend_driver or self._init_driver()
+        if self.__pend_driver:
+            self.driver: WEB_DRIVER = self.__pend_driver
+        elif self._driver_manager:
+            self.driver: WEB_DRIVER = self._driver_manager.get()
+        else:
+            self.driver: WEB_DRIVER = self._init_driver()
 
     def __config_logger(self):
         self.logger: Logger = self.__pend_logger or Logger()
@@ -68,21 +95,70 @@ class ScraperAssistant():
         #                               .format_exception(exc_type,
         #                                                 exc_value,
         #                                                 tb)), _lbr=True)
+        # Keep the driver warm if it's owned by a driver manager.
+        if self._driver_manager:
+            return
         # Tear down the driver
         self.driver.quit()
         self.logger.info("The browser closed.", _lbr=True)
 
+    @property
+    def consent_handled(self):
+        """
+        Whether the cookies consent is already retained by the browser.
+
+        """
+        if self._driver_manager:
+            return self._driver_manager.consent_handled
+        return self._consent_handled
+
+    @consent_handled.setter
+    def consent_handled(self, handled: bool):
+        if self._driver_manager:
+            self._driver_manager.consent_handled = handled
+        else:
+            self._consent_handled = handled
+
     def _init_driver(self):
         """
         Initiate the driver.
         
         """
-        # create a new instance of the driver options
-        options = OPTIONS()
-        # set the driver window's to start maximized.
-        options.add_argument("start-maximized")
-        # create a new instance of the driver with the options
-        return WEB_DRIVER(options=options)
+        return init_driver(capture=self._capture)
+
+    def restart_driver(self, restore_url: str = ROOT_URL):
+        """
+        Restart the driver (i.e. recycle the browser), and restore
+        its cookies.
+
+        The cookies can be added only to the currently opened domain,
+        hence the new driver gets to `restore_url` first.
+
+        """
+        # Save the current cookies.
+        try:
+            cookies = self.driver.get_cookies()
+        except WebDriverException:
+            cookies = []
+        # Restart the driver.
+        if self._driver_manager:
+            self.driver = self._driver_manager.restart()
+        else:
+            try:
+                self.driver.quit()
+            except WebDriverException:
+                pass
+            self.driver = self._init_driver()
+        self.__config_wait()
+        # Restore the cookies.
+        self.get(restore_url)
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except WebDriverException:
+                continue
+        self.logger.info("The browser recycled ({} cookies restored)."
+                         "".format(len(cookies)), _lbr=True)
 
     def _sleep_t_sec(self, t: float = 1, _coef = .3):
         """
@@ -94,11 +170,11 @@ class ScraperAssistant():
 
     def _wait_to_load(self, t: float = 2, _coef = .7):
         """
-        Sleep for ~2 seconds to wait the page to be fully
-        loaded.
+        Sleep for ~2 seconds (times the pace) to wait the page
+        to be fully loaded.
 
         """
-        t = _coef * np.random.ranf() + t
+        t = (_coef * np.random.ranf() + t) * self.pace
         self._sleep_t_sec(t)
 
     def _scroll_to(self, scroll_to: float):
@@ -213,6 +289,27 @@ class ScraperAssistant():
         # Wait the new tab to load.
         self._wait_to_load()
 
+    def _open_in_new_tab(self, link: str):
+        """
+        Open `link` in a new background tab, without waiting for it
+        to load nor switching to it. Return the new tab's handle.
+
+        """
+        handles = set(self.driver.window_handles)
+        self.driver.execute_script("window.open(arguments[0], '_blank');", link)
+        # The new tab is the only handle that was not there before.
+        new_handles = [handle for handle in self.driver.window_handles
+                       if handle not in handles]
+        return new_handles[-1]
+
+    def _wait_until_ready(self):
+        """
+        Wait the current tab's document to be fully loaded.
+
+        """
+        self.long_wait.until(lambda driver: driver.execute_script(
+            "return document.readyState;") == "complete")
+
     def _close_and_get_back(self):
         """
         Close the current tab, and get back to the previous one.
@@ -297,12 +394,29 @@ class ScraperAssistant():
         raise ValueError("Invalid 'by' argument.")
 
     def _get_element(self, element_locator: tuple,
-                     parent_element: WEB_ELEMENT = None):
+                     parent_element: WEB_ELEMENT = None,
+                     required: bool = True,
+                     wait: float = None):
         """
         Seek for a web element in `parent_element` using the
         `element_locator` locator.
 
-        """
+        If the element is not `required`, it's only waited for `wait`
+        seconds if specified (otherwise, the page is expected to be
+        ready), and None is returned if it's missing.
+
+        """
+        # An optional element is only checked for existence (for at
+        # most `wait` seconds).
+        if not required:
+            find_elements = lambda driver: (parent_element or driver).find_elements(*element_locator)
+            if not wait:
+                elements = find_elements(self.driver)
+                return elements[0] if elements else None
+            try:
+                return WebDriverWait(self.driver, wait).until(find_elements)[0]
+            except TimeoutException:
+                return None
         # If the container web element is provided, search for the
         # targeted element in this container
         if parent_element:
@@ -313,7 +427,8 @@ class ScraperAssistant():
         return self.driver.find_element(*element_locator)
     
     def _get_element_by_class(self, class_names: str,
-                             parent_element: WEB_ELEMENT = None):
+                             parent_element: WEB_ELEMENT = None,
+                             required: bool = True):
         """
         Get the web element, by searching it by
         class names.
@@ -322,12 +437,14 @@ class ScraperAssistant():
         # Get the locator
         element_locator = self._get_class_locator(class_names)
         # Get the element.
-        element = self._get_element(element_locator, parent_element)
+        element = self._get_element(element_locator, parent_element, required)
         # Return the element
         return element
     
     def _get_element_by_id(self, id_name: str,
-                           parent_element: WEB_ELEMENT = None):
+                           parent_element: WEB_ELEMENT = None,
+                           required: bool = True,
+                           wait: float = None):
         """
         Get the web element, by searching it by id.
 
@@ -335,12 +452,13 @@ class ScraperAssistant():
         # Get the locator
         element_locator = self._get_id_locator(id_name)
         # Get the element.
-        element = self._get_element(element_locator, parent_element)
+        element = self._get_element(element_locator, parent_element, required, wait)
         # Return the element
         return element
     
     def _get_element_by_name(self, name: str,
-                             parent_element: WEB_ELEMENT = None):
+                             parent_element: WEB_ELEMENT = None,
+                             required: bool = True):
         """
         Get the web element, by searching it by
         name attribute.
@@ -349,12 +467,13 @@ class ScraperAssistant():
         # Get locator
         element_locator = self._get_name_locator(name)
         # Get the element.
-        element = self._get_element(element_locator, parent_element)
+        element = self._get_element(element_locator, parent_element, required)
         # Return the element
         return element
     
     def _get_element_by_tag_name(self, tag_name: str,
-                                 parent_element: WEB_ELEMENT = None):
+                                 parent_element: WEB_ELEMENT = None,
+                                 required: bool = True):
         """
         Get the web element, by searching it by
         the tag name.
@@ -363,24 +482,28 @@ class ScraperAssistant():
         # Get locator
         element_locator = self._get_tag_locator(tag_name)
         # Get the element.
-        element = self._get_element(element_locator, parent_element)
+        element = self._get_element(element_locator, parent_element, required)
         # Return the element
         return element
     
     def _get_element_value(self, element_locator: tuple,
-                           parent_element: WEB_DRIVER = None):
+                           parent_element: WEB_DRIVER = None,
+                           required: bool = True):
         """
         Search for an element in `parent_element`, and return it's
         value (visible text content).
 
         """
         # Get the element
-        element = self._get_element(element_locator, parent_element)
-        # Return the value
+        element = self._get_element(element_locator, parent_element, required)
+        # Return the value (empty if the optional element is missing)
+        if element is None:
+            return ""
         return element.get_attribute('innerText')
     
     def _get_element_value_by_class(self, class_names: str,
-                                    parent_element: WEB_ELEMENT = None):
+                                    parent_element: WEB_ELEMENT = None,
+                                    required: bool = True):
         """
         Search for an element by its class names in `parent_element`,
         and return it's value.
@@ -390,10 +513,11 @@ class ScraperAssistant():
         element_locator = self._get_class_locator(class_names)
         # Get the value
         return self._get_element_value(element_locator,
-                                       parent_element)
+                                       parent_element, required)
     
     def _get_element_value_by_id(self, id_name: str,
-                                 parent_element: WEB_ELEMENT = None):
+                                 parent_element: WEB_ELEMENT = None,
+                                 required: bool = True):
         """
         Get the element value , by searching the element by id.
 
@@ -401,10 +525,11 @@ class ScraperAssistant():
         # Get the locator
         element_locator = self._get_id_locator(id_name)
         # Get the value
-        return self._get_element_value(element_locator, parent_element)
+        return self._get_element_value(element_locator, parent_element, required)
     
     def _get_element_value_by_name(self, name: str,
-                                   parent_element: WEB_ELEMENT = None):
+                                   parent_element: WEB_ELEMENT = None,
+                                   required: bool = True):
         """
         Get the element value , by searching the element by
         name attribute.
@@ -413,26 +538,34 @@ class ScraperAssistant():
         # Get the locator
         element_locator = self._get_name_locator(name)
         # Get the value
-        return self._get_element_value(element_locator, parent_element)
+        return self._get_element_value(element_locator, parent_element, required)
     
     def _get_elements(self, elements_locator: tuple,
-                      parent_element: WEB_DRIVER = None):
+                      parent_element: WEB_DRIVER = None,
+                      required: bool = True):
         """
         Given a locator, get the all the elements present in
         `parent_element` web element if provided, or in the global element
         (`self.driver`) otherwise.
 
+        If the elements are not `required`, they're not waited for (the
+        page is expected to be ready), and an empty list is returned if
+        they're missing.
+
         """
         # If the container web element is provided, search for the
         # targeted element in this container
         if parent_element: return parent_element.find_elements(*elements_locator)
+        # An optional element is only checked for existence.
+        if not required: return self.driver.find_elements(*elements_locator)
         # Otherwise, search in the global one (self.driver)
         self.short_wait.until(ec.presence_of_element_located(elements_locator))
         # Get the list of elements and return them.
         return self.driver.find_elements(*elements_locator)
     
     def _get_elements_by_class(self, class_names: str,
-                               parent_element: WEB_DRIVER = None):
+                               parent_element: WEB_DRIVER = None,
+                               required: bool = True):
         """
         Given a class names, get the all the elements present in
         `parent_element` web element if provided, or in the global element
@@ -442,12 +575,13 @@ class ScraperAssistant():
         # Get the locator
         elements_locator = self._get_class_locator(class_names)
         # Get the elements
-        elements = self._get_elements(elements_locator, parent_element)
+        elements = self._get_elements(elements_locator, parent_element, required)
         # Return the element
         return elements
     
     def _get_elements_by_id(self, id_name: str,
-                            parent_element: WEB_DRIVER = None):
+                            parent_element: WEB_DRIVER = None,
+                            required: bool = True):
         """
         Given an id, get the all the elements present in
         `parent_element` web element if provided, or in the global element
@@ -457,12 +591,13 @@ class ScraperAssistant():
         # Get the locator
         elements_locator = self._get_id_locator(id_name)
         # Get the elements
-        elements = self._get_elements(elements_locator, parent_element)
+        elements = self._get_elements(elements_locator, parent_element, required)
         # Return the element
         return elements
     
     def _get_elements_by_name(self, name: str,
-                               parent_element: WEB_DRIVER = None):
+                               parent_element: WEB_DRIVER = None,
+                               required: bool = True):
         """
         Given a class names, get the all the elements present in
         `parent_element` web element if provided, or in the global element
@@ -472,10 +607,75 @@ class ScraperAssistant():
         # Get the locator
         elements_locator = self._get_name_locator(name)
         # Get the elements
-        elements = self._get_elements(elements_locator, parent_element)
+        elements = self._get_elements(elements_locator, parent_element, required)
         # Return the element
         return elements
     
+    def _find_all(self, name: str,
+                  parent_element: WEB_ELEMENT = None,
+                  required: bool = True):
+        """
+        Get all the elements of the field `name` (see :class:`SelectorRegistry`)
+        present in `parent_element` web element if provided, or in the
+        global element (`self.driver`) otherwise, using the first of the
+        field's selectors that matches.
+
+        If the elements are `required` (and no `parent_element` is
+        provided), they're waited for, otherwise an empty list is
+        returned if they're missing.
+
+        """
+        started = time.perf_counter()
+        locators = self.selectors.locators(name)
+        # Wait for any of the selectors to match.
+        if required and not parent_element:
+            try:
+                self.short_wait.until(ec.any_of(*[ec.presence_of_element_located(locator)
+                                                  for locator in locators]))
+            except TimeoutException as e:
+                self.selectors.record(name, None, time.perf_counter() - started)
+                self.logger.warn("The selector '{}' matched nothing : {}"
+                                 "".format(name, self.selectors.classes(name)))
+                raise e
+        # Get the elements using the first matching selector.
+        for index, locator in enumerate(locators):
+            elements = (parent_element or self.driver).find_elements(*locator)
+            if elements:
+                self.selectors.record(name, index, time.perf_counter() - started)
+                return elements
+        self.selectors.record(name, None, time.perf_counter() - started)
+        return []
+
+    def _find(self, name: str,
+              parent_element: WEB_ELEMENT = None,
+              required: bool = True):
+        """
+        Get the element of the field `name` (see :meth:`_find_all`).
+
+        If it's not `required`, None is returned if it's missing.
+
+        """
+        elements = self._find_all(name, parent_element, required)
+        if elements:
+            return elements[0]
+        if required:
+            raise NoSuchElementException("The selector '{}' matched nothing : {}"
+                                         "".format(name, self.selectors.classes(name)))
+        return None
+
+    def _find_value(self, name: str,
+                    parent_element: WEB_ELEMENT = None,
+                    required: bool = True):
+        """
+        Get the value (visible text content) of the element of the field
+        `name` (see :meth:`_find_all`), or "" if it's an optional missing one.
+
+        """
+        element = self._find(name, parent_element, required)
+        if element is None:
+            return ""
+        return element.get_attribute('innerText')
+
     def get(self, link):
         self.driver.get(link)
         self._wait_to_load()
\ No newline at end of file
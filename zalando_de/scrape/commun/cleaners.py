@@ -1,6 +1,8 @@
 import pandas as pd
 import re
 
+from zalando_de.storage.schema import CORE_COLUMNS, DATE_COLNAME
+
 
 class Cleaner():
 
@@ -45,6 +47,37 @@ class Cleaner():
         colors = [color.strip('\n') for color in colors]
         return self.sep.join(colors)
 
+    def _stock_to_int(self, availability_label: str):
+        # NOTE : Only the low stocks are shown ("Only x left").
+        stock = re.findall(r'\d+', availability_label or '')
+        return int(stock[0]) if stock else None
+
+    def clean_sizes_rows(self, sizes: dict):
+        """
+        Clean the sizes into rows : (size, available, stock, size price),
+        keeping each size's availability label details.
+
+        """
+        rows = []
+        for size, size_details in (sizes or {}).items():
+            size_details = size_details or {}
+            availability_label = size_details.get('count') or ''
+            price = self._max_price_to_float(re.findall(r'\b\d{1,2},\d{2}\xa0€',
+                                                        size_details.get('price') or ''))
+            rows.append((size,
+                         availability_label != 'Notify Me',
+                         self._stock_to_int(availability_label),
+                         price))
+        return rows
+
+    def clean_colors_rows(self, colors: list):
+        """
+        Clean the colors into rows : (color,).
+
+        """
+        colors = [color.strip('\n') for color in colors or [] if color]
+        return [(color,) for color in dict.fromkeys(colors)]
+
     def _clean_material_care(self, mc: dict):
         self._mc_keys.update(mc.keys())
         return mc
@@ -57,14 +90,37 @@ class Cleaner():
         self._d_keys.update(d.keys())
         return d
 
+    def columns(self, articles_details):
+        """
+        Track the dynamic columns ('Material & care', 'Size & fit', and
+        'Details' entries) of the articles' raw details (without cleaning
+        them), and return the cleaned articles' columns : the core ones,
+        then all the tracked dynamic ones (sorted), and the scrape date.
+
+        """
+        for article_details in articles_details:
+            _other_details = article_details.get('other_details') or {}
+            self._clean_material_care(_other_details.get('Material & care', {}))
+            self._clean_size_fit(_other_details.get('Size & fit', {}))
+            self._clean_details(_other_details.get('Details', {}))
+        core = [column for column in CORE_COLUMNS if column != DATE_COLNAME]
+        dynamic = (self._mc_keys | self._sf_keys | self._d_keys) - set(CORE_COLUMNS)
+        return core + sorted(dynamic) + [DATE_COLNAME]
+
     def clean(self, article_details: dict):
+        """
+        Clean an article's raw details (a dict, or an `ArticleRecord`).
+
+        """
 
-        _price_label = article_details.get('price_label')
-        _colors = article_details.get('available_colors')
-        _sizes = article_details.get('available_sizes', {})
-        _material_care = article_details.get('other_details', {}).get('Material & care', {})
-        _size_fit = article_details.get('other_details', {}).get('Size & fit', {})
-        _details = article_details.get('other_details', {}).get('Details', {})
+        # NOTE : The missing fields of the partial articles are None.
+        _price_label = article_details.get('price_label') or ''
+        _colors = article_details.get('available_colors') or []
+        _sizes = article_details.get('available_sizes') or {}
+        _other_details = article_details.get('other_details') or {}
+        _material_care = _other_details.get('Material & care', {})
+        _size_fit = _other_details.get('Size & fit', {})
+        _details = _other_details.get('Details', {})
         
         price, sold = self._clean_price(_price_label)
         sizes = self._clean_sizes(_sizes)
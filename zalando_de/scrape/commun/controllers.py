@@ -0,0 +1,108 @@
+import time
+
+from zalando_de.utils.helpers import backoff_delay
+
+
+# The number of successive timeouts opening the circuit breaker.
+FAILURES_TO_OPEN = 3
+# The number of successes before ramping up.
+INCREASE_EVERY = 5
+# The pace decrease on ramping up, and the maximum pace.
+PACE_STEP = .25
+MAX_PACE = 8.0
+# The base and maximum delays (in seconds) between the probes while
+# the circuit breaker is open.
+PROBE_DELAY = 10
+MAX_PROBE_DELAY = 120
+
+
+class AdaptiveController():
+
+    """
+    Adapt the concurrency (the number of pre-opened tabs) and the pace
+    (the factor of the pages' loading waits) to the connection's health,
+    AIMD-style : every timeout halves the concurrency and doubles the
+    pace, and every `INCREASE_EVERY` successes increase the concurrency
+    by one and decrease the pace by a step.
+
+    After `FAILURES_TO_OPEN` successive timeouts, the connection is
+    considered down, and the circuit breaker opens : each request is
+    then delayed (with an exponential backoff) to probe the connection,
+    until one succeeds. The controller gives up once the connection is
+    down for more than `max_outage` seconds.
+
+    """
+
+    def __init__(self, max_concurrency: int = 1,
+                 max_outage: float = 600) -> None:
+        self.max_concurrency = max(max_concurrency, 1)
+        self.concurrency = self.max_concurrency
+        self.pace = 1.0
+        self._max_outage = max_outage
+        self._failures = 0
+        self._successes = 0
+        self._opened_at = None
+        self._probes = 0
+        # The controller's statistics (saved to the metadata).
+        self.stats = {'timeouts': 0,
+                      'outages': 0,
+                      'outage_seconds': 0}
+
+    @property
+    def is_open(self):
+        """
+        Whether the circuit breaker is open (i.e. the connection is down).
+
+        """
+        return self._opened_at is not None
+
+    @property
+    def gave_up(self):
+        """
+        Whether the connection is down for more than `max_outage` seconds.
+
+        """
+        return (self.is_open and
+                time.time() - self._opened_at >= self._max_outage)
+
+    def success(self):
+        """
+        Record a successful request : close the circuit breaker, and ramp
+        up every `INCREASE_EVERY` successes.
+
+        """
+        self._failures = 0
+        if self.is_open:
+            self.stats['outage_seconds'] += round(time.time() - self._opened_at)
+            self._opened_at, self._probes = None, 0
+        self._successes += 1
+        if self._successes >= INCREASE_EVERY:
+            self._successes = 0
+            self.concurrency = min(self.concurrency + 1, self.max_concurrency)
+            self.pace = max(self.pace - PACE_STEP, 1.0)
+
+    def failure(self):
+        """
+        Record a timed out request : back off, and open the circuit
+        breaker after `FAILURES_TO_OPEN` successive ones.
+
+        """
+        self.stats['timeouts'] += 1
+        self._failures += 1
+        self._successes = 0
+        self.concurrency = max(self.concurrency // 2, 1)
+        self.pace = min(self.pace * 2, MAX_PACE)
+        if self._failures >= FAILURES_TO_OPEN and not self.is_open:
+            self._opened_at = time.time()
+            self.stats['outages'] += 1
+
+    def delay(self):
+        """
+        The time (in seconds) to wait before the next request : none,
+        unless the circuit breaker is open.
+
+        """
+        if not self.is_open:
+            return 0
+        self._probes += 1
+        return backoff_delay(self._probes, PROBE_DELAY, MAX_PROBE_DELAY)
@@ -0,0 +1,255 @@
+import os
+
+# Handle import error on psutil module.
+try:
+    import psutil
+    psutil_imported = True
+except ImportError:
+    psutil = None
+    psutil_imported = False
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from zalando_de.utils.logging import Logger
+
+
+WEB_DRIVER = webdriver.Chrome
+OPTIONS = webdriver.ChromeOptions
+
+# The file marking that the cookies consent is retained by the profile.
+CONSENT_MARKER = "zalando_de_consent"
+
+# The cookie set by the consent manager once its banner is answered.
+CONSENT_COOKIE = "uc_user_interaction"
+
+
+def init_driver(profile_dir: str = None, capture: bool = False):
+    """
+    Initiate the driver.
+
+    If `profile_dir` is specified, the browser uses it as a persistent
+    profile, so the disk cache and the cookies (including the consent
+    ones) are retained from a run to another.
+
+    If `capture` is True, the browser's performance log is enabled, so
+    that the network responses can be captured.
+
+    """
+    # create a new instance of the driver options
+    options = OPTIONS()
+    # set the driver window's to start maximized.
+    options.add_argument("start-maximized")
+    # use a persistent profile if specified.
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
+    # enable the network events (Chrome DevTools Protocol) logging.
+    if capture:
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    # create a new instance of the driver with the options
+    return WEB_DRIVER(options=options)
+
+
+def _proc_tree_rss(pid: int):
+    """
+    Get the resident memory (in bytes) of a process and all its
+    descendants, by reading `/proc` (used when psutil is missing).
+
+    """
+    # Map each process to its children.
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", 'r') as sf:
+                # NOTE : The process name may contain spaces, hence
+                # the fields are split after its closing parenthesis.
+                ppid = int(sf.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    # Sum the resident pages of the process tree.
+    rss, pending = 0, [pid]
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/statm", 'r') as sf:
+                rss += int(sf.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+        pending.extend(children.get(current, []))
+    return rss
+
+
+def browser_memory(driver):
+    """
+    Get the resident memory (in MB) of the browser, i.e. the driver's
+    process and all its descendants. Return None if it can't be known.
+
+    """
+    try:
+        pid = driver.service.process.pid
+    except AttributeError:
+        return None
+    if psutil_imported:
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+            rss = 0
+            for process in processes:
+                try:
+                    rss += process.memory_info().rss
+                except psutil.NoSuchProcess:
+                    continue
+            return rss / 2 ** 20
+        except psutil.NoSuchProcess:
+            return None
+    if os.path.isdir('/proc'):
+        return _proc_tree_rss(pid) / 2 ** 20
+    return None
+
+
+class RecyclePolicy():
+
+    """
+    Decide when the browser must be recycled (restarted) to bound its
+    memory growth : every `every` articles, or once its resident memory
+    exceeds `max_rss` MB.
+
+    """
+
+    def __init__(self, every: int = None, max_rss: float = None) -> None:
+        self.every = every
+        self.max_rss = max_rss
+
+    def __bool__(self):
+        return bool(self.every or self.max_rss)
+
+    def should_recycle(self, articles: int, driver):
+        """
+        Return the reason to recycle the browser after `articles` were
+        processed by it, or None if it must be kept.
+
+        """
+        if self.every and articles >= self.every:
+            return {'reason': 'articles', 'articles': articles}
+        if self.max_rss:
+            rss = browser_memory(driver)
+            if rss is not None and rss > self.max_rss:
+                return {'reason': 'memory', 'articles': articles,
+                        'rss_mb': round(rss, 1)}
+        return None
+
+
+class DriverManager():
+
+    """
+    A context manager owning the driver (browser) independently from
+    the `ScraperAssistant` context, so that the same warm browser is
+    reused across re-tries and runs.
+
+    The driver is health-checked each time it is requested, and
+    re-launched only if it is dead.
+
+    """
+
+    def __init__(self, profile_dir: str = None, logger = None,
+                 capture: bool = False) -> None:
+        self._profile_dir = profile_dir
+        self._capture = capture
+        self.logger: Logger = logger or Logger()
+        self._driver = None
+        self._consent_handled = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.quit()
+
+    @property
+    def consent_handled(self):
+        """
+        Whether the cookies consent is already retained by the browser.
+
+        """
+        if not self._profile_dir:
+            return self._consent_handled
+        return os.path.exists(os.path.join(self._profile_dir, CONSENT_MARKER))
+
+    @consent_handled.setter
+    def consent_handled(self, handled: bool):
+        if not self._profile_dir:
+            self._consent_handled = handled
+            return
+        marker_path = os.path.join(self._profile_dir, CONSENT_MARKER)
+        if handled:
+            with open(marker_path, 'w', encoding='utf-8'):
+                pass
+        elif os.path.exists(marker_path):
+            os.remove(marker_path)
+
+    def is_alive(self):
+        """
+        Verify if the driver is still usable.
+
+        """
+        if self._driver is None:
+            return False
+        try:
+            self._driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    def _reset_tabs(self):
+        """
+        Close all the tabs except the first one, as they may have
+        been left opened by a failed run.
+
+        """
+        handles = self._driver.window_handles
+        for handle in handles[1:]:
+            self._driver.switch_to.window(handle)
+            self._driver.close()
+        self._driver.switch_to.window(handles[0])
+
+    def get(self):
+        """
+        Get a healthy driver : the warm one if it is still alive, or
+        a newly launched one otherwise.
+
+        """
+        if self.is_alive():
+            self._reset_tabs()
+            self.logger.info("The warm browser reused.", _lbr=True)
+            return self._driver
+        # Tear down the dead driver, if any.
+        self.quit()
+        self._driver = init_driver(self._profile_dir, self._capture)
+        self.logger.info("A new browser launched.", _lbr=True)
+        return self._driver
+
+    def restart(self):
+        """
+        Quit the driver, and launch a new one.
+
+        """
+        self.quit()
+        return self.get()
+
+    def quit(self):
+        """
+        Tear down the driver, if any.
+
+        """
+        if self._driver is None:
+            return
+        try:
+            self._driver.quit()
+            self.logger.info("The browser closed.", _lbr=True)
+        except WebDriverException:
+            pass
+        self._driver = None
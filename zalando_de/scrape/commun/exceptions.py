@@ -74,4 +74,11 @@ class KeyboardInterruptException(ZalandoException):
     
     def __init__(self, msg, *args, **kwargs) -> None:
         super().__init__("Failed to continue processing : "
-                         + msg, *args, **kwargs)
\ No newline at end of file
+                         + msg, *args, **kwargs)
+
+
+class ProcessingStoppedException(ZalandoException):
+    
+    def __init__(self, msg, *args, **kwargs) -> None:
+        super().__init__("Processing stopped : "
+                         + msg, *args, **kwargs)
@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from zalando_de.utils.compression import (validate_compression, compressed_path,
+                                          find_path, discard_variants,
+                                          open_output, open_input)
+
+
+class ProcessedIndex():
+
+    """
+    A thread-safe index of the processed articles' IDs, that can be
+    shared by several scrapers (e.g. one per category), so that the
+    articles appearing in several of them are fetched only once.
+
+    """
+
+    def __init__(self, ids = ()) -> None:
+        self._ids = set(ids)
+        self._lock = threading.Lock()
+
+    def __contains__(self, article_id):
+        return article_id in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._ids))
+
+    def add(self, article_id):
+        with self._lock:
+            self._ids.add(article_id)
+
+    def update(self, ids):
+        with self._lock:
+            self._ids.update(ids)
+
+    def discard(self, article_id):
+        with self._lock:
+            self._ids.discard(article_id)
+
+    def claim(self, article_id):
+        """
+        Add `article_id` to the index, unless it's already there.
+
+        Return True if it was added (i.e. the caller is the only one
+        to process the article), and False otherwise.
+
+        """
+        with self._lock:
+            if article_id in self._ids:
+                return False
+            self._ids.add(article_id)
+            return True
+
+
+# The raw record's fields that are not part of its content.
+NON_CONTENT_FIELDS = ('url', 'scraped_in', 'missing_fields', 'content_hash')
+
+
+def _normalize(value):
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, dict):
+        return {str(key).strip(): _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def content_hash(article_details: dict):
+    """
+    Get a stable hash of the raw article's content : its normalized
+    fields (stripped, and with sorted keys), but the url, the scraping
+    date, and the missing fields.
+
+    """
+    content = {field: _normalize(value) for field, value in article_details.items()
+               if field not in NON_CONTENT_FIELDS}
+    return hashlib.sha1(json.dumps(content, sort_keys=True,
+                                   ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+class ContentHashes():
+
+    """
+    The content hash and last seen time of each processed article,
+    persisted to a json file next to the articles' outputs, so that
+    the revisited articles that did not change are not written again.
+
+    """
+
+    def __init__(self, path: str, compression: str = None) -> None:
+        self._path = path
+        # The compression of the persisted file (see :func:`open_output`),
+        # detected on reading.
+        self._compression = validate_compression(compression)
+        self._lock = threading.Lock()
+        self._articles = {}
+        self.load()
+
+    def __contains__(self, article_id):
+        return article_id in self._articles
+
+    def __len__(self):
+        return len(self._articles)
+
+    def load(self):
+        # NOTE : The file may be compressed differently.
+        path = find_path(self._path)
+        if path is None:
+            self._articles = {}
+            return
+        try:
+            with open_input(path) as hf:
+                self._articles = json.load(hf)
+        # NOTE : A corrupted (or truncated compressed) file is ignored.
+        except (ValueError, OSError, EOFError):
+            self._articles = {}
+
+    def save(self):
+        """
+        Persist the hashes (through a temporary file, so that a crash
+        while writing never corrupts them).
+
+        """
+        path = compressed_path(self._path, self._compression)
+        with self._lock:
+            tmp_path = f"{path}.tmp"
+            with open_output(tmp_path, self._compression) as hf:
+                json.dump(self._articles, hf, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            discard_variants(self._path, path)
+        return path
+
+    def last_seen(self, article_id: str):
+        state = self._articles.get(article_id)
+        return state['last_seen'] if state else None
+
+    def with_last_seen(self, scraped_times: dict):
+        """
+        Get the articles' last scraping times ({ID: timestamp}, e.g. read
+        from their outputs), bumped to their last seen times.
+
+        """
+        with self._lock:
+            last_seen = {article_id: state['last_seen']
+                         for article_id, state in self._articles.items()}
+        return {article_id: max(scraped_in, last_seen.get(article_id, scraped_in))
+                for article_id, scraped_in in scraped_times.items()}
+
+    def discard(self, article_id: str):
+        with self._lock:
+            self._articles.pop(article_id, None)
+
+    def seen(self, article_id: str, article_hash: str, seen_at: float = None):
+        """
+        Record that the article was seen with the content `article_hash`.
+
+        Return True if its content is unchanged (only its last seen
+        time is bumped), and False otherwise (it's new, or changed).
+
+        """
+        seen_at = seen_at or time.time()
+        with self._lock:
+            state = self._articles.get(article_id)
+            unchanged = state is not None and state['hash'] == article_hash
+            self._articles[article_id] = {'hash': article_hash,
+                                          'last_seen': seen_at}
+            return unchanged
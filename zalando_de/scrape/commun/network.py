@@ -0,0 +1,230 @@
+import base64
+import json
+
+from selenium.common.exceptions import WebDriverException
+
+from zalando_de.scrape.commun.assistants import ScraperAssistant, ROOT_URL
+
+
+# The url parts of the responses holding the catalog/product data.
+CAPTURE_PATTERNS = ['/api/catalog', '/api/graphql', '/api/pdp']
+
+
+# Decoding helpers
+
+def _format_price(price):
+    """
+    Format a price as it is displayed on the website (e.g. `39,95 €`),
+    so that it's cleaned the same way as the scraped ones.
+
+    The price may be either a label, an amount in euros, or a
+    dictionary holding one of them.
+
+    """
+    if isinstance(price, dict):
+        for key in ('formatted', 'amount', 'value'):
+            if key in price:
+                return _format_price(price[key])
+        return ""
+    if isinstance(price, (int, float)):
+        return "{:.2f}\xa0€".format(price).replace('.', ',')
+    if isinstance(price, str):
+        return price.replace(' €', '\xa0€').strip()
+    return ""
+
+
+def _price_label(item: dict):
+    """
+    Build a price label like the displayed one :
+    `39,95 € | Originally: | 79,95 € | -50%`.
+
+    """
+    price = item.get('price') or item.get('displayPrice') or {}
+    if not isinstance(price, dict):
+        return _format_price(price)
+    current = _format_price(price.get('promotional') or price.get('current')
+                            or price.get('original'))
+    original = _format_price(price.get('original'))
+    if not original or original == current:
+        return current
+    label = "{} | Originally: | {}".format(current, original)
+    # Add the discount, if provided.
+    discount = price.get('discount') or item.get('discount')
+    if isinstance(discount, dict):
+        discount = discount.get('percentage') or discount.get('value')
+    if discount:
+        label += " | -{}%".format(str(discount).strip('-%'))
+    return label
+
+
+def _sizes(item: dict):
+    """
+    Map the sizes to the scraped ones' format :
+    `{size: {'count': ..., 'price': ...}}`.
+
+    """
+    sizes = {}
+    for size in item.get('sizes') or []:
+        if isinstance(size, str):
+            sizes.update({size: {'count': '', 'price': ''}})
+            continue
+        if not isinstance(size, dict):
+            continue
+        label = size.get('size') or size.get('label') or size.get('name')
+        if not label:
+            continue
+        available = size.get('available', size.get('isAvailable', True))
+        sizes.update({label: {'count': '' if available else 'Notify Me',
+                              'price': _format_price(size.get('price', ''))}})
+    return sizes
+
+
+def _colors(item: dict):
+    """
+    Get the article's colors.
+
+    """
+    colors = item.get('colors') or item.get('color') or []
+    if isinstance(colors, str):
+        return [colors]
+    return [color.get('name', '') if isinstance(color, dict) else color
+            for color in colors]
+
+
+def _is_article(item):
+    """
+    Verify if a decoded JSON object describes an article.
+
+    """
+    return (isinstance(item, dict)
+            and ('sku' in item or 'id' in item)
+            and 'name' in item
+            and ('brand_name' in item or 'brand' in item)
+            and ('url_key' in item or 'uri' in item))
+
+
+def _iter_articles(payload):
+    """
+    Walk through a decoded JSON payload, and yield the objects
+    describing articles, wherever they are nested.
+
+    """
+    if _is_article(payload):
+        yield payload
+    elif isinstance(payload, dict):
+        for value in payload.values():
+            yield from _iter_articles(value)
+    elif isinstance(payload, list):
+        for value in payload:
+            yield from _iter_articles(value)
+
+
+def decode_articles(payload):
+    """
+    Decode a catalog/product JSON payload into articles' details,
+    in the same format as the scraped ones.
+
+    The fields that the payload lacks (always the other details, as
+    they're only on the article's page) are None, and listed in the
+    details' `missing_fields`, as for a partially scraped article.
+
+    Return a list of (link, details) tuples.
+
+    """
+    articles = []
+    for item in _iter_articles(payload):
+        brand = item.get('brand_name') or item.get('brand')
+        if isinstance(brand, dict):
+            brand = brand.get('name')
+        link = item.get('uri') or "/{}.html".format(item['url_key'])
+        # Make the relative links absolute.
+        if link.startswith('/'):
+            link = ROOT_URL + link.lstrip('/')
+        has_price = bool(item.get('price') or item.get('displayPrice'))
+        has_colors = bool(item.get('colors') or item.get('color'))
+        details = {'brand_name': brand,
+                   'article_name': item.get('name'),
+                   'price_label': _price_label(item) if has_price else None,
+                   'available_sizes': _sizes(item) if 'sizes' in item else None,
+                   'available_colors': _colors(item) if has_colors else None,
+                   'other_details': None}
+        details.update({'missing_fields': [field for field, value in details.items()
+                                           if value is None]})
+        articles.append((link, details))
+    return articles
+
+
+class NetworkCapture():
+
+    """
+    Capture the catalog and product JSON responses fetched by the
+    website's frontend, through the browser's performance log.
+
+    NOTE : The browser must be launched with the performance log
+    enabled (see :func:`zalando_de.scrape.commun.drivers.init_driver`).
+
+    """
+
+    def __init__(self, assistant,
+                 patterns: list = CAPTURE_PATTERNS) -> None:
+        self._sa: ScraperAssistant = assistant
+        self._patterns = patterns
+        # The matching responses, waiting for their loading to finish.
+        self._responses = {}
+
+    def _matches(self, response: dict):
+        return ('json' in response.get('mimeType', '')
+                and any(pattern in response.get('url', '')
+                        for pattern in self._patterns))
+
+    def _get_body(self, request_id: str):
+        """
+        Get the decoded JSON body of a response.
+
+        """
+        body = self._sa.driver.execute_cdp_cmd('Network.getResponseBody',
+                                            {'requestId': request_id})
+        content = body.get('body', '')
+        if body.get('base64Encoded'):
+            content = base64.b64decode(content).decode('utf-8')
+        return json.loads(content)
+
+    def drain(self):
+        """
+        Read the network events logged since the last call, and return
+        the (url, payload) of the matching responses.
+
+        """
+        payloads = []
+        for entry in self._sa.driver.get_log('performance'):
+            try:
+                event = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method, params = event.get('method'), event.get('params', {})
+            # Keep track of the matching responses.
+            if method == 'Network.responseReceived':
+                if self._matches(params.get('response', {})):
+                    self._responses[params['requestId']] = params['response']['url']
+            # NOTE : The body is available only when the loading is finished.
+            elif method == 'Network.loadingFinished':
+                url = self._responses.pop(params.get('requestId'), None)
+                if url is None:
+                    continue
+                try:
+                    payloads.append((url, self._get_body(params['requestId'])))
+                except (WebDriverException, ValueError) as e:
+                    self._sa.logger.debug("Captured response ( {} ) not decoded : {}"
+                                          "".format(url, type(e).__name__))
+        return payloads
+
+    def articles(self):
+        """
+        Drain the captured responses, and return the articles decoded
+        from them, as (link, details) tuples.
+
+        """
+        articles = []
+        for _, payload in self.drain():
+            articles.extend(decode_articles(payload))
+        return articles
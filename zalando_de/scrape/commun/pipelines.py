@@ -0,0 +1,71 @@
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from zalando_de.scrape.units.parsers import parse_and_clean
+
+
+class SnapshotPipeline():
+
+    """
+    A context manager to parse and clean the articles' page snapshots
+    in a pool of worker processes, while the driver keeps browsing.
+
+    At most `max_pending` snapshots are held in memory at once : when
+    it's reached, :meth:`SnapshotPipeline.submit` blocks until a worker
+    is done (backpressure).
+
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = None) -> None:
+        self._workers = workers
+        self._slots = threading.BoundedSemaphore(max_pending or 2 * workers)
+        self._done = deque()
+        self._executor = None
+
+    def __enter__(self):
+        self._executor = ProcessPoolExecutor(max_workers=self._workers)
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        # Wait for the submitted snapshots to be parsed.
+        self._executor.shutdown(wait=True)
+
+    def submit(self, article_id: str, html: str, url: str, scraped_in: str,
+               selectors: dict = None):
+        """
+        Submit an article's page snapshot to be parsed and cleaned (using
+        the `selectors` class names, or the default ones).
+
+        """
+        # Wait for a free slot (backpressure).
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(parse_and_clean, html, url, scraped_in,
+                                           selectors)
+        # If the snapshot was not submitted (e.g. a broken pool), release
+        # its slot, as no callback will.
+        except BaseException as e:
+            self._slots.release()
+            raise e
+        future.add_done_callback(lambda f: self._on_done(article_id, f))
+
+    def _on_done(self, article_id, future):
+        self._done.append((article_id, future))
+        self._slots.release()
+
+    def collect(self):
+        """
+        Get the articles parsed since the last call, as a list of
+        (article_id, details, cleaned, exception) tuples.
+
+        """
+        results = []
+        while self._done:
+            article_id, future = self._done.popleft()
+            exception = future.exception()
+            if exception is not None:
+                results.append((article_id, None, None, exception))
+            else:
+                results.append((article_id, *future.result(), None))
+        return results
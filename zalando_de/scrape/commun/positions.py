@@ -0,0 +1,137 @@
+import json
+import os
+
+
+class CrawlPosition():
+
+    """
+    The crawl position (listing url, page number, tile offset, and the
+    ID of the last handled article) persisted to a json file, so that a
+    restarted scraper can jump straight to the page it stopped at, and
+    resume after the last handled article (or after the tile offset, if
+    that article is no more listed).
+
+    NOTE : The position moves in memory, and it's only persisted (see
+    :meth:`save`) once the articles processed before it are written,
+    so that a crash never leaves a position past unsaved articles.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self.url = None
+        self.page = 1
+        self.offset = 0
+        self.last_id = None
+        # The held tiles (see :meth:`hold`), in order : {key: [url,
+        # offset, article ID, released]}.
+        self._held = {}
+        # Read the previously persisted position, if any.
+        self.load()
+
+    @property
+    def path(self):
+        return self._path
+
+    def is_resumable(self):
+        """
+        Verify if a previous position was persisted.
+
+        """
+        return self.url is not None
+
+    def as_dict(self):
+        return {'url': self.url,
+                'page': self.page,
+                'offset': self.offset,
+                'last_id': self.last_id}
+
+    def load(self):
+        """
+        Read the persisted position. Return True if found, and
+        False otherwise.
+
+        """
+        try:
+            with open(self._path, 'r', encoding='utf-8') as pf:
+                position = json.load(pf)
+        except (FileNotFoundError, ValueError):
+            return False
+        self.url = position.get('url')
+        self.page = position.get('page', 1)
+        self.offset = position.get('offset', 0)
+        self.last_id = position.get('last_id')
+        return self.is_resumable()
+
+    def save(self):
+        """
+        Persist the current position.
+
+        NOTE : The position is written into a temporary file first
+        and then moved, so that a crash while writing never leaves
+        a corrupted position file behind.
+
+        """
+        tmp_path = f"{self._path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as pf:
+            json.dump(self.as_dict(), pf, ensure_ascii=False)
+        os.replace(tmp_path, self._path)
+        return self._path
+
+    def clear(self):
+        """
+        Forget the persisted position (i.e. the crawl is finished).
+
+        """
+        self.url, self.page, self.offset, self.last_id = None, 1, 0, None
+        self._held = {}
+        try:
+            os.remove(self._path)
+        except FileNotFoundError:
+            pass
+
+    def move_to(self, url: str, page: int):
+        """
+        Move to a new listing page, and reset the tile offset.
+
+        """
+        self.url, self.page, self.offset, self.last_id = url, page, 0, None
+
+    def advance(self, offset: int, article_id: str = None):
+        """
+        Move the tile offset within the current listing page, after the
+        article `article_id` (once the previously held tiles are released).
+
+        """
+        if self._held:
+            self._held[object()] = [self.url, offset, article_id, True]
+        else:
+            self.offset, self.last_id = offset, article_id
+
+    def hold(self, key, offset: int):
+        """
+        Hold the tile of the article `key` (ending at `offset`) of the
+        current listing page, whose processing is not done yet (e.g. its
+        snapshot is being parsed) : the offset doesn't move past it until
+        it's released (see :meth:`release`).
+
+        """
+        self._held[key] = [self.url, offset, key, False]
+
+    def release(self, key):
+        """
+        Release a held tile, and move the tile offset after the released
+        tiles that are no more preceded by a held one.
+
+        NOTE : The tiles of a previous listing page don't move the offset.
+
+        """
+        if key not in self._held:
+            return
+        self._held[key][3] = True
+        for key, (url, offset, article_id, released) in list(self._held.items()):
+            if not released:
+                break
+            del self._held[key]
+            if url == self.url:
+                self.offset, self.last_id = offset, article_id
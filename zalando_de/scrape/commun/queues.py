@@ -0,0 +1,77 @@
+import heapq
+import itertools
+import time
+
+from zalando_de.utils.helpers import backoff_delay
+
+
+# The base and maximum delays (in seconds) before re-trying an article.
+RETRY_DELAY = 10
+MAX_RETRY_DELAY = 120
+
+
+class RetryQueue():
+
+    """
+    A queue of the articles to re-try later in the same run, each one
+    becoming due after an exponential backoff, and given up after
+    `max_attempts` re-tries.
+
+    """
+
+    def __init__(self, max_attempts: int = 2,
+                 delay: float = RETRY_DELAY,
+                 max_delay: float = MAX_RETRY_DELAY) -> None:
+        self.max_attempts = max_attempts
+        self._delay = delay
+        self._max_delay = max_delay
+        # A heap of (due time, insertion order, article ID, link).
+        self._heap = []
+        self._counter = itertools.count()
+        # The number of re-tries per article.
+        self._attempts = {}
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return bool(self._heap)
+
+    def attempts(self, article_id: str):
+        return self._attempts.get(article_id, 0)
+
+    def push(self, article_id: str, link: str):
+        """
+        Schedule a re-try of the article.
+
+        Return the attempt number, or 0 if the article exhausted its
+        re-tries.
+
+        """
+        attempt = self.attempts(article_id) + 1
+        if attempt > self.max_attempts:
+            return 0
+        self._attempts[article_id] = attempt
+        due = time.time() + backoff_delay(attempt, self._delay, self._max_delay)
+        heapq.heappush(self._heap, (due, next(self._counter), article_id, link))
+        return attempt
+
+    def wait_time(self):
+        """
+        The time (in seconds) before the next re-try is due.
+
+        """
+        if not self._heap:
+            return 0
+        return max(self._heap[0][0] - time.time(), 0)
+
+    def pop_due(self):
+        """
+        Get the (article_id, link) of the next due re-try, or None if
+        no re-try is due yet.
+
+        """
+        if not self._heap or self._heap[0][0] > time.time():
+            return None
+        _, _, article_id, link = heapq.heappop(self._heap)
+        return article_id, link
@@ -0,0 +1,122 @@
+import sys
+
+
+def _intern(value):
+    # NOTE : Only the strings are interned (the missing values are None).
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class ArticleRecord():
+
+    """
+    A compact record of a processed article's raw details, holding them
+    in slots (instead of a dict per article, and a dict per size and per
+    details' section), with the repeated strings (the brands, colors,
+    sizes' labels, availabilities, and details' keys) interned, so that
+    they're shared by all the records.
+
+    The record reads like the raw details' dict (see :meth:`get`), and
+    converts back to it (see :meth:`to_details`) for the JSON outputs.
+
+    """
+
+    __slots__ = ('url', 'brand_name', 'article_name', 'price_label',
+                 'available_colors', 'available_sizes', 'other_details',
+                 'scraped_in', 'missing_fields', 'extra')
+
+    # The raw details' fields, in their order.
+    FIELDS = ('brand_name', 'article_name', 'price_label', 'available_colors',
+              'available_sizes', 'other_details', 'url', 'scraped_in',
+              'missing_fields')
+
+    def __init__(self, url: str = None, brand_name: str = None,
+                 article_name: str = None, price_label: str = None,
+                 available_colors: tuple = None, available_sizes: tuple = None,
+                 other_details: tuple = None, scraped_in: str = None,
+                 missing_fields: tuple = None, extra: dict = None) -> None:
+        self.url = url
+        self.brand_name = brand_name
+        self.article_name = article_name
+        self.price_label = price_label
+        # The colors : (color, ...).
+        self.available_colors = available_colors
+        # The sizes : ((size, availability, price), ...).
+        self.available_sizes = available_sizes
+        # The details : ((section, ((key, value), ...)), ...).
+        self.other_details = other_details
+        self.scraped_in = scraped_in
+        self.missing_fields = missing_fields
+        # The other fields, if any (e.g. added by a newer extraction).
+        self.extra = extra
+
+    @classmethod
+    def from_details(cls, details: dict):
+        """
+        Build a record from the raw details' dict.
+
+        NOTE : The missing fields (None) are kept as such.
+
+        """
+        colors = details.get('available_colors')
+        sizes = details.get('available_sizes')
+        other_details = details.get('other_details')
+        missing_fields = details.get('missing_fields')
+        extra = {field: value for field, value in details.items()
+                 if field not in cls.FIELDS}
+        return cls(url=details.get('url'),
+                   brand_name=_intern(details.get('brand_name')),
+                   article_name=details.get('article_name'),
+                   price_label=_intern(details.get('price_label')),
+                   available_colors=(None if colors is None
+                                     else tuple(_intern(color) for color in colors)),
+                   available_sizes=(None if sizes is None
+                                    else tuple((_intern(size),
+                                                _intern((size_details or {}).get('count')),
+                                                _intern((size_details or {}).get('price')))
+                                               for size, size_details in sizes.items())),
+                   other_details=(None if other_details is None
+                                  else tuple((_intern(section),
+                                              tuple((_intern(key), value)
+                                                    for key, value in (entries or {}).items()))
+                                             for section, entries in other_details.items())),
+                   scraped_in=_intern(details.get('scraped_in')),
+                   missing_fields=(None if missing_fields is None
+                                   else tuple(_intern(field) for field in missing_fields)),
+                   extra=extra or None)
+
+    def get(self, field: str, default=None):
+        """
+        Get a field as in the raw details' dict.
+
+        """
+        if field == 'available_colors':
+            value = None if self.available_colors is None else list(self.available_colors)
+        elif field == 'available_sizes':
+            value = (None if self.available_sizes is None
+                     else {size: {'count': count, 'price': price}
+                           for size, count, price in self.available_sizes})
+        elif field == 'other_details':
+            value = (None if self.other_details is None
+                     else {section: dict(entries) for section, entries in self.other_details})
+        elif field == 'missing_fields':
+            value = None if self.missing_fields is None else list(self.missing_fields)
+        elif field in self.FIELDS:
+            value = getattr(self, field)
+        else:
+            value = (self.extra or {}).get(field)
+        return default if value is None else value
+
+    def __getitem__(self, field: str):
+        if field not in self.FIELDS and field not in (self.extra or {}):
+            raise KeyError(field)
+        return self.get(field)
+
+    def to_details(self):
+        """
+        Convert the record back to the raw details' dict.
+
+        """
+        details = {field: self.get(field) for field in self.FIELDS
+                   if field != 'missing_fields' or self.missing_fields is not None}
+        details.update(self.extra or {})
+        return details
@@ -0,0 +1,146 @@
+import hashlib
+import heapq
+import json
+import os
+import time
+
+from zalando_de.utils.compression import (validate_compression, compressed_path,
+                                          find_path, discard_variants,
+                                          open_output, open_input)
+
+
+# The weight of the last visit in the change score.
+SCORE_WEIGHT = 0.5
+# The change score of the never revisited articles.
+INITIAL_SCORE = 0.5
+# The minimum change score, so that the articles that never changed
+# are still revisited once they are old enough.
+MIN_SCORE = 0.05
+
+
+def fingerprint(article_details: dict):
+    """
+    Get a fingerprint of the article's details that change over time :
+    the price label, the sizes and their availability, and the colors.
+
+    """
+    volatile = [article_details.get('price_label'),
+                article_details.get('available_sizes'),
+                article_details.get('available_colors')]
+    return hashlib.sha1(json.dumps(volatile, sort_keys=True,
+                                   ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+class RecrawlScheduler():
+
+    """
+    Keep, for each article, its url, last scraping time, and a change
+    score (the exponentially weighted rate of visits that found it
+    changed), persisted to a json file.
+
+    The articles are revisited in the order of their priority : the
+    change score times the time elapsed since their last scraping, so
+    the ones most likely to have changed come first.
+
+    """
+
+    def __init__(self, path: str, compression: str = None) -> None:
+        self._path = path
+        # The compression of the persisted file (see :func:`open_output`),
+        # detected on reading.
+        self._compression = validate_compression(compression)
+        self._articles = {}
+        # Read the previously persisted schedule, if any.
+        self.load()
+
+    def __contains__(self, article_id):
+        return article_id in self._articles
+
+    def __len__(self):
+        return len(self._articles)
+
+    def load(self):
+        # NOTE : The file may be compressed differently.
+        path = find_path(self._path)
+        if path is None:
+            self._articles = {}
+            return
+        try:
+            with open_input(path) as sf:
+                self._articles = json.load(sf)
+        # NOTE : A corrupted (or truncated compressed) file is ignored.
+        except (ValueError, OSError, EOFError):
+            self._articles = {}
+
+    def save(self):
+        """
+        Persist the schedule (through a temporary file, so that a crash
+        while writing never corrupts it).
+
+        """
+        path = compressed_path(self._path, self._compression)
+        tmp_path = f"{path}.tmp"
+        with open_output(tmp_path, self._compression) as sf:
+            json.dump(self._articles, sf, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        discard_variants(self._path, path)
+        return path
+
+    def track(self, article_id: str, url: str, scraped_at: float):
+        """
+        Track an article scraped before the schedule existed.
+
+        """
+        if article_id in self._articles:
+            return
+        self._articles[article_id] = {'url': url,
+                                      'scraped_at': scraped_at,
+                                      'score': INITIAL_SCORE,
+                                      'fingerprint': None}
+
+    def record(self, article_id: str, url: str, article_details: dict,
+               scraped_at: float = None):
+        """
+        Record a (re-)scraping of an article, and update its change
+        score. Return True if the article changed since its last
+        scraping, and False otherwise (or if it's unknown).
+
+        """
+        scraped_at = scraped_at or time.time()
+        new_fingerprint = fingerprint(article_details)
+        state = self._articles.get(article_id)
+        changed = bool(state
+                       and state['fingerprint'] is not None
+                       and state['fingerprint'] != new_fingerprint)
+        score = (INITIAL_SCORE if not state or state['fingerprint'] is None
+                 else (1 - SCORE_WEIGHT) * state['score'] + SCORE_WEIGHT * changed)
+        self._articles[article_id] = {'url': url,
+                                      'scraped_at': scraped_at,
+                                      'score': score,
+                                      'fingerprint': new_fingerprint}
+        return changed
+
+    def priority(self, article_id: str, now: float = None):
+        """
+        The expected changes of an article since its last scraping.
+
+        """
+        state = self._articles[article_id]
+        age = max((now or time.time()) - state['scraped_at'], 0)
+        return max(state['score'], MIN_SCORE) * age
+
+    def due(self, limit: int = None):
+        """
+        Get the (article_id, url) of the articles to revisit, the most
+        likely to have changed first (up to `limit` articles).
+
+        """
+        now = time.time()
+        article_ids = (heapq.nlargest(limit, self._articles,
+                                      key=lambda _id: self.priority(_id, now))
+                       if limit
+                       else sorted(self._articles,
+                                   key=lambda _id: self.priority(_id, now),
+                                   reverse=True))
+        return [(article_id, self._articles[article_id]['url'])
+                for article_id in article_ids]
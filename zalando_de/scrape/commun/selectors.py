@@ -0,0 +1,178 @@
+import json
+import os
+import threading
+
+from selenium.webdriver.common.by import By
+
+
+# The default selectors : for each field, the class names of its element,
+# in the order they're tried (the first one is the current class names,
+# the next ones are fallbacks).
+DEFAULT_SELECTORS = {
+    # The listing pages.
+    'total_items': ['_0Qm8W1 _7Cm1F9 FxZV-M weHhRC u-6V88 FxZV-M'],
+    'total_pages': ['_0Qm8W1 _7Cm1F9 FxZV-M pVrzNP JCuRr_ _0xLoFW uEg2FS FCIprz'],
+    'next_page': ['DJxzzA OldB32'],
+    'article_tile': ['DT5BTM w8MdNG cYylcv _1FGXgy _75qWlu iOzucJ JT3_zV vut4p9'],
+    'article_link': ['_LM JT3_zV CKDt_l CKDt_l LyRfpJ'],
+    # The articles' pages.
+    'container': ['DT5BTM VHXqc_ rceRmQ _4NtqZU mIlIve'],
+    'brand_name': ['SZKKsK mt1kvu FxZV-M pVrzNP _5Yd-hZ'],
+    'article_name': ['EKabf7 R_QwOV'],
+    'price': ['_0xLoFW _78xIQ-'],
+    'colors': ['pl0w2g DT5BTM A-NCMf'],
+    'displayed_color': ['_0Qm8W1 u-6V88 dgII7d pVrzNP zN9KaA'],
+    'sizes': ['fOd40J _0xLoFW JT3_zV FCIprz LyRfpJ'],
+    'size_availability': ['nXkCf3'],
+    'size_price': ['_0Qm8W1 u-6V88 FxZV-M pVrzNP ra-RRD'],
+    'size_label': ['_0Qm8W1 _7Cm1F9 dgII7d pVrzNP'],
+    'size_label_unavailable': ['_0Qm8W1 _7Cm1F9 dgII7d D--idb'],
+    # The size label shown (instead of the picker) by the single size articles.
+    'single_size': ['_0Qm8W1 _7Cm1F9 dgII7d pVrzNP _65i7kZ'],
+    'details_items': ['y4Yt_f NN8L-8 JT3_zV MxUWj-'],
+    'details_name': ['JCuRr_'],
+    'details_key': ['_0Qm8W1 u-6V88 dgII7d pVrzNP zN9KaA'],
+    'details_value': ['_0Qm8W1 u-6V88 FxZV-M pVrzNP zN9KaA'],
+}
+
+
+def class_locator(class_names: str):
+    """
+    Given a set of class names, return a locator by css selector.
+
+    """
+    return (By.CSS_SELECTOR, "." + ".".join(class_names.split()))
+
+
+def load_selectors(path: str):
+    """
+    Read a selectors config : a json object mapping the fields to their
+    class names (a string, or a list of fallbacks), e.g.
+
+    ```json
+    {"brand_name": ["SZKKsK mt1kvu FxZV-M pVrzNP _5Yd-hZ", "Xq0Ulx B5Ddr9"],
+     "price": "_0xLoFW _78xIQ-"}
+    ```
+
+    The fields that are not in the config keep their default selectors.
+
+    """
+    with open(path, 'r', encoding='utf-8') as sf:
+        config = json.load(sf)
+    if not isinstance(config, dict):
+        raise ValueError("The selectors config must be a json object.")
+    selectors = {name: list(classes) for name, classes in DEFAULT_SELECTORS.items()}
+    for name, classes in config.items():
+        if name not in DEFAULT_SELECTORS:
+            raise ValueError("Unknown selector : {}".format(name))
+        classes = [classes] if isinstance(classes, str) else list(classes)
+        if not classes or not all(isinstance(c, str) and c.strip() for c in classes):
+            raise ValueError("Invalid class names for the selector {} : {}"
+                             "".format(name, classes))
+        selectors[name] = classes
+    return selectors
+
+
+class SelectorRegistry():
+
+    """
+    The registry of the fields' selectors : the default ones, overridden
+    by an optional json config (see :func:`load_selectors`), which is
+    reloaded as soon as it's modified (see :meth:`reload`).
+
+    The locators are compiled once per (re)load, and each lookup is
+    recorded, so that the selectors that stopped matching are spotted.
+
+    """
+
+    def __init__(self, path: str = None, logger = None) -> None:
+        self._path = path
+        self.logger = logger
+        self._mtime = None
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._compile({name: list(classes) for name, classes in DEFAULT_SELECTORS.items()})
+        self.reload()
+
+    def _compile(self, selectors: dict):
+        self._selectors = selectors
+        self._locators = {name: [class_locator(c) for c in classes]
+                          for name, classes in selectors.items()}
+
+    def reload(self):
+        """
+        (Re)load the config if it was modified since the last load.
+
+        Return True if the selectors changed. An invalid config is
+        ignored (the current selectors are kept).
+
+        """
+        if not self._path:
+            return False
+        try:
+            mtime = os.stat(self._path).st_mtime
+        except FileNotFoundError:
+            return False
+        if mtime == self._mtime:
+            return False
+        self._mtime = mtime
+        try:
+            selectors = load_selectors(self._path)
+        except ValueError as e:
+            if self.logger:
+                self.logger.error("Invalid selectors config {} (ignored) : {}"
+                                  "".format(self._path, e))
+            return False
+        with self._lock:
+            self._compile(selectors)
+        if self.logger:
+            self.logger.info("Selectors loaded from {}".format(self._path))
+        return True
+
+    def classes(self, name: str):
+        """
+        Get the class names of a field's selector, and its fallbacks.
+
+        """
+        return self._selectors[name]
+
+    def locators(self, name: str):
+        """
+        Get the (precompiled) locators of a field's selector, and its
+        fallbacks.
+
+        """
+        return self._locators[name]
+
+    def as_dict(self):
+        return {name: list(classes) for name, classes in self._selectors.items()}
+
+    def record(self, name: str, index: int, seconds: float):
+        """
+        Record a lookup of a field : the index of the matching selector
+        (None if none matched), and the time it took.
+
+        """
+        with self._lock:
+            stats = self._stats.setdefault(name, {'hits': 0, 'misses': 0,
+                                                  'fallbacks': 0, 'seconds': 0})
+            if index is None:
+                stats['misses'] += 1
+            else:
+                stats['hits'] += 1
+                stats['fallbacks'] += index > 0
+            stats['seconds'] += seconds
+
+    def stats(self):
+        """
+        Get the lookups' statistics of each field : the hits, the misses,
+        the hits by a fallback, and the average lookup time (in ms).
+
+        """
+        with self._lock:
+            return {name: {'hits': stats['hits'],
+                           'misses': stats['misses'],
+                           'fallbacks': stats['fallbacks'],
+                           'avg_ms': round(1000 * stats['seconds'] /
+                                           (stats['hits'] + stats['misses']), 1)}
+                    for name, stats in self._stats.items()}
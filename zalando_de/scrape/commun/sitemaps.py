@@ -0,0 +1,116 @@
+import gzip
+import io
+import re
+import urllib.request
+from datetime import datetime, timedelta, timezone
+from xml.etree.ElementTree import iterparse
+
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+# The W3C datetime (https://www.w3.org/TR/NOTE-datetime) : a year, month,
+# or date, and optionally a time (with optional seconds, and a fraction
+# of any number of digits) and a time zone.
+W3C_DATETIME = re.compile(r"(\d{4})(?:-(\d{2})(?:-(\d{2})"
+                          r"(?:T(\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d+))?)?"
+                          r"(Z|[+-]\d{2}:?\d{2})?)?)?)?")
+
+USER_AGENT = ("Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/110.0 Safari/537.36")
+
+
+def _local_name(tag: str):
+    """
+    Remove the namespace from a tag (e.g. `{http://...}loc` -> `loc`).
+
+    """
+    return tag.rsplit('}', 1)[-1]
+
+
+def _open(source: str):
+    """
+    Open a sitemap (an url or a local path) as a binary stream, and
+    decompress it on the fly if it's gzipped.
+
+    """
+    if source.startswith(('http://', 'https://')):
+        request = urllib.request.Request(source, headers={'User-Agent': USER_AGENT})
+        stream = urllib.request.urlopen(request, timeout=60)
+    else:
+        stream = open(source, 'rb')
+    # Detect the compression using the magic number, regardless of
+    # the name or the declared content type.
+    stream = io.BufferedReader(stream)
+    if stream.peek(2)[:2] == GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=stream)
+    return stream
+
+
+def parse_lastmod(lastmod: str):
+    """
+    Convert a sitemap `lastmod` date (W3C datetime) into a timestamp.
+    Return None if it's missing or invalid.
+
+    """
+    if not lastmod:
+        return None
+    # NOTE : The date is parsed explicitly, as `fromisoformat` handles
+    # neither the `Z` suffix nor the fractions of other than 3 or 6
+    # digits before Python 3.11.
+    match = W3C_DATETIME.fullmatch(lastmod.strip())
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, zone = match.groups()
+    try:
+        # The dates without a time zone are considered in UTC.
+        if zone is None or zone == 'Z':
+            tz = timezone.utc
+        else:
+            sign = -1 if zone[0] == '-' else 1
+            zone = zone[1:].replace(':', '')
+            tz = timezone(sign * timedelta(hours=int(zone[:2]), minutes=int(zone[2:])))
+        return datetime(int(year), int(month or 1), int(day or 1),
+                        int(hour or 0), int(minute or 0), int(second or 0),
+                        # The fraction in microseconds.
+                        int((fraction or '0')[:6].ljust(6, '0')),
+                        tzinfo=tz).timestamp()
+    except ValueError:
+        return None
+
+
+def iter_sitemap(source: str):
+    """
+    Stream the urls of a sitemap (an url or a local path, gzipped or
+    not), following the nested sitemaps of the sitemap indexes.
+
+    Yield (url, lastmod) tuples, where lastmod is a timestamp or None.
+
+    NOTE : The parsed elements are cleared as soon as they are yielded,
+    so the memory does not grow with the sitemap's size.
+
+    """
+    with _open(source) as stream:
+        root = None
+        for event, element in iterparse(stream, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = element
+                continue
+            tag = _local_name(element.tag)
+            if tag not in ('url', 'sitemap'):
+                continue
+            loc, lastmod = None, None
+            for child in element:
+                child_tag = _local_name(child.tag)
+                if child_tag == 'loc':
+                    loc = (child.text or '').strip()
+                elif child_tag == 'lastmod':
+                    lastmod = parse_lastmod(child.text)
+            # Free the processed elements.
+            root.clear()
+            if not loc:
+                continue
+            if tag == 'sitemap':
+                yield from iter_sitemap(loc)
+            else:
+                yield loc, lastmod
@@ -0,0 +1,126 @@
+from collections import deque
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from zalando_de.scrape.commun.assistants import ScraperAssistant
+from zalando_de.scrape.commun.exceptions import (ArticleProcessingException,
+                                                 UnableToOpenNewTabException,
+                                                 UnableToCloseNewTabException)
+
+
+class TabPool():
+
+    """
+    A context manager to manage a pool of up to `size` pre-opened tabs,
+    in which the next articles are already loading while the current
+    one is being extracted.
+
+    The articles must be consumed (using :meth:`TabPool.tab`) in the
+    order they were submitted.
+
+    """
+
+    def __init__(self, assistant, size: int = 2) -> None:
+        self._sa: ScraperAssistant = assistant
+        self.size = size
+        self._home = None
+        self._pending = deque()
+        self._tabs = deque()
+
+    def __enter__(self):
+        # The tab to get back to after each article (the listing page).
+        self._home = self._sa.driver.current_window_handle
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        # Close all the prefetched tabs that were not consumed.
+        self._pending.clear()
+        while self._tabs:
+            _, handle = self._tabs.popleft()
+            try:
+                self._close(handle)
+            except WebDriverException:
+                break
+
+    def submit(self, links: list):
+        """
+        Queue the articles' links, and start loading the first ones.
+
+        """
+        self._pending.extend(links)
+        self._fill()
+
+    def _fill(self):
+        """
+        Open new tabs for the pending links, until the pool is full.
+
+        """
+        while len(self._tabs) < max(self.size, 1) and self._pending:
+            link = self._pending.popleft()
+            self._tabs.append((link, self._sa._open_in_new_tab(link)))
+
+    def _close(self, handle):
+        """
+        Close a tab, and get back to the listing page.
+
+        """
+        self._sa.driver.switch_to.window(handle)
+        self._sa.driver.close()
+        self._sa.driver.switch_to.window(self._home)
+
+    def _take(self, link: str):
+        """
+        Take the prefetched tab of `link`. If it's not (or no more)
+        in the pool, open it now.
+
+        """
+        # Drop the tabs of the articles that were not consumed.
+        while self._tabs and self._tabs[0][0] != link:
+            _, handle = self._tabs.popleft()
+            self._close(handle)
+        if self._tabs:
+            return self._tabs.popleft()[1]
+        # The link may still be pending.
+        if link in self._pending:
+            self._pending.remove(link)
+        return self._sa._open_in_new_tab(link)
+
+    @contextmanager
+    def tab(self, link: str):
+        """
+        Switch to the (already loading) tab of `link`, and close it when
+        exiting the `with` statement, while the next articles start
+        loading.
+
+        If the tab takes too much time to be loaded, the article is
+        skipped (as when it's processed without prefetching), i.e. an
+        `ArticleProcessingException` of the `TimeoutException` is raised.
+
+        """
+        # Only opening and switching to the tab are the tabs' failures.
+        try:
+            handle = self._take(link)
+            self._sa.driver.switch_to.window(handle)
+        except WebDriverException as e:
+            raise UnableToOpenNewTabException("An unexpected Web Driver "
+                                              "Exception raised.", e,
+                                              self._sa.logger)
+        try:
+            # Wait for the tab to be loaded (if not yet).
+            try:
+                self._sa._wait_until_ready()
+            except TimeoutException as e:
+                raise ArticleProcessingException("Skipped (Time out).",
+                                                 e, self._sa.logger).dbg()
+            self._sa.logger.debug("Prefetched article's Tab opened.", _lbr=True)
+            yield
+        finally:
+            try:
+                self._close(handle)
+                self._fill()
+                self._sa.logger.debug("Tab closed.")
+            except WebDriverException as e:
+                raise UnableToCloseNewTabException("An unexpected Web Driver "
+                                                   "Exception raised.", e,
+                                                   self._sa.logger)
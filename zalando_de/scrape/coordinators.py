@@ -0,0 +1,508 @@
+import argparse
+import json
+import os
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from zalando_de.scrape.main import (Scraper, MAIN_LINK, OUTPUT_FILENAME,
+                                    read_processed_ids, articles_path)
+from zalando_de.scrape.categories import CategoryCrawler
+from zalando_de.scrape.commun.assistants import ScraperAssistant
+from zalando_de.scrape.commun.exceptions import (ProcessingStoppedException,
+                                                 UnableToConnectException)
+
+
+# The default lease time to live (in seconds) : a worker that sent no
+# heartbeat for that long is considered dead.
+LEASE_TTL = 120
+# The maximum number of leases of a shard before giving it up.
+MAX_ATTEMPTS = 3
+
+
+def page_shards(first_page: int, last_page: int, shard_size: int = 10,
+                url: str = MAIN_LINK, output: str = OUTPUT_FILENAME):
+    """
+    Split the listing pages of a category into ranges of `shard_size`
+    pages.
+
+    """
+    return [{'url': url, 'output': output, 'how': 'pages',
+             'links': [start, min(start + shard_size - 1, last_page)]}
+            for start in range(first_page, last_page + 1, shard_size)]
+
+
+def article_shards(links: list, shard_size: int = 100,
+                   url: str = MAIN_LINK, output: str = OUTPUT_FILENAME):
+    """
+    Split the articles' links into batches of `shard_size` articles.
+
+    """
+    return [{'url': url, 'output': output, 'how': 'single',
+             'links': links[start:start + shard_size]}
+            for start in range(0, len(links), shard_size)]
+
+
+class LeaseTable():
+
+    """
+    The shards of a crawl, each leased to a single worker at a time.
+
+    A lease expires unless it's renewed by a heartbeat within `ttl`
+    seconds, and the shard is then leased again to another worker (up
+    to `max_attempts` leases, after which it's given up).
+
+    """
+
+    def __init__(self, shards: list, ttl: float = LEASE_TTL,
+                 max_attempts: int = MAX_ATTEMPTS) -> None:
+        self.ttl = ttl
+        self._max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._shards = {}
+        for index, shard in enumerate(shards):
+            shard_id = str(index)
+            self._shards[shard_id] = dict(shard, id=shard_id, state='pending',
+                                          worker=None, expires=None,
+                                          attempts=0, report=None, error=None)
+
+    def _expire(self):
+        """
+        Take back the shards whose lease expired.
+
+        """
+        now = time.time()
+        for shard in self._shards.values():
+            if shard['state'] == 'leased' and shard['expires'] < now:
+                self._give_back(shard, "The lease expired.")
+
+    def _give_back(self, shard: dict, error: str):
+        shard.update({'state': ('failed'
+                                if shard['attempts'] >= self._max_attempts
+                                else 'pending'),
+                      'worker': None, 'expires': None, 'error': error})
+
+    def _leased(self, worker: str, shard_id: str):
+        shard = self._shards.get(shard_id)
+        if shard and shard['state'] == 'leased' and shard['worker'] == worker:
+            return shard
+        return None
+
+    def acquire(self, worker: str):
+        """
+        Lease the next pending shard to `worker`. Return the shard, or
+        None if there is no pending shard.
+
+        """
+        with self._lock:
+            self._expire()
+            for shard in self._shards.values():
+                if shard['state'] == 'pending':
+                    shard.update({'state': 'leased', 'worker': worker,
+                                  'expires': time.time() + self.ttl,
+                                  'attempts': shard['attempts'] + 1})
+                    return {key: shard[key]
+                            for key in ('id', 'url', 'output', 'how', 'links')}
+            return None
+
+    def heartbeat(self, worker: str, shard_id: str):
+        """
+        Renew the lease of a shard. Return False if the shard is no more
+        leased to `worker`.
+
+        """
+        with self._lock:
+            self._expire()
+            shard = self._leased(worker, shard_id)
+            if shard is None:
+                return False
+            shard['expires'] = time.time() + self.ttl
+            return True
+
+    def complete(self, worker: str, shard_id: str, report: dict = None):
+        """
+        Record the completion of a shard.
+
+        NOTE : The completion is accepted even if the lease expired
+        meanwhile, as the shard's work is done anyway.
+
+        """
+        with self._lock:
+            shard = self._shards.get(shard_id)
+            if shard is None or shard['state'] == 'done':
+                return False
+            shard.update({'state': 'done', 'worker': worker,
+                          'expires': None, 'report': report or {}})
+            return True
+
+    def release(self, worker: str, shard_id: str, error: str = None):
+        """
+        Give back a shard that `worker` failed to process.
+
+        """
+        with self._lock:
+            shard = self._leased(worker, shard_id)
+            if shard is None:
+                return False
+            self._give_back(shard, error)
+            return True
+
+    def status(self):
+        """
+        Get the number of shards per state, whether the crawl is finished,
+        and the completion reports.
+
+        """
+        with self._lock:
+            self._expire()
+            states = {state: 0 for state in ('pending', 'leased', 'done', 'failed')}
+            for shard in self._shards.values():
+                states[shard['state']] += 1
+            return {'shards': states,
+                    'finished': not states['pending'] and not states['leased'],
+                    'reports': {shard_id: shard['report']
+                                for shard_id, shard in self._shards.items()
+                                if shard['report'] is not None},
+                    'errors': {shard_id: shard['error']
+                               for shard_id, shard in self._shards.items()
+                               if shard['error'] is not None}}
+
+
+class _CoordinatorHandler(BaseHTTPRequestHandler):
+
+    """
+    The coordinator's JSON API :
+
+    - `POST /lease` `{"worker"}` : lease the next shard (`{"shard": null}`
+    if there is none).
+    - `POST /heartbeat` `{"worker", "shard"}` : renew a lease.
+    - `POST /complete` `{"worker", "shard", "report"}` : report a shard done.
+    - `POST /release` `{"worker", "shard", "error"}` : give back a shard.
+    - `GET /status` : the crawl's status.
+
+    """
+
+    def _reply(self, payload: dict, status: int = 200):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != '/status':
+            return self._reply({'error': "Not found."}, 404)
+        self._reply(self.server.table.status())
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            worker, shard_id = request['worker'], request.get('shard')
+        except (ValueError, KeyError):
+            return self._reply({'error': "Invalid request."}, 400)
+        table: LeaseTable = self.server.table
+        if self.path == '/lease':
+            return self._reply({'shard': table.acquire(worker), 'ttl': table.ttl})
+        if self.path == '/heartbeat':
+            return self._reply({'ok': table.heartbeat(worker, shard_id)})
+        if self.path == '/complete':
+            return self._reply({'ok': table.complete(worker, shard_id,
+                                                     request.get('report'))})
+        if self.path == '/release':
+            return self._reply({'ok': table.release(worker, shard_id,
+                                                    request.get('error'))})
+        self._reply({'error': "Not found."}, 404)
+
+    def log_message(self, format, *args):
+        if self.server.logger:
+            self.server.logger.debug("Coordinator : " + format % args)
+
+
+class Coordinator():
+
+    """
+    A context manager serving a :class:`LeaseTable` over HTTP (in a
+    background thread), to spread a crawl over several workers.
+
+    Use the port 0 to pick a free port (see :attr:`url`).
+
+    """
+
+    def __init__(self, shards: list, host: str = '127.0.0.1', port: int = 0,
+                 ttl: float = LEASE_TTL, max_attempts: int = MAX_ATTEMPTS,
+                 logger = None) -> None:
+        self.table = LeaseTable(shards, ttl, max_attempts)
+        self._server = ThreadingHTTPServer((host, port), _CoordinatorHandler)
+        self._server.table = self.table
+        self._server.logger = logger
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class CoordinatorClient():
+
+    """
+    A worker's client of a :class:`Coordinator`.
+
+    """
+
+    def __init__(self, url: str, worker: str = None, timeout: float = 30) -> None:
+        self.url = url.rstrip('/')
+        self.worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+        self._timeout = timeout
+        self.ttl = LEASE_TTL
+
+    def _request(self, path: str, payload: dict = None):
+        data = (json.dumps(dict(payload, worker=self.worker)).encode('utf-8')
+                if payload is not None else None)
+        request = urllib.request.Request(self.url + path, data=data,
+                                         headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request, timeout=self._timeout) as response:
+            return json.load(response)
+
+    def lease(self):
+        response = self._request('/lease', {})
+        self.ttl = response.get('ttl', self.ttl)
+        return response['shard']
+
+    def heartbeat(self, shard_id: str):
+        return self._request('/heartbeat', {'shard': shard_id})['ok']
+
+    def complete(self, shard_id: str, report: dict = None):
+        return self._request('/complete', {'shard': shard_id, 'report': report})['ok']
+
+    def release(self, shard_id: str, error: str = None):
+        return self._request('/release', {'shard': shard_id, 'error': error})['ok']
+
+    def status(self):
+        return self._request('/status')
+
+
+class Heartbeat():
+
+    """
+    A context manager renewing the lease of a shard in a background
+    thread, while it's processed.
+
+    Once the lease is lost (e.g. it expired, and the shard was leased
+    to another worker), the `lost` event is set, so that the shard's
+    processing can be stopped.
+
+    """
+
+    def __init__(self, client: CoordinatorClient, shard_id: str,
+                 logger = None) -> None:
+        self._client = client
+        self._shard_id = shard_id
+        self.logger = logger
+        self.lost = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._beat, daemon=True)
+
+    def _beat(self):
+        # Renew the lease three times per time to live.
+        while not self._stop.wait(self._client.ttl / 3):
+            try:
+                if not self._client.heartbeat(self._shard_id):
+                    if self.logger:
+                        self.logger.warn("The lease of the shard {} was lost."
+                                         "".format(self._shard_id))
+                    self.lost.set()
+                    return
+            except (urllib.error.URLError, OSError) as e:
+                if self.logger:
+                    self.logger.warn("Heartbeat failed : {}".format(e))
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self._stop.set()
+        self._thread.join()
+
+
+class ShardWorker(CategoryCrawler):
+
+    """
+    A context manager to crawl the shards leased from a coordinator,
+    until they're all done, using the same browsers (one per category)
+    and processed articles' index across the shards.
+
+    """
+
+    # The time (in seconds) to wait for the shards leased by the other
+    # workers to be done (or given back).
+    poll_delay = 30
+
+    def __init__(self, client: CoordinatorClient, out: str, logger = None,
+                 profile_dir: str = None, selectors: str = None,
+                 **scraper_options) -> None:
+        super().__init__([], out, logger, profile_dir,
+                         selectors=selectors, **scraper_options)
+        self._client = client
+        self._loaded_outputs = set()
+
+    def _crawl_shard(self, shard: dict, stop_event: threading.Event = None):
+        """
+        Crawl a single shard, and return its report.
+
+        The crawl is stopped (see :class:`ProcessingStoppedException`)
+        once `stop_event` is set.
+
+        """
+        output = shard['output']
+        # Load the category's processed articles once.
+        if output not in self._loaded_outputs:
+            self._index.update(read_processed_ids(articles_path(self._output_directory,
+                                                                output, self._backend)))
+            self._loaded_outputs.add(output)
+        self.logger.info("Crawling the shard {} ({} : {})"
+                         "".format(shard['id'], shard['how'], shard['links']),
+                         _lbr=True)
+        with ScraperAssistant(logger=self.logger,
+                              driver_manager=self._driver_manager(output),
+                              selectors=self._selectors) as assistant:
+            scraper = Scraper(assistant=assistant,
+                              out=self._output_directory,
+                              main_link=shard['url'],
+                              output_filename=output,
+                              index=self._index,
+                              stop_event=stop_event,
+                              **self._scraper_options)
+            self._scrapers[shard['id']] = scraper
+            scraper.scrape(shard['how'], shard['links'])
+        return {key: scraper._metadata.get(key, 0)
+                for key in ('processed_articles', 'skipped_articles',
+                            'partial_articles')}
+
+    def crawl(self):
+        """
+        Crawl the leased shards, until all of them are done.
+
+        If a shard fails, it's given back to the coordinator, and the
+        failure is raised. If its lease is lost, its crawl is stopped,
+        and the next shard is leased.
+
+        If the coordinator is unreachable while the worker waits for the
+        shards leased by the others, it's considered stopped as the crawl
+        is finished. Otherwise, an `UnableToConnectException` is raised
+        (to re-try later).
+
+        """
+        self._scrapers = {}
+        # Whether all the shards were leased (the worker is waiting for
+        # the others to be done).
+        waiting = False
+        while True:
+            try:
+                shard = self._client.lease()
+                if shard is None:
+                    waiting = True
+                    if self._client.status()['finished']:
+                        return
+            except (urllib.error.URLError, OSError) as e:
+                if waiting:
+                    self.logger.info("The coordinator stopped, the crawl is "
+                                     "considered finished.", _lbr=True)
+                    return
+                raise UnableToConnectException("The coordinator is unreachable.",
+                                               e, self.logger).dbg()
+            if shard is None:
+                # The remaining shards are leased by other workers, which
+                # may die : wait for their leases to expire.
+                time.sleep(self.poll_delay)
+                continue
+            with Heartbeat(self._client, shard['id'], self.logger) as heartbeat:
+                try:
+                    report = self._crawl_shard(shard, heartbeat.lost)
+                # The shard is leased to another worker.
+                except ProcessingStoppedException:
+                    self.logger.warn("The crawl of the shard {} is stopped, as "
+                                     "its lease was lost.".format(shard['id']))
+                    continue
+                except BaseException as e:
+                    try:
+                        self._client.release(shard['id'], repr(e))
+                    except (urllib.error.URLError, OSError):
+                        pass
+                    raise e
+            # NOTE : The shard's outputs are saved anyway, and its lease
+            # expires if the completion is lost.
+            try:
+                self._client.complete(shard['id'], report)
+            except (urllib.error.URLError, OSError) as e:
+                self.logger.warn("The completion of the shard {} was not "
+                                 "reported : {}".format(shard['id'], e))
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description=("Serve the shards of a crawl "
+                                                  "to the workers (`main.py "
+                                                  "--coordinator <url>`)."))
+    parser.add_argument('--host', type=str, default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--url', type=str, default=MAIN_LINK,
+                        help="Specifies the category's listing link.")
+    parser.add_argument('--output', type=str, default=OUTPUT_FILENAME,
+                        help="Specifies the category's output file name.")
+    parser.add_argument('--pages', type=str, default=None,
+                        help="Specifies the listing pages to crawl (e.g. `1-400`).")
+    parser.add_argument('--links', type=str, default=None,
+                        help="Specifies a file listing the articles' links to crawl.")
+    parser.add_argument('--shard_size', type=int, default=10,
+                        help="Specifies the number of pages (or articles) per shard.")
+    parser.add_argument('--ttl', type=float, default=LEASE_TTL,
+                        help="Specifies the lease time to live in seconds.")
+    parser.add_argument('--report', type=str, default=None,
+                        help="Specifies a json file to save the final status to.")
+    return parser.parse_args()
+
+
+def run():
+    args = parse_arguments()
+    if args.pages:
+        first_page, _, last_page = args.pages.partition('-')
+        shards = page_shards(int(first_page), int(last_page or first_page),
+                             args.shard_size, args.url, args.output)
+    elif args.links:
+        with open(args.links, 'r', encoding='utf-8') as lf:
+            links = [line.strip() for line in lf if line.strip()]
+        shards = article_shards(links, args.shard_size, args.url, args.output)
+    else:
+        raise SystemExit("Either --pages or --links is required.")
+    with Coordinator(shards, args.host, args.port, args.ttl) as coordinator:
+        print("Serving {} shards on {}".format(len(shards), coordinator.url))
+        while True:
+            status = coordinator.table.status()
+            print("Shards : {}".format(status['shards']))
+            if status['finished']:
+                break
+            time.sleep(10)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as rf:
+            json.dump(status, rf, indent=3)
+    return 0 if not status['shards']['failed'] else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(run())
@@ -10,18 +10,58 @@ from selenium.common.exceptions import (TimeoutException,
 # from urllib3.exceptions import HTTPError
 
 import json
+import os
+import threading
+import time
 import pandas as pd
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from contextlib import nullcontext
 
 from zalando_de.utils.helpers import *
+from zalando_de.utils.compression import (validate_compression, compressed_path,
+                                          find_path, discard_variants,
+                                          open_input, open_output)
 from zalando_de.scrape.commun.exceptions import *
 from zalando_de.scrape.commun.assistants import ScraperAssistant
 from zalando_de.scrape.commun.cleaners import Cleaner
+from zalando_de.scrape.commun.positions import CrawlPosition
+from zalando_de.scrape.commun.drivers import RecyclePolicy, CONSENT_COOKIE
+from zalando_de.scrape.commun.tabs import TabPool
+from zalando_de.scrape.commun.network import NetworkCapture
+from zalando_de.scrape.commun.pipelines import SnapshotPipeline
+from zalando_de.scrape.commun.indexes import ProcessedIndex, ContentHashes, content_hash
+from zalando_de.scrape.commun.records import ArticleRecord
+from zalando_de.scrape.commun.sitemaps import iter_sitemap
+from zalando_de.scrape.commun.schedulers import RecrawlScheduler
+from zalando_de.scrape.commun.queues import RetryQueue
+from zalando_de.scrape.commun.controllers import AdaptiveController
 from zalando_de.scrape.units.article import ArticleScraper
+from zalando_de.storage.schema import ID_COLNAME, DATE_COLNAME, CORE_COLUMNS, scraped_time
+from zalando_de.storage.sqlite import SQLiteStore
+from zalando_de.storage import parquet
+from zalando_de.storage.history import HistoryStore
+from zalando_de.storage.tables import LongTablesWriter
+from zalando_de.storage.columns import ColumnBuffer, BATCH_SIZE
 
 
 ALIEN_LINKS = ['/outfits/', '/collections/', '/men/', '/campaigns/', '/mens-clothing/']
 
-ID_COLNAME = 'ID'
+# The storage backends, and their files' extensions.
+BACKENDS = {'csv': 'csv',
+            'sqlite': 'sqlite',
+            'parquet': 'parquet'}
+
+# The default category : men's shirts.
+MAIN_LINK = "https://en.zalando.de/mens-clothing-shirts/"
+OUTPUT_FILENAME = "zalando_de_mens_shirts"
+
+# The number of saved (or skipped) articles held before they're written
+# (see `Scraper._checkpoint`), and the crawl position persisted past them.
+CHECKPOINT_SIZE = 200
+
+# The time (in seconds, times the assistant's pace) to wait for the cookies
+# banner when the consent is supposedly retained, but its cookie is missing.
+CONSENT_BANNER_WAIT = 3
 
 # BClosedExceptions = (NoSuchWindowException,
 #                      StaleElementReferenceException,
@@ -29,26 +69,206 @@ ID_COLNAME = 'ID'
 #                      ConnectionError)
 
 
+def page_link(main_link: str, page: int):
+    """
+    Get the link of the `page`th listing page of a category.
+
+    """
+    scheme, netloc, path, query, fragment = urlsplit(main_link)
+    query = [(key, value) for key, value in parse_qsl(query) if key != 'p']
+    if page > 1:
+        query.append(('p', str(page)))
+    return urlunsplit((scheme, netloc, path, urlencode(query), fragment))
+
+
+def articles_path(out: str, output_filename: str, backend: str = 'csv'):
+    """
+    Get the path of the articles' file (according to the storage backend).
+
+    """
+    if backend not in BACKENDS:
+        raise ValueError("Invalid storage backend : {}".format(backend))
+    return f"{out}/{output_filename}.{BACKENDS[backend]}"
+
+
+def read_processed_ids(articles_path: str, sep: str = ","):
+    """
+    Read the IDs of the articles processed in the previous runs
+    from their CSV file (or SQLite database, or Parquet dataset).
+
+    """
+    if articles_path.endswith(f".{BACKENDS['sqlite']}"):
+        with SQLiteStore(articles_path) as store:
+            return store.ids()
+    if articles_path.endswith(f".{BACKENDS['parquet']}"):
+        return parquet.read_ids(articles_path)
+    # NOTE : The CSV file may be compressed (see :func:`open_input`).
+    csv_path = find_path(articles_path)
+    if csv_path is None:
+        return set()
+    with open_input(csv_path) as cf:
+        return set(pd.read_csv(cf,
+                               sep=sep,
+                               usecols=[ID_COLNAME])[ID_COLNAME])
+
+
+def read_scraped_times(articles_path: str, sep: str = ","):
+    """
+    Read the last time each article was scraped (as a timestamp)
+    from their CSV file (or SQLite database, or Parquet dataset).
+
+    """
+    if articles_path.endswith(f".{BACKENDS['parquet']}"):
+        return parquet.read_scraped_times(articles_path)
+    if articles_path.endswith(f".{BACKENDS['sqlite']}"):
+        with SQLiteStore(articles_path) as store:
+            scraped_dates = store.scraped_dates()
+    else:
+        csv_path = find_path(articles_path)
+        if csv_path is None:
+            return {}
+        with open_input(csv_path) as cf:
+            articles = pd.read_csv(cf,
+                                   sep=sep,
+                                   usecols=[ID_COLNAME, DATE_COLNAME])
+        scraped_dates = dict(zip(articles[ID_COLNAME], articles[DATE_COLNAME]))
+    scraped_times = {article_id: scraped_time(scraped_in)
+                     for article_id, scraped_in in scraped_dates.items()}
+    return {article_id: scraped_in for article_id, scraped_in in scraped_times.items()
+            if scraped_in is not None}
+
+
 class Scraper():
 
-    def __init__(self, assistant, out) -> None:
+    def __init__(self, assistant, out,
+                 main_link: str = MAIN_LINK,
+                 output_filename: str = OUTPUT_FILENAME,
+                 index: ProcessedIndex = None,
+                 recycle_policy: RecyclePolicy = None,
+                 prefetch: int = 0,
+                 parse_workers: int = 0,
+                 recrawl_budget: int = None,
+                 recrawl_time: float = None,
+                 retry_attempts: int = 2,
+                 max_outage: float = 600,
+                 field_retries: int = 1,
+                 backend: str = 'csv',
+                 history: bool = False,
+                 long_tables: bool = False,
+                 compression: str = None,
+                 stop_event: threading.Event = None) -> None:
         # Logging configuration.
         self._sa: ScraperAssistant = self.__validate_assistant(assistant)
         # Define the outputs destination directory and name.
         self._output_directory = self.__validate_output_dir(out)
-        self._output_filename = "zalando_de_mens_shirts"
+        self._output_filename = output_filename
+        # NOTE : The default category keeps its original metadata and
+        # skipped articles file names.
+        if output_filename == OUTPUT_FILENAME:
+            self._metadata_filename = "metadata.json"
+            self._skipped_filename = "skipped_shirts.json"
+        else:
+            self._metadata_filename = f"{output_filename}_metadata.json"
+            self._skipped_filename = f"{output_filename}_skipped.json"
+        self._partial_filename = f"{output_filename}_partial.json"
+        # The compression of the JSON and CSV outputs (None, 'gzip', or
+        # 'zstd'), detected on reading.
+        self._compression = validate_compression(compression)
+        # The storage backend of the cleaned articles ('csv', 'sqlite',
+        # or 'parquet').
+        self._backend = backend
+        self._articles_path = articles_path(out, output_filename, backend)
+        # NOTE : The Parquet dataset is written during the run (a row
+        # group every `BATCH_SIZE` articles), hence its writer is opened
+        # with the first saved article (and closed by each checkpoint, as
+        # its files are readable only once closed).
+        self._parquet_writer: parquet.ParquetWriter = None
+        # The price and availability history (a point per change).
+        self._history = (HistoryStore(f"{self._output_directory}/"
+                                      f"{self._output_filename}.history.sqlite")
+                         if history else None)
+        # The long-format sizes and colors tables (into the SQLite
+        # database, or CSV files for the other backends).
+        self._long_tables = (LongTablesWriter(self._output_directory, output_filename,
+                                              sqlite_path=(self._articles_path
+                                                           if backend == 'sqlite'
+                                                           else None),
+                                              compression=compression)
+                             if long_tables else None)
         # Define the 
         # Log the initiation of the scraper
         self._sa.logger.info("Initiate the scraper object.", _lbr=True)
         # Main link
-        self._main_link = "https://en.zalando.de/mens-clothing-shirts/"
+        self._main_link = main_link
         # ...
         self._cleaner = Cleaner()
         self._csv_sep = ","
-        self._processed_articles = self._get_processed_articles()
-        self._newl_processed_articles = {}
+        # NOTE : A shared index (e.g. by the scrapers of several categories)
+        # is expected to be already loaded with the processed articles.
+        self._processed_articles = (index if index is not None
+                                    else ProcessedIndex(self._get_processed_articles()))
+        # NOTE : The newly processed articles are held as compact records
+        # (see :class:`ArticleRecord`), as they're kept until the end of
+        # the run.
+        self._newl_processed_articles: dict[str, ArticleRecord] = {}
+        # The content hash and last seen time of each processed article
+        # (to skip writing the unchanged ones again).
+        self._hashes = ContentHashes(f"{self._output_directory}/"
+                                     f"{self._output_filename}.hashes.json",
+                                     compression=compression)
         self._skipped_articles = {}
         self._metadata = {}
+        # The crawl position, persisted to resume from it on restart.
+        # NOTE : It's never compressed, as it's tiny and written often.
+        self._position = CrawlPosition(f"{self._output_directory}/"
+                                       f"{self._output_filename}.position.json")
+        # The number of articles saved (or skipped) since the last
+        # checkpoint : the position is persisted only when there's none.
+        self._unsaved_articles = 0
+        # The browser recycling policy, and the number of articles
+        # processed since the last recycling.
+        self._recycle_policy = recycle_policy or RecyclePolicy()
+        self._articles_since_recycle = 0
+        # The number of articles' tabs to pre-open (0 to disable the
+        # prefetching, and open each article by clicking it).
+        self._prefetch = prefetch
+        # The number of worker processes parsing the articles' page
+        # snapshots (0 to disable the snapshots, and scrape each article
+        # through the driver).
+        self._parse_workers = parse_workers
+        self._pipeline: SnapshotPipeline = None
+        # The cleaned details of the saved articles not yet written to the
+        # backend (CSV or SQLite) : they're written every `CHECKPOINT_SIZE`
+        # articles (see :meth:`_checkpoint`), and dropped.
+        self._cleaned_articles = {}
+        # The CSV backend's written rows, spooled (as json lines) until
+        # they're merged into the CSV file. The rows spooled by an
+        # interrupted run are merged by the next one.
+        self._spool_path = (f"{self._output_directory}/"
+                            f"{self._output_filename}.spool.jsonl")
+        for _id, _ in self._read_spooled_articles():
+            self._processed_articles.add(_id)
+        # The re-crawl schedule (the last scraping time and change score
+        # of each article), and the re-crawl budget per run : a maximum
+        # number of articles and/or a maximum time (in seconds).
+        self._scheduler = RecrawlScheduler(f"{self._output_directory}/"
+                                           f"{self._output_filename}.schedule.json",
+                                           compression=compression)
+        self._recrawl_budget = recrawl_budget
+        self._recrawl_time = recrawl_time
+        # The timed out articles to re-try later in the same run.
+        self._retry_queue = RetryQueue(retry_attempts)
+        # The controller adapting the concurrency (up to the prefetched
+        # tabs) and the pace to the connection's health, and giving up
+        # once the connection is down for more than `max_outage` seconds.
+        self._controller = AdaptiveController(max(prefetch, 1), max_outage)
+        # The number of re-tries of each article's field, and the articles
+        # saved with missing fields (to be completed later).
+        self._field_retries = field_retries
+        # The event interrupting the processing before the next article
+        # once it's set (e.g. the lease of the crawled shard was lost).
+        self._stop_event = stop_event
+        self._partial_articles = self._read_partial_articles()
 
     def __validate_assistant(self, assistant):
         if not assistant:
@@ -71,6 +291,23 @@ class Scraper():
         if get_link:
             self._sa.get(self._main_link)
 
+        # If the consent's cookie is set (warm driver or persistent
+        # profile), the banner is not expected.
+        if self._consent_cookie():
+            self._sa.logger.debug("Cookies consent already handled.")
+            self._sa.consent_handled = True
+            return
+        # If the consent is supposedly retained (but its cookie could not
+        # be found), only wait shortly for the banner : if it shows up
+        # again, the consent was lost (e.g. the cookie expired).
+        if self._sa.consent_handled:
+            if self._sa._get_element_by_id('uc-main-banner', required=False,
+                                           wait=CONSENT_BANNER_WAIT * self._sa.pace) is None:
+                self._sa.logger.debug("Cookies consent already handled.")
+                return
+            self._sa.logger.info("The cookies banner is displayed again.")
+            self._sa.consent_handled = False
+
         # Wait for the dialog presence.
         try:
             self._sa.xlong_wait.until(ec.visibility_of_element_located((By.ID,
@@ -90,23 +327,73 @@ class Scraper():
             
         except TimeoutException as e:
             if e.msg != 'Cookies did not poped up.': raise e
+        # The consent is now retained by the browser.
+        self._sa.consent_handled = True
             
+    def _consent_cookie(self):
+        """
+        Get the cookie retaining the cookies consent, or None if it's
+        not set (or can't be read).
+
+        """
+        try:
+            return self._sa.driver.get_cookie(CONSENT_COOKIE)
+        except WebDriverException:
+            return None
+
     def _get_processed_articles(self):
         """
         Read the previously processed articles.
         
         """
-        articles_path = f"{self._output_directory}/{self._output_filename}.csv"
-        try:
-            prev_processed_articles = set(pd.read_csv(articles_path,
-                                                      sep=self._csv_sep,
-                                                      encoding='utf-8')[ID_COLNAME])
+        prev_processed_articles = read_processed_ids(self._articles_path, self._csv_sep)
+        if prev_processed_articles:
             self._sa.logger.info("Processed articles read : {} "
                                 "articles.".format(prev_processed_articles.__len__()))
-        except FileNotFoundError:
-            prev_processed_articles = set()
         return prev_processed_articles
     
+    def _read_partial_articles(self):
+        """
+        Read the articles saved with missing fields in the previous runs
+        (as records, see :class:`ArticleRecord`).
+
+        """
+        return {_id: ArticleRecord.from_details(details)
+                for _id, details in self._read_json(f"{self._output_directory}/"
+                                                    f"{self._partial_filename}").items()}
+
+    def _read_json(self, path: str):
+        """
+        Read a json output, compressed or not (an empty dict if it's
+        missing or invalid).
+
+        """
+        found_path = find_path(path)
+        if found_path is None:
+            return {}
+        try:
+            with open_input(found_path) as input_file:
+                return json.load(input_file)
+        except (OSError, EOFError, ValueError):
+            return {}
+
+    def _write_json(self, obj, path: str):
+        """
+        Write a json output (compressed, and not indented, if a
+        compression is set), replacing its other variants.
+
+        Return the written file's path.
+
+        """
+        output_path = compressed_path(path, self._compression)
+        with open_output(output_path, self._compression) as output_file:
+            json.dump(obj,
+                      output_file,
+                      indent=None if self._compression else 3,
+                      ensure_ascii=False)
+        discard_variants(path, output_path)
+        return norm_path(output_path)
+
     def _add_metadata(self, meta_dict: dict):
         """
         Add to metadata to trace the last status of the scraper.
@@ -126,22 +413,14 @@ class Scraper():
         any incident.
 
         """
-        metadata_path = f"{self._output_directory}/metadata.json"
+        metadata_path = f"{self._output_directory}/{self._metadata_filename}"
         meta_dict = {suffix_timer(): self._metadata}
         # Read the old metadata file's content.
-        try:
-            with open(metadata_path, 'r+', encoding='utf-8') as mf:
-                prev_metas = json.load(mf)
-        except Exception as e:
-                prev_metas = {}
+        prev_metas = self._read_json(metadata_path)
         meta_dict.update(prev_metas)
-        # Update the metadata file's content.
-        with open(metadata_path, 'w+', encoding='utf-8') as mf:
-            json.dump(meta_dict,
-                      mf, indent=3,
-                      ensure_ascii=False)
-        # Return the path the metadata saved to
-        return norm_path(metadata_path)
+        # Update the metadata file's content, and return the path
+        # the metadata saved to.
+        return self._write_json(meta_dict, metadata_path)
             
     def _extract_ID(self, link: str):
         """
@@ -152,27 +431,112 @@ class Scraper():
                           .replace('.html', ''))
         return article_id
     
-    def _skip_article(self, id, reason_to_skip_for):
+    def _skip_article(self, id, reason_to_skip_for, link: str = None):
         """
         Add the skipped article to self._skipped_articles.
+
+        If the article timed out (and its `link` is specified), it's
+        queued to be re-tried later in the same run.
         
         """
         self._skipped_articles.update({id: reason_to_skip_for})
+        # Release the article, so that it can be processed again.
+        self._processed_articles.discard(id)
+        self._unsaved_articles += 1
         if 'skipped_articles' in self._metadata:
             self._metadata['skipped_articles'] += 1
         else: self._add_metadata({'skipped_articles': 1})
+        # Queue the article to re-try it later.
+        if link and reason_to_skip_for == 'TimeoutException':
+            attempt = self._retry_queue.push(id, link)
+            if attempt:
+                self._sa.logger.info("The article ( {} ) is queued for re-try "
+                                     "(attempt {}).".format(link, attempt))
 
-    def _save_article(self, id, details):
+    def _save_article(self, id, details, cleaned: dict = None):
         """
         Add the processed article to self._newl_processed_articles
         and self._processed_articles.
+
+        If the article's details are already cleaned, the cleaned
+        ones are kept to avoid cleaning them again.
+
+        If the (complete) article's content did not change since it was
+        last saved, it's neither cleaned nor written again : only its
+        last seen time is bumped.
         
         """
-        self._newl_processed_articles.update({id: details})
+        # A re-tried article is no more skipped.
+        if self._skipped_articles.pop(id, None) is not None:
+            self._metadata['recovered_articles'] = self._metadata.get('recovered_articles', 0) + 1
+        # NOTE : A partial article is always written (and its previous
+        # hash forgotten, so that it's written again once complete).
+        if details.get('missing_fields'):
+            self._hashes.discard(id)
+        elif self._hashes.seen(id, content_hash(details)):
+            self._processed_articles.add(id)
+            self._articles_since_recycle += 1
+            self._metadata['identical_articles'] = self._metadata.get('identical_articles', 0) + 1
+            # NOTE : The re-crawl schedule still learns that it did not change.
+            self._scheduler.record(id, details.get('url'), details)
+            return
+        # NOTE : The article is held (and cleaned, and written) as a
+        # compact record from now on, and its raw details are dropped.
+        record = ArticleRecord.from_details(details)
+        self._newl_processed_articles.update({id: record})
+        cleaned = cleaned if cleaned is not None else self._cleaner.clean(record)
+        if self._backend == 'parquet':
+            if self._parquet_writer is None:
+                self._parquet_writer = parquet.ParquetWriter(self._articles_path)
+            self._parquet_writer.write(id, cleaned)
+        else:
+            self._cleaned_articles.update({id: cleaned})
         self._processed_articles.add(id)
+        self._articles_since_recycle += 1
         if 'processed_articles' in self._metadata:
             self._metadata['processed_articles'] += 1
         else: self._add_metadata({'processed_articles': 1})
+        # Flag the partial article to complete it later (or unflag it
+        # once it's complete).
+        if record.get('missing_fields'):
+            self._partial_articles.update({id: record})
+            self._metadata['partial_articles'] = self._metadata.get('partial_articles', 0) + 1
+        else:
+            self._partial_articles.pop(id, None)
+        # Update the article's re-crawl schedule.
+        if self._scheduler.record(id, record.get('url'), record):
+            self._metadata['changed_articles'] = self._metadata.get('changed_articles', 0) + 1
+        if self._history is not None:
+            self._record_history(id, record, cleaned)
+        if self._long_tables is not None:
+            # NOTE : The missing sizes or colors keep their previous rows.
+            missing_fields = record.get('missing_fields') or []
+            sizes = record.get('available_sizes')
+            colors = record.get('available_colors')
+            self._long_tables.write(id, record.get('scraped_in'),
+                                    sizes=(None if 'available_sizes' in missing_fields
+                                           else self._cleaner.clean_sizes_rows(sizes)),
+                                    colors=(None if 'available_colors' in missing_fields
+                                            else self._cleaner.clean_colors_rows(colors)))
+        self._unsaved_articles += 1
+        if self._unsaved_articles >= CHECKPOINT_SIZE:
+            self._checkpoint()
+
+    def _record_history(self, id, details, cleaned: dict):
+        """
+        Record the article's price, discount, and sizes' availability
+        into the history (a point is written only if they changed).
+
+        """
+        # NOTE : The partial articles missing the price or the sizes
+        # would be recorded as changed.
+        if {'price_label', 'available_sizes'} & set(details.get('missing_fields') or []):
+            return
+        sizes = {size: (size_details or {}).get('count')
+                 for size, size_details in (details.get('available_sizes') or {}).items()}
+        if self._history.record(id, cleaned.get('Price'), cleaned.get('Sold (%)'),
+                                sizes, scraped_time(details.get('scraped_in'))):
+            self._metadata['history_points'] = self._metadata.get('history_points', 0) + 1
 
     def _high_level_details(self):
         """
@@ -183,17 +547,82 @@ class Scraper():
 
         """
         # Total items
-        class_names = '_0Qm8W1 _7Cm1F9 FxZV-M weHhRC u-6V88 FxZV-M'
-        _total_items = total_items(self._sa._get_element_value_by_class(class_names))
+        _total_items = total_items(self._sa._find_value('total_items'))
         # Total pages
-        class_names = '_0Qm8W1 _7Cm1F9 FxZV-M pVrzNP JCuRr_ _0xLoFW uEg2FS FCIprz'
-        _, _total_pages = total_pages(self._sa._get_element_value_by_class(class_names))
+        _current_page, _total_pages = total_pages(self._sa._find_value('total_pages'))
         # Save the values into the scraper's metadata
         self._add_metadata({'total_pages': _total_pages,
                              'total_items': _total_items})
+        # Synchronize the crawl position with the displayed page.
+        if _current_page > 0:
+            self._position.page = _current_page
         # Return the details
         return _total_items, _total_pages
     
+    def _should_recycle(self):
+        """
+        Verify if the browser must be recycled according to the
+        recycling policy. If so, return the recycling event.
+
+        """
+        if not self._recycle_policy:
+            return None
+        return self._recycle_policy.should_recycle(self._articles_since_recycle,
+                                                   self._sa.driver)
+
+    def _recycle(self, event: dict, restore_url: str = None):
+        """
+        Restart the browser, restore its cookies, and get back
+        to `restore_url` (if specified).
+
+        The recycle event is recorded in the metadata.
+
+        """
+        self._sa.logger.info("Recycling the browser after {} articles ({})."
+                             "".format(event['articles'], event['reason']),
+                             _lbr=True)
+        event.update({'at': current_datetime()[1]})
+        self._metadata.setdefault('recycles', []).append(event)
+        self._sa.restart_driver()
+        self._articles_since_recycle = 0
+        if restore_url:
+            self._sa.get(restore_url)
+        self._handle_cookies()
+
+    def _throttle(self, tab_pool: TabPool = None):
+        """
+        Wait before the next article if the connection is down, and
+        apply the controller's pace and concurrency.
+
+        Also reload the selectors if their config was modified, and
+        raise a `ProcessingStoppedException` if the processing must be
+        stopped (see `stop_event`).
+
+        """
+        if self._stop_event is not None and self._stop_event.is_set():
+            raise ProcessingStoppedException("The stop event is set.",
+                                             None, self._sa.logger).dbg()
+        self._sa.selectors.reload()
+        delay = self._controller.delay()
+        if delay:
+            self._sa.logger.warn("The connection seems down, probing it again "
+                                 "in {:.0f} seconds.".format(delay))
+            time.sleep(delay)
+        self._sa.pace = self._controller.pace
+        if tab_pool:
+            tab_pool.size = self._controller.concurrency
+
+    def _raise_outage(self):
+        """
+        Raise an `UnableToConnectException`, as the connection is down
+        for too long.
+
+        """
+        exc_message = "Probably the Internet connection is unstable."
+        raise UnableToConnectException(exc_message,
+                                       TimeoutException(),
+                                       self._sa.logger).dbg()
+
     def _get_current_url(self):
         """
         Get the currently opened page's url.
@@ -208,7 +637,7 @@ class Scraper():
         
         """
         # Get the next btn element
-        next_btn = self._sa._get_elements_by_class('DJxzzA OldB32')[-1]
+        next_btn = self._sa._find_all('next_page')[-1]
         # If the btn is enabled (i.e. there is another page), click it,
         # wait th new page to load, and return True.
         if next_btn.is_enabled():
@@ -216,6 +645,9 @@ class Scraper():
             self._sa._move_mouse_to_and_click(next_btn)
             # Wait the page to load
             self._sa._wait_to_load()
+            # Persist the new crawl position.
+            self._position.move_to(self._get_current_url(),
+                                   self._position.page + 1)
             # Return the enablity of the next page.
             return True
         # Otherwise, return False, indicating there is no more pages.
@@ -226,9 +658,7 @@ class Scraper():
         Find the article's url.
         
         """
-        class_names = '_LM JT3_zV CKDt_l CKDt_l LyRfpJ'
-        link = self._sa._get_element_by_class(class_names,
-                                              article_element).get_attribute('href')
+        link = self._sa._find('article_link', article_element).get_attribute('href')
         return link
     
     def _is_alien_link(self, link: str):
@@ -263,30 +693,43 @@ class Scraper():
         # Return the True (at this point the article is valid to scrape)
         return True, "ok"
     
-    def _get_page_articles(self):
+    def _get_page_articles(self, offset: int = 0, last_id: str = None):
         """
         Get all the article elements avaialable in the current
-        page.
+        page, along with their position (tile index) in the page.
+
+        The tiles up to the article `last_id` (or, if it's no more
+        listed, the tiles before `offset`) were handled before a
+        restart, hence they are ignored.
 
         """
         self._sa.logger.info("Searching page's articles ...",
                              _lbr=True, _rbr=True)
-        # Article elements class names
-        class_names = 'DT5BTM w8MdNG cYylcv _1FGXgy _75qWlu iOzucJ JT3_zV vut4p9'
         # Articles
-        articles = self._sa._get_elements_by_class(class_names)
-        # Filter articles with alien links
-        valid_articles, duplicated = [], 0
-        for article in articles:
+        articles = self._sa._find_all('article_tile')
+        tiles = []
+        for index, article in enumerate(articles):
             try:
-                link = self._get_article_link(article)
+                tiles.append((index, article, self._get_article_link(article)))
             except StaleElementReferenceException as se_e:
                 self._sa.logger.debu0("Staled element skipped.")
+        # Resume after the last handled article, as the tiles may have
+        # shifted since (e.g. new articles were listed).
+        if last_id is not None:
+            for index, _, link in tiles:
+                if self._extract_ID(link) == last_id:
+                    offset = index + 1
+                    break
+        # Filter articles with alien links
+        valid_articles, duplicated = [], 0
+        for index, article, link in tiles:
+            # Ignore the tiles handled before the restart.
+            if index < offset:
                 continue
             # Validate the article (using the link)
             is_valid, valid_msg = self._is_valid_article(link)
             if is_valid:
-                valid_articles.append((article, link))
+                valid_articles.append((index, article, link))
             else:
                 self._sa.logger.info("The article ( {} ) is {}."
                                      "".format(link, valid_msg))
@@ -295,26 +738,80 @@ class Scraper():
         # Return only valid articles
         return valid_articles, duplicated
     
-    def _clean_processed_articles(self):
+    def _checkpoint(self):
         """
-        _clean_processed_articles
-        
+        Write the articles saved (or skipped) since the last checkpoint,
+        so that the crawl position can be persisted past them (see
+        :meth:`_persist_position`).
+
+        NOTE : The uncleaned JSON output, the re-crawl schedule, and the
+        content hashes (each rewritten whole) are only written by
+        :meth:`_save` : after a crash, the articles before the position
+        are only missing from the uncleaned JSON, and written again once
+        revisited even if they did not change.
+
+        """
+        self._flush_cleaned_articles()
+        if self._parquet_writer is not None:
+            self._save_to_parquet()
+        if self._long_tables is not None:
+            self._long_tables.flush()
+        if self._history is not None:
+            self._history.flush()
+        self._save_to_json_skipped_articles()
+        self._save_to_json_partial_articles()
+        self._unsaved_articles = 0
+        self._sa.logger.debug("Checkpoint : the saved articles are written.")
+
+    def _persist_position(self):
+        """
+        Persist the crawl position, unless the articles saved (or
+        skipped) before it are not written yet : it's then persisted
+        by the next checkpoint's move (or by :meth:`_save`).
+
+        """
+        if not self._unsaved_articles and self._position.is_resumable():
+            self._position.save()
+
+    def _flush_cleaned_articles(self):
         """
-        # Newly processed articles
-        processed_articles = self._newl_processed_articles
-        # Clean the processed articles' details.
-        # NOTE: This cleaning is needed to clean the price and
-        # split the data entries of :
-        # - Material & care,
-        # - Size & Fit,
-        # - and Details.
-        for _id, _details in processed_articles.items():
-            cleaned = self._cleaner.clean(_details)
-            processed_articles.update({_id: cleaned})
-        # Create a new datarame of the cleaned data.
-        return pd.DataFrame.from_dict(processed_articles,
-                                      orient="index").reset_index(drop=False,
-                                                                  names=['ID'])
+        Write the cleaned articles held since the last flush to the
+        backend : upsert them into the SQLite database, or spool them
+        to be merged into the CSV file (see :meth:`_save_to_csv`). Then
+        drop them.
+
+        NOTE : The Parquet dataset is written as the articles are saved.
+
+        """
+        if not self._cleaned_articles:
+            return
+        if self._backend == 'sqlite':
+            self._save_to_sqlite(self._cleaned_articles.items())
+        else:
+            with open(self._spool_path, 'a', encoding='utf-8') as spool_file:
+                for _id, cleaned in self._cleaned_articles.items():
+                    spool_file.write(json.dumps({ID_COLNAME: _id, **cleaned},
+                                                default=str) + '\n')
+        self._cleaned_articles = {}
+
+    def _read_spooled_articles(self):
+        """
+        Read the spooled cleaned articles, and yield them one by one as
+        (ID, cleaned details), in their spooling order.
+
+        NOTE : The last line may be truncated (e.g. by a crash while
+        spooling), in which case it's ignored.
+
+        """
+        if not os.path.exists(self._spool_path):
+            return
+        with open(self._spool_path, 'r', encoding='utf-8') as spool_file:
+            for line in spool_file:
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    continue
+                yield row.pop(ID_COLNAME), row
     
     def _save_to_json_skipped_articles(self):
         """
@@ -325,14 +822,20 @@ class Scraper():
         # NOTE : As all the skipped articles in the previous runs will be
         # re-processed again in next's, the previously saved skipped articles
         # can be overwrited with no proble.
-        json_fn = f"{self._output_directory}/skipped_shirts.json"
+        json_fn = f"{self._output_directory}/{self._skipped_filename}"
         # Save the articles
-        with open(json_fn, "w+", encoding='utf-8') as output_file:
-            json.dump(self._skipped_articles,
-                      output_file,
-                      indent=3,
-                      ensure_ascii=False)
-        return norm_path(json_fn)
+        return self._write_json(self._skipped_articles, json_fn)
+
+    def _save_to_json_partial_articles(self):
+        """
+        Save the articles with missing fields into a json file.
+
+        """
+        # NOTE : The partial articles of the previous runs were read at
+        # the start, hence the file can be overwrited.
+        json_fn = f"{self._output_directory}/{self._partial_filename}"
+        return self._write_json({_id: record.to_details()
+                                 for _id, record in self._partial_articles.items()}, json_fn)
 
     def _save_to_json(self):
         """
@@ -343,49 +846,105 @@ class Scraper():
         json_fn = f"{self._output_directory}/{self._output_filename}(uncleaned).json"
         # Prepare the dictionary to hold all the results.
         processed_articles = {suffix_timer():{'metadata': self._metadata,
-                                              'data': self._newl_processed_articles}}
+                                              'data': {_id: record.to_details()
+                                                       for _id, record in
+                                                       self._newl_processed_articles.items()}}}
         
-        try:
-            with open(json_fn, "r+", encoding='utf-8') as output_file:
-                prev_processed_articles = json.load(output_file)
-        except Exception:
-            prev_processed_articles = {}
+        prev_processed_articles = self._read_json(json_fn)
         # Update the read file
         prev_processed_articles.update(processed_articles)
-        # Save the scraperd data
-        with open(json_fn, "w+", encoding='utf-8') as output_file:
-            json.dump(prev_processed_articles,
-                      output_file,
-                      indent=3,
-                      ensure_ascii=False)
-        # Return the path the data saved to
-        return norm_path(json_fn)
+        # Save the scraperd data, and return the path the data saved to
+        return self._write_json(prev_processed_articles, json_fn)
             
     def _save_to_csv(self):
         """
         Save processed articles into a csv file.
+
+        The spooled cleaned articles (see :meth:`_flush_cleaned_articles`)
+        are written in batches (see :class:`ColumnBuffer`), following the
+        previous rows (streamed in chunks too), into a temporary file
+        replacing the CSV file. Then the spool is removed.
         
         """
-        csv_fn = f"{self._output_directory}/{self._output_filename}.csv"
-        # Convert the processed articles' details to a dataframe.
-        newl_processed_articles = self._clean_processed_articles()
-        # Read the previously processed articles CSV file.
-        try:
-            prev_processed_articles = pd.read_csv(csv_fn,
-                                                  sep=self._csv_sep,
-                                                  encoding='utf-8')
-        except FileNotFoundError:
-            prev_processed_articles = None
-        # Save the dataframe into a CSV file.
-        (pd.concat([prev_processed_articles,
-                    newl_processed_articles])
-           .to_csv(path_or_buf=csv_fn,
-                   index=False,
-                   sep=self._csv_sep,
-                   encoding='utf-8'))
+        # NOTE : The previous CSV file may be compressed differently.
+        prev_csv_fn = find_path(self._articles_path)
+        csv_fn = compressed_path(self._articles_path, self._compression)
+        tmp_fn = f"{csv_fn}.tmp"
+        # The columns : the previous ones, then the new ones.
+        prev_columns = None
+        if prev_csv_fn is not None:
+            with open_input(prev_csv_fn) as prev_file:
+                prev_columns = list(pd.read_csv(prev_file, sep=self._csv_sep,
+                                                nrows=0).columns)
+        # The spooled articles : the latest row of each (an article may
+        # be saved again, e.g. once completed), and their columns.
+        latest_rows, spooled_columns = {}, set()
+        for index, (_id, cleaned) in enumerate(self._read_spooled_articles()):
+            latest_rows[_id] = index
+            spooled_columns.update(cleaned)
+        core_columns = [column for column in CORE_COLUMNS if column != DATE_COLNAME]
+        columns = list(dict.fromkeys((prev_columns or [])
+                                     + [ID_COLNAME]
+                                     + core_columns
+                                     + sorted(spooled_columns - set(CORE_COLUMNS))
+                                     + [DATE_COLNAME]))
+        with open_output(tmp_fn, self._compression, newline='') as output_file:
+            pd.DataFrame(columns=columns).to_csv(output_file, index=False,
+                                                 sep=self._csv_sep)
+            def _append(frame: pd.DataFrame):
+                # NOTE : The buffer's schema starts with all the columns
+                # (tracked by the cleaner), hence its batches are already
+                # in the header's order.
+                if list(frame.columns) != columns:
+                    raise ValueError("Untracked columns : {}"
+                                     "".format(list(frame.columns[len(columns):])))
+                frame.to_csv(output_file, header=False,
+                             index=False, sep=self._csv_sep)
+            # NOTE : The re-processed articles replace their previous
+            # rows, which are kept as read (as text), in the new columns.
+            if prev_columns is not None:
+                with open_input(prev_csv_fn) as prev_file:
+                    for chunk in pd.read_csv(prev_file, sep=self._csv_sep, dtype=str,
+                                             keep_default_na=False, chunksize=BATCH_SIZE):
+                        _append(chunk[~chunk[ID_COLNAME].isin(latest_rows.keys())]
+                                .reindex(columns=columns))
+            with ColumnBuffer(columns, _append) as buffer:
+                for index, (_id, cleaned) in enumerate(self._read_spooled_articles()):
+                    if latest_rows[_id] == index:
+                        buffer.append({ID_COLNAME: _id, **cleaned})
+        os.replace(tmp_fn, csv_fn)
+        discard_variants(self._articles_path, csv_fn)
+        if os.path.exists(self._spool_path):
+            os.remove(self._spool_path)
         # Return the path the data saved to
         return norm_path(csv_fn)
 
+    def _save_to_sqlite(self, cleaned_articles):
+        """
+        Upsert processed articles into a SQLite database, in batches.
+
+        """
+        with SQLiteStore(self._articles_path) as store:
+            batch = {}
+            for _id, cleaned in cleaned_articles:
+                batch[_id] = cleaned
+                if len(batch) >= BATCH_SIZE:
+                    store.upsert(batch)
+                    batch = {}
+            store.upsert(batch)
+        return norm_path(self._articles_path)
+
+    def _save_to_parquet(self):
+        """
+        Write the buffered articles into the Parquet dataset (the others
+        were written during the run).
+
+        """
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+        return norm_path(self._articles_path)
+
     def _save(self):
         """
         Save processed articles into a JSON and CSV files.
@@ -399,77 +958,169 @@ class Scraper():
         saved_to = self._save_to_json_skipped_articles()
         self._sa.logger.info("Un-processed articles saved (JSON) into {}"
                              "".format(saved_to))
+        saved_to = self._save_to_json_partial_articles()
+        self._sa.logger.info("Partially processed articles saved (JSON) into {}"
+                             "".format(saved_to))
         saved_to = self._save_to_json()
         self._sa.logger.info("Processed articles saved (JSON) into {}"
                              "".format(saved_to))
-        saved_to = self._save_to_csv()
-        self._sa.logger.info("Processed articles saved (CSV) into {}"
-                             "".format(saved_to))
+        # Write the articles still held (the others were written during
+        # the run).
+        self._flush_cleaned_articles()
+        if self._backend == 'parquet':
+            saved_to = self._save_to_parquet()
+        elif self._backend == 'sqlite':
+            saved_to = norm_path(self._articles_path)
+        else:
+            saved_to = self._save_to_csv()
+        self._sa.logger.info("Processed articles saved ({}) into {}"
+                             "".format(self._backend.upper(), saved_to))
+        saved_to = self._scheduler.save()
+        self._sa.logger.info("Re-crawl schedule saved into {}"
+                             "".format(norm_path(saved_to)))
+        saved_to = self._hashes.save()
+        self._sa.logger.info("Articles' content hashes saved into {}"
+                             "".format(norm_path(saved_to)))
+        if self._long_tables is not None:
+            self._long_tables.flush()
+            self._sa.logger.info("Sizes and colors tables saved into {}"
+                                 "".format(", ".join(norm_path(path) for path in self._long_tables.paths)))
+        if self._history is not None:
+            self._history.flush()
+            self._sa.logger.info("Price and availability history saved into {}"
+                                 "".format(norm_path(self._history.path)))
+        self._unsaved_articles = 0
+        # Persist the crawl position only now that the articles processed
+        # before it are written (unless the crawl is finished).
+        if self._position.is_resumable():
+            saved_to = self._position.save()
+            self._sa.logger.info("Crawl position saved into {}"
+                                 "".format(norm_path(saved_to)))
         
     def _process_page(self):
         """
         Process all the articles in the current page.
 
+        Return True if the page is entirely processed, or False if
+        the processing is interrupted to recycle the browser : the
+        articles' elements are then stale, and the page must be
+        processed again starting from the persisted offset.
+
         """
-        # The list of all articles
-        articles_elements, n_duplicated = self._get_page_articles()
+        # The list of all articles (starting from the persisted offset)
+        self._sa.selectors.reload()
+        articles_elements, n_duplicated = self._get_page_articles(self._position.offset,
+                                                                  self._position.last_id)
         n_valid_articles = len(articles_elements)
         n_articles = n_valid_articles + n_duplicated
         # Inform the number of found articles.
         self._sa.logger.info("Found {} articles (out of {}) to process "
                              "[{} were processed in previous pages]."
                              "".format(n_valid_articles, n_articles, n_duplicated))
+        # If the prefetching is enabled, the next articles are loaded in
+        # a pool of pre-opened tabs while the current one is extracted.
+        tab_pool = TabPool(self._sa, self._prefetch) if self._prefetch else None
         # Initiate the page articles with an empty dictionary.
         try:        
-            successive_skips, internet_issue = 0, False
-            processed_articles = 0
-            # Extract the details of each found article
-            for (article, link) in articles_elements:
-                # Extract the article ID
-                article_id = self._extract_ID(link)
-                # Open the article details in a new tab
-                # NOTE : The new tab must be closed by quiting this
-                # `with` statement.
-                with ArticleScraper(self._sa, article) as article_scraper:
-                    # Process the article to scrape the details.
+            internet_issue = False
+            processed_articles, recycle_event = 0, None
+            with (tab_pool or nullcontext()):
+                if tab_pool:
+                    tab_pool.submit([link for (_, _, link) in articles_elements])
+                # Extract the details of each found article
+                for (index, article, link) in articles_elements:
+                    # Interrupt the page if the browser must be recycled.
+                    recycle_event = self._should_recycle()
+                    if recycle_event:
+                        break
+                    # Slow down (or wait) if the connection is unstable.
+                    self._throttle(tab_pool)
+                    # Extract the article ID
+                    article_id = self._extract_ID(link)
+                    # Claim the article, as it may be processed meanwhile by
+                    # another scraper sharing the index (e.g. another category).
+                    if not self._processed_articles.claim(article_id):
+                        self._sa.logger.info("The article ( {} ) is already "
+                                             "processed.".format(link))
+                        self._position.advance(index + 1, article_id)
+                        self._persist_position()
+                        continue
                     try:
-                        article_details = article_scraper.scrape(link)
-                        # Add the link to article's details.
-                        article_details.update({'url': link,
-                                                'scraped_in': timer()})
-                        # Append the processed article to the pages', in case
-                        # no error occured and no exception raised.
-                        self._save_article(article_id, article_details)
-                        processed_articles += 1
-                    # In case processing the article failed, then an
-                    # `ArticleProcessingException` must been raised.
-                    except ArticleProcessingException as ap_e:
-                    # If the processing exception is a timeout's,
-                    # skip the article and continue.
-                        if isinstance(ap_e.exc_error, TimeoutException):
-                            # Append the skipped article to the pages', in case
-                            # a TimeoutException exception raised.
-                            self._skip_article(article_id, 'TimeoutException')
-                            successive_skips += 1
-                            # If the TimeoutException is catched more than 3 time
-                            # successively, then probably there is an Internet
-                            # connection issue. Hence break the loop and raise
-                            # an UnableToConnectException exception after the
-                            # exiting the ArticleScraper context manager.
-                            if successive_skips > 2:
-                                internet_issue = True
-                                break
-                            # If not, continue.
-                            continue
-                        successive_skips = 0
-                        raise ap_e
-            # If internet issue is True, the TimeoutException was catched more
-            # than 3 time successively.
+                        # Open the article details in a new tab (or switch to
+                        # its prefetched tab).
+                        # NOTE : The new tab must be closed by quiting this
+                        # `with` statement.
+                        article_tab = (tab_pool.tab(link)
+                                       if tab_pool
+                                       else ArticleScraper(self._sa, article))
+                        # Process the article to scrape the details.
+                        # NOTE : The prefetched tab may time out while it's
+                        # being switched to, hence the `with` statement is
+                        # in the `try` one.
+                        try:
+                            with article_tab:
+                                article_scraper = ArticleScraper(self._sa, field_retries=self._field_retries)
+                                # If the parsing workers are enabled, only take a
+                                # snapshot and hand it over to them.
+                                if self._pipeline:
+                                    snapshot = article_scraper.snapshot(link)
+                                    self._pipeline.submit(article_id, snapshot,
+                                                          link, timer(),
+                                                          self._sa.selectors.as_dict())
+                                    # NOTE : The tile is done once its snapshot is
+                                    # parsed and saved (see `_collect_snapshots`).
+                                    self._position.hold(article_id, index + 1)
+                                else:
+                                    article_details = article_scraper.scrape(link)
+                                    # Add the link to article's details.
+                                    article_details.update({'url': link,
+                                                            'scraped_in': timer()})
+                                    # Append the processed article to the pages', in case
+                                    # no error occured and no exception raised.
+                                    self._save_article(article_id, article_details)
+                                    processed_articles += 1
+                                    # Move the position after the processed tile.
+                                    self._position.advance(index + 1, article_id)
+                                    self._persist_position()
+                            self._controller.success()
+                            # Save the articles parsed by the workers meanwhile.
+                            if self._pipeline:
+                                processed_articles += self._collect_snapshots()
+                        # In case processing the article failed, then an
+                        # `ArticleProcessingException` must been raised.
+                        except ArticleProcessingException as ap_e:
+                        # If the processing exception is a timeout's,
+                        # skip the article and continue.
+                            if isinstance(ap_e.exc_error, TimeoutException):
+                                # Append the skipped article to the pages', in case
+                                # a TimeoutException exception raised.
+                                self._skip_article(article_id, 'TimeoutException', link)
+                                # The skipped article is recorded, so the tile is
+                                # not needed after a restart.
+                                self._position.advance(index + 1, article_id)
+                                self._persist_position()
+                                self._controller.failure()
+                                # If the connection is down for too long, break
+                                # the loop and raise an UnableToConnectException
+                                # exception after exiting the tabs' context managers.
+                                if self._controller.gave_up:
+                                    internet_issue = True
+                                    break
+                                # If not, continue (slower).
+                                continue
+                            raise ap_e
+                    # If the article was not processed, release it.
+                    except BaseException as e:
+                        self._processed_articles.discard(article_id)
+                        raise e
+            # If internet issue is True, the connection is down for too long.
             if internet_issue:
-                exc_message = "Probably the Internet connection is unstable."
-                raise UnableToConnectException(exc_message,
-                                               TimeoutException(),
-                                               self._sa.logger).dbg()
+                self._raise_outage()
+            # Recycle the browser, and get back to the current page.
+            if recycle_event:
+                self._recycle(recycle_event, self._position.url)
+                return False
+            return True
         # Inform the number of scraped articles.
         finally:
             self._sa.logger.info("{} out of {} articles were successfully "
@@ -477,13 +1128,153 @@ class Scraper():
                                                      len(articles_elements)),
                                  _lbr=True, _rbr=True)
 
-    def _process(self):
+    def _retry_skipped(self, wait: bool = False):
+        """
+        Re-try the timed out articles whose re-try is due, each in a new
+        tab. If `wait`, wait for the others to be due too, until all of
+        them are processed or exhausted their re-tries.
+
+        """
+        if not self._retry_queue:
+            return
+        self._sa.logger.info("Re-trying the skipped articles ({} queued) ..."
+                             "".format(len(self._retry_queue)), _lbr=True)
+        internet_issue = False
+        with TabPool(self._sa, 1) as tab_pool:
+            while self._retry_queue:
+                retry = self._retry_queue.pop_due()
+                # If no re-try is due yet, wait for the next one, or
+                # get back to the crawl.
+                if retry is None:
+                    if not wait:
+                        break
+                    time.sleep(self._retry_queue.wait_time())
+                    continue
+                article_id, link = retry
+                # Slow down (or wait) if the connection is unstable.
+                self._throttle()
+                # The article may be processed meanwhile by another scraper
+                # sharing the index.
+                if not self._processed_articles.claim(article_id):
+                    self._skipped_articles.pop(article_id, None)
+                    continue
+                try:
+                    with tab_pool.tab(link):
+                        article_details = ArticleScraper(self._sa, field_retries=self._field_retries).scrape(link)
+                except ArticleProcessingException as ap_e:
+                    # If it timed out again, queue it again (if it did not
+                    # exhaust its re-tries).
+                    if isinstance(ap_e.exc_error, TimeoutException):
+                        self._skip_article(article_id, 'TimeoutException', link)
+                        self._controller.failure()
+                        if self._controller.gave_up:
+                            internet_issue = True
+                            break
+                        continue
+                    self._processed_articles.discard(article_id)
+                    raise ap_e
+                # If the article was not processed, release it.
+                except BaseException as e:
+                    self._processed_articles.discard(article_id)
+                    raise e
+                article_details.update({'url': link,
+                                        'scraped_in': timer()})
+                self._save_article(article_id, article_details)
+                self._controller.success()
+                self._sa.logger.info("The article ( {} ) is recovered.".format(link))
+        # If internet issue is True, the connection is down for too long.
+        if internet_issue:
+            self._raise_outage()
+
+    def _collect_snapshots(self):
+        """
+        Save the articles parsed by the workers since the last call, and
+        move the crawl position after their tiles.
+
+        Return the number of saved articles.
+
+        """
+        saved_articles = 0
+        for article_id, details, cleaned, exception in self._pipeline.collect():
+            if exception is not None:
+                self._sa.logger.warn("The article ( {} ) snapshot was not parsed : {}"
+                                     "".format(article_id, exception))
+                self._skip_article(article_id, type(exception).__name__)
+            else:
+                self._save_article(article_id, details, cleaned)
+                saved_articles += 1
+            # The tile is done either way (saved, or skipped).
+            self._position.release(article_id)
+            self._persist_position()
+        return saved_articles
+
+    def _capture_page(self):
+        """
+        Save the articles decoded from the network responses captured
+        while loading the current page, without opening them.
+
+        Return True, as the page is always entirely processed.
+
+        """
+        # Scroll to the bottom of the page, so that the lazily loaded
+        # articles are fetched too.
+        page_height = self._sa.driver.execute_script('return document.body.scrollHeight;')
+        self._sa.sleep_and_scroll(page_height)
+        self._sa._wait_to_load()
+        # Save the valid decoded articles.
+        captured_articles = 0
+        for link, article_details in self._network.articles():
+            is_valid, valid_msg = self._is_valid_article(link)
+            if not is_valid:
+                self._sa.logger.debug("The captured article ( {} ) is {}."
+                                      "".format(link, valid_msg))
+                continue
+            article_id = self._extract_ID(link)
+            # Claim the article, as it may be processed meanwhile by
+            # another scraper sharing the index (e.g. another category).
+            if not self._processed_articles.claim(article_id):
+                self._sa.logger.debug("The captured article ( {} ) is already "
+                                      "processed.".format(link))
+                continue
+            article_details.update({'url': link,
+                                    'scraped_in': timer()})
+            # NOTE : The fields missing from the network responses are
+            # completed later (see :meth:`_complete_articles`).
+            try:
+                self._save_article(article_id, article_details)
+            # If the article was not saved, release it.
+            except BaseException as e:
+                self._processed_articles.discard(article_id)
+                raise e
+            captured_articles += 1
+        # Inform the number of captured articles.
+        self._sa.logger.info("{} articles were captured from the network "
+                             "responses.".format(captured_articles),
+                             _lbr=True, _rbr=True)
+        return True
+
+    def _process(self, process_page = None):
         """
         Start processing.
 
+        Each listing page is processed using `process_page` (defaults
+        to :meth:`Scraper._process_page`).
+
         """
-        # Get the targeted link (self._main_link)
-        self._sa.get(self._main_link)
+        process_page = process_page or self._process_page
+        # If a crawl position was persisted by a previous run, jump
+        # straight to its listing page.
+        if self._position.is_resumable():
+            self._sa.logger.info("Resuming from page {} (tile offset {}) : {}"
+                                 "".format(self._position.page,
+                                           self._position.offset,
+                                           self._position.url))
+            self._add_metadata({'resumed_from': self._position.as_dict()})
+            self._sa.get(self._position.url)
+        # Otherwise, get the targeted link (self._main_link)
+        else:
+            self._sa.get(self._main_link)
+            self._position.move_to(self._main_link, 1)
         # handle cookies
         self._handle_cookies()
         # Search for the total items and pages
@@ -495,12 +1286,56 @@ class Scraper():
                                  "{}".format('='*49),
                                  _lbr=True, _rbr=True)
             try:
-                self._process_page()
-                # If there is not more pages to scrape, stop.
-                if not self._is_next_page(): break
+                # If the page was interrupted to recycle the browser,
+                # process it again.
+                if not process_page():
+                    continue
+                # Re-try the timed out articles that are due.
+                self._retry_skipped()
+                # If there is not more pages to scrape, stop, and
+                # forget the crawl position as the crawl is finished.
+                if not self._is_next_page():
+                    # Re-try the remaining timed out articles.
+                    self._retry_skipped(wait=True)
+                    self._position.clear()
+                    break
             except BaseException as be:
                 raise be
     
+    def _process_pages(self, pages: list):
+        """
+        Process the listing pages from `pages[0]` to `pages[-1]` (e.g. a
+        shard leased from a coordinator).
+
+        NOTE : The crawl position is not resumed from, as it may belong
+        to another pages range.
+
+        """
+        first_page, last_page = pages[0], pages[-1]
+        link = page_link(self._main_link, first_page)
+        self._sa.get(link)
+        self._position.move_to(link, first_page)
+        # handle cookies
+        self._handle_cookies()
+        # Search for the total items and pages
+        self._high_level_details()
+        self._add_metadata({'pages': [first_page, last_page]})
+        while True:
+            self._sa.logger.info("Processing new page "
+                                 "{}".format('='*49),
+                                 _lbr=True, _rbr=True)
+            # If the page was interrupted to recycle the browser,
+            # process it again.
+            if not self._process_page():
+                continue
+            # Re-try the timed out articles that are due.
+            self._retry_skipped()
+            # Stop after the last page of the range.
+            if self._position.page >= last_page or not self._is_next_page():
+                self._retry_skipped(wait=True)
+                self._position.clear()
+                break
+
     def _process_articles(self, links: str):
         """
         Scrape a single or a list of articles independently
@@ -511,16 +1346,18 @@ class Scraper():
         while processing.
 
         """
-        # Make sure the links is alist.
-        if not isinstance(links, list):
+        # Make sure the links is alist (or an iterable of links).
+        if isinstance(links, str):
             links = [links]
         # handle cookies
         self._handle_cookies(get_link=True)
         # Define the article scraper
-        article_scraper = ArticleScraper(self._sa)
-        successive_skips, internet_issue = 0, False
+        article_scraper = ArticleScraper(self._sa, field_retries=self._field_retries)
+        internet_issue = False
+        n_links = 0
         try:
             for article_link in links:
+                n_links += 1
                 self._sa.logger.log("", show_details=False)
                 # Get the article ID
                 article_id = self._extract_ID(article_link)
@@ -530,6 +1367,12 @@ class Scraper():
                     self._sa.logger.info("The article ( {} ) is {}."
                                      "".format(article_link, valid_msg))
                     continue
+                # Recycle the browser if needed.
+                recycle_event = self._should_recycle()
+                if recycle_event:
+                    self._recycle(recycle_event)
+                # Slow down (or wait) if the connection is unstable.
+                self._throttle()
                 # Get the article page
                 self._sa.get(article_link)
                 # Process the article to scrape the details.
@@ -541,6 +1384,7 @@ class Scraper():
                     # Append the processed article to the pages', in case
                     # no error occured and no exception raised.
                     self._save_article(article_id, article_details)
+                    self._controller.success()
                 # In case processing the article failed, then an
                 # `ArticleProcessingException` must been raised.
                 except ArticleProcessingException as ap_e:
@@ -549,32 +1393,145 @@ class Scraper():
                         if isinstance(ap_e.exc_error, TimeoutException):
                             # Append the skipped article to the pages', in case
                             # a TimeoutException exception raised.
-                            self._skip_article(article_id, 'TimeoutException')
-                            successive_skips += 1
-                            # If the TimeoutException is catched more than 3 time
-                            # successively, then probably there is an Internet
-                            # connection issue. Hence break the loop and raise
-                            # an UnableToConnectException exception after the
-                            # exiting the ArticleScraper context manager.
-                            if successive_skips > 2:
+                            self._skip_article(article_id, 'TimeoutException',
+                                               article_link)
+                            self._controller.failure()
+                            # If the connection is down for too long, break
+                            # the loop and raise an UnableToConnectException.
+                            if self._controller.gave_up:
                                 internet_issue = True
                                 break
-                            # If not, continue.
+                            # If not, continue (slower).
                             continue
-                        successive_skips = 0
                         raise ap_e
-            # If internet issue is True, the TimeoutException was catched more
-            # than 3 time successively.
+            # If internet issue is True, the connection is down for too long.
             if internet_issue:
-                exc_message = "Probably the Internet connection is unstable."
-                raise UnableToConnectException(exc_message,
-                                               TimeoutException(),
-                                               self._sa.logger).dbg()
+                self._raise_outage()
+            # Re-try the timed out articles, until they're all processed
+            # or they exhausted their re-tries.
+            self._retry_skipped(wait=True)
         finally:
             # Inform the number of scraped articles.
             self._sa.logger.info("{} out of {} articles were successfully scraped."
                                 "".format(len(self._newl_processed_articles),
-                                          len(links)), _lbr=True)
+                                          n_links), _lbr=True)
+
+    def _discover_sitemaps(self, sources: list):
+        """
+        Stream the articles' links from the sitemaps (urls or local paths,
+        gzipped or not), skipping the alien links and the articles that
+        did not change since they were scraped.
+
+        """
+        # NOTE : The unchanged revisited articles are not written again,
+        # hence they were last scraped when they were last seen.
+        scraped_times = self._hashes.with_last_seen(read_scraped_times(self._articles_path,
+                                                                       self._csv_sep))
+        discovered, unchanged = 0, 0
+        for source in sources:
+            self._sa.logger.info("Reading the sitemap {} ...".format(source))
+            for link, lastmod in iter_sitemap(source):
+                article_id = self._extract_ID(link)
+                if self._is_alien_link(link) or "/" in article_id:
+                    continue
+                # If the article was already processed, re-process it only
+                # if it was modified after being scraped.
+                if article_id in self._processed_articles:
+                    scraped_in = scraped_times.get(article_id)
+                    if lastmod is None or scraped_in is None or lastmod <= scraped_in:
+                        unchanged += 1
+                        continue
+                    self._processed_articles.discard(article_id)
+                discovered += 1
+                yield link
+        self._add_metadata({'discovered_articles': discovered,
+                            'unchanged_articles': unchanged})
+
+    def _process_sitemaps(self, sources: list):
+        """
+        Scrape the articles discovered from the sitemaps.
+
+        """
+        if isinstance(sources, str):
+            sources = [sources]
+        self._process_articles(self._discover_sitemaps(sources))
+
+    def _due_articles(self):
+        """
+        Yield the links of the articles to re-crawl, the most likely to
+        have changed first, within the re-crawl budget.
+
+        The articles scraped before the schedule existed are tracked
+        using their scraping date in the CSV file (or the last time they
+        were seen unchanged, if later).
+
+        """
+        # NOTE : The unchanged revisited articles are not written again,
+        # hence they were last scraped when they were last seen.
+        scraped_times = self._hashes.with_last_seen(read_scraped_times(self._articles_path,
+                                                                       self._csv_sep))
+        for article_id, scraped_in in scraped_times.items():
+            self._scheduler.track(article_id,
+                                  f"https://en.zalando.de/{article_id}.html",
+                                  scraped_in)
+        deadline = (time.time() + self._recrawl_time
+                    if self._recrawl_time else None)
+        due, revisited = self._scheduler.due(self._recrawl_budget), 0
+        self._sa.logger.info("{} articles to re-crawl (out of {} tracked)."
+                             "".format(len(due), len(self._scheduler)))
+        for article_id, link in due:
+            # Stop once the time budget is spent.
+            if deadline and time.time() > deadline:
+                self._sa.logger.info("The re-crawl time budget is spent.")
+                break
+            # Release the article, so that it can be processed again.
+            self._processed_articles.discard(article_id)
+            revisited += 1
+            yield link
+        self._add_metadata({'recrawled_articles': revisited})
+
+    def _process_recrawl(self):
+        """
+        Re-scrape the articles most likely to have changed since they
+        were scraped (their new rows replace the old ones).
+
+        """
+        self._process_articles(self._due_articles())
+
+    def _complete_articles(self):
+        """
+        Extract only the missing fields of the partially processed
+        articles, and save them once merged with their other fields.
+
+        """
+        # handle cookies
+        self._handle_cookies(get_link=True)
+        article_scraper = ArticleScraper(self._sa, field_retries=self._field_retries)
+        partial_articles = list(self._partial_articles.items())
+        self._sa.logger.info("{} partially processed articles to complete."
+                             "".format(len(partial_articles)))
+        for article_id, partial_details in partial_articles:
+            # Slow down (or wait) if the connection is unstable.
+            self._throttle()
+            link = partial_details['url']
+            self._sa.get(link)
+            try:
+                article_details = article_scraper.scrape(link, partial_details['missing_fields'])
+            except ArticleProcessingException as ap_e:
+                # If it timed out, keep it for the next completion.
+                if isinstance(ap_e.exc_error, TimeoutException):
+                    self._controller.failure()
+                    if self._controller.gave_up:
+                        self._raise_outage()
+                    continue
+                raise ap_e
+            self._controller.success()
+            # Merge the extracted fields with the previous ones.
+            completed_details = {field: value for field, value in partial_details.to_details().items()
+                                 if field != 'missing_fields'}
+            completed_details.update(article_details)
+            completed_details.update({'scraped_in': timer()})
+            self._save_article(article_id, completed_details)
 
     def scrape(self, how: str = 'all', links: list = []):
         """
@@ -586,6 +1543,26 @@ class Scraper():
         - If `'single'`, then only the articles whom link is
         specfied in `links` will be processed.
 
+        - If `'sitemap'`, then the articles discovered from the sitemaps
+        specified in `links` (urls or local paths, gzipped or not) are
+        processed, except the ones not modified since they were scraped.
+
+        - If `'recrawl'`, links is ignored, and the already scraped
+        articles are re-scraped, the most likely to have changed first,
+        within the re-crawl budget (`recrawl_budget` articles and/or
+        `recrawl_time` seconds).
+
+        - If `'pages'`, then only the listing pages from `links[0]` to
+        `links[-1]` (pages numbers) are processed.
+
+        - If `'complete'`, links is ignored, and only the missing fields
+        of the partially processed articles are extracted.
+
+        - If `'capture'`, links is ignored, and the articles are decoded
+        from the catalog/product JSON responses captured while walking
+        through the listing pages, without opening them.
+        NOTE : The assistant must be created with `capture=True`.
+
         """
         # Save the starting datetime.
         start_time, start_time_str = current_datetime()
@@ -595,12 +1572,36 @@ class Scraper():
         if how == 'single':
             process_func = self._process_articles
             args = [links]
+        elif how == 'sitemap':
+            process_func = self._process_sitemaps
+            args = [links]
+        elif how == 'recrawl':
+            process_func = self._process_recrawl
+            args = []
+        elif how == 'pages':
+            process_func = self._process_pages
+            args = [links]
+        elif how == 'complete':
+            process_func = self._complete_articles
+            args = []
+        elif how == 'capture':
+            self._network = NetworkCapture(self._sa)
+            process_func = self._process
+            args = [self._capture_page]
         else:
             process_func = self._process
             args = []
 
+        # If the parsing workers are enabled, the articles' page snapshots
+        # are parsed in worker processes.
+        pipeline = (SnapshotPipeline(self._parse_workers)
+                    if self._parse_workers
+                    else nullcontext())
+
         try:
-            process_func(*args)
+            # NOTE : Exiting the pipeline waits for the pending snapshots.
+            with pipeline as self._pipeline:
+                process_func(*args)
         # If the the exception is a KeyboardInterrupt, and it's already
         # handled raise the `KeyboardInterruptException` raised then.
         except KeyboardInterruptException as ki_e:
@@ -644,10 +1645,15 @@ class Scraper():
             raise ArticlesProcessingException(exc_message, wd_e,
                                               self._sa.logger)
         finally:
+            # Save the articles parsed after the last collection.
+            if self._pipeline:
+                self._collect_snapshots()
             # Save the finishing datetime
             end_time, end_time_str = current_datetime()
             self._add_metadata({'finished_at': end_time_str,
-                                'done_in': delta_datetime(start_time, end_time)})
+                                'done_in': delta_datetime(start_time, end_time),
+                                'connection': dict(self._controller.stats),
+                                'selectors': self._sa.selectors.stats()})
             self._sa.logger.info("Saving processed articles' data ...",
                                  _lbr=True, _rbr=True)
             self._save()
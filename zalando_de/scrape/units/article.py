@@ -16,6 +16,21 @@ from zalando_de.scrape.commun.exceptions import (UnableToOpenNewTabException,
 
 
 
+# The article's fields, in their extraction order.
+FIELDS = ('brand_name', 'article_name', 'price_label',
+          'available_colors', 'available_sizes', 'other_details')
+
+# The time (in seconds, times the assistant's pace) to wait for the size
+# picker before looking for the single size label.
+SIZE_PICKER_WAIT = 2
+
+# The errors for which a field's extraction is re-tried (the others
+# interrupt the article's processing).
+FIELD_ERRORS = (TimeoutException,
+                NoSuchElementException,
+                StaleElementReferenceException)
+
+
 class DeadScraperAssistantError(Exception):
     """
     An exception to handle browser closing errors,
@@ -35,9 +50,15 @@ class ArticleScraper():
     browser_close_exc_msg = "disconnected: not connected to DevTools"
 
     def __init__(self, assistant,
-                 article_element = None) -> None:
+                 article_element = None,
+                 field_retries: int = 1) -> None:
         self._sa: ScraperAssistant = self._validate_assistant(assistant)
         self._article_element = article_element
+        # The number of re-tries of each field's extraction.
+        self._field_retries = field_retries
+        # The article's details container, and its x-wrapper one.
+        self._container = None
+        self._x_wrapper = None
 
     def __enter__(self):
         # Open a new tab to handle the article.
@@ -138,33 +159,29 @@ class ArticleScraper():
         Get the article's details container.
         
         """
-        return self._sa._get_element_by_class('DT5BTM VHXqc_ rceRmQ _4NtqZU mIlIve')
+        return self._sa._find('container')
 
     def _get_brand_name(self, _from = None):
         """
         Get the article brand.
 
         """
-        # Class names for brand element.
-        class_names = 'SZKKsK mt1kvu FxZV-M pVrzNP _5Yd-hZ'
         # Get the brand name
-        return self._sa._get_element_value_by_class(class_names, _from)
+        return self._sa._find_value('brand_name', _from)
     
     def _get_name(self, _from = None):
         """
         Get the article's name
 
         """
-        class_names = 'EKabf7 R_QwOV'
-        return self._sa._get_element_value_by_class(class_names, _from)
+        return self._sa._find_value('article_name', _from)
     
     def _get_price(self, _from = None):
         """
         Get the price label of the article.
 
         """
-        class_names = '_0xLoFW _78xIQ-'
-        price_label: str = self._sa._get_element_value_by_class(class_names, _from)
+        price_label: str = self._sa._find_value('price', _from)
         return price_label.replace('\n', ' | ')
 
     def _get_colors(self, _from = None):
@@ -174,16 +191,17 @@ class ArticleScraper():
         """
         # Get the element of color section
         # color_section = self._sa._get_element_by_class('SXSnE1 _8O8c-d')
-        # Get displayed color.
-        curr_displayed_color = self._sa._get_element_by_class('_0Qm8W1 u-6V88 dgII7d pVrzNP zN9KaA',
-                                                              _from).text
         colors = []
-        # get all colors items
-        all_colors = self._sa._get_elements_by_class('pl0w2g DT5BTM A-NCMf', _from)
+        # get all colors items (the color picker may be missing).
+        all_colors = self._sa._find_all('colors', _from, required=False)
         # If no color was found in this section, return the currently
-        # displayed color.
+        # displayed color (which is then required : without it, the
+        # colors are not rendered yet, and hence missing).
         if not all_colors:
-            return [curr_displayed_color]
+            displayed_color = self._sa._find_value('displayed_color', _from)
+            if not displayed_color:
+                raise NoSuchElementException("The displayed color is empty.")
+            return [displayed_color]
         # Iterate over all colors elements and get the alt
         # attribute of the img tag in each.
         for color_element in all_colors:
@@ -202,8 +220,21 @@ class ArticleScraper():
         Get the list all the available sizes of the article.
         
         """
-        # Get the select-button used to select sizes
-        size_picker = self._sa._get_element_by_id('picker-trigger')
+        # Get the select-button used to select sizes (the articles with
+        # a single size have none), giving it a moment to be rendered.
+        size_picker = self._sa._get_element_by_id('picker-trigger', required=False,
+                                                  wait=SIZE_PICKER_WAIT * self._sa.pace)
+        if size_picker is None:
+            # The article has a single size only if the page is rendered
+            # (its price is shown) and the single size is labelled,
+            # otherwise the sizes are not rendered yet (and hence missing).
+            if (self._sa._find('price', _from, required=False) is None
+                    or self._sa._find('single_size', _from, required=False) is None):
+                raise NoSuchElementException("Neither the size picker nor the "
+                                             "single size label was found.")
+            self._sa.logger.info("No size picker found, the article has "
+                                 "a single size.")
+            return {}
         # and click it.
         self._sa._move_mouse_to_and_click(size_picker)
         # MH : sleep for 1 second
@@ -211,25 +242,21 @@ class ArticleScraper():
         # Get all sizes and their availability.
         sizes = {}
         # get all sizes
-        all_sizes = self._sa._get_elements_by_class('fOd40J _0xLoFW JT3_zV FCIprz LyRfpJ')
+        all_sizes = self._sa._find_all('sizes')
         # Iterate over all sizes and extract the availability
         # and the label of each.
         for size_element in all_sizes:
             # Get availability label : can be "Notify Me", "Only x left", or ""
-            availability_label = self._sa._get_element_value_by_class('nXkCf3', size_element)
+            availability_label = self._sa._find_value('size_availability', size_element)
             # NOTE: Sometimes the price depends on the size,
             # and therefor for each a specific price is shown.
-            # Try to get the price if it's present for the current size.
-            try: 
-                price_label = self._sa._get_element_value_by_class('_0Qm8W1 u-6V88 FxZV-M pVrzNP ra-RRD',
-                                                                   size_element)
-            except:
-                price_label = ""
+            # Get the price if it's present for the current size.
+            price_label = self._sa._find_value('size_price', size_element, required=False)
             # get the size label
-            class_names = ('_0Qm8W1 _7Cm1F9 dgII7d pVrzNP'
-                           if availability_label != "Notify Me"
-                           else '_0Qm8W1 _7Cm1F9 dgII7d D--idb')
-            size_label = self._sa._get_element_value_by_class(class_names, size_element)
+            selector = ('size_label'
+                        if availability_label != "Notify Me"
+                        else 'size_label_unavailable')
+            size_label = self._sa._find_value(selector, size_element)
             # Append the size to sizes.
             sizes.update({size_label: {'count': availability_label,
                                        'price': price_label}})
@@ -248,7 +275,7 @@ class ArticleScraper():
         
         """
         # Get the details elements.
-        details_items = self._sa._get_elements_by_class('y4Yt_f NN8L-8 JT3_zV MxUWj-', _from)
+        details_items = self._sa._find_all('details_items', _from)
         # Initiate the details dictionary to each detail with
         # its entries.
         details = {}
@@ -259,13 +286,11 @@ class ArticleScraper():
             # - Fit & Size
             # - Material & Care
             # - Details
-            item_name = self._sa._get_element_value_by_class('JCuRr_', item_element)
+            item_name = self._sa._find_value('details_name', item_element)
             # Get the key of each entry in details item
-            item_keys = self._sa._get_elements_by_class('_0Qm8W1 u-6V88 dgII7d pVrzNP zN9KaA',
-                                                    item_element)
+            item_keys = self._sa._find_all('details_key', item_element)
             # Get the value of each entry in details item
-            item_vals = self._sa._get_elements_by_class('_0Qm8W1 u-6V88 FxZV-M pVrzNP zN9KaA',
-                                                    item_element)
+            item_vals = self._sa._find_all('details_value', item_element)
             # Iterate over the keys and values and concatenate them in
             item_entries = {}
             # ... dictionary.
@@ -279,10 +304,60 @@ class ArticleScraper():
         # Finally, return the found deatils
         return details
 
-    def _scrape(self, url: str = None):
+    def _locate_containers(self):
+        """
+        Get the article's details container, and the x-wrapper-re-1-4
+        container in it.
+
+        """
+        self._container = self._get_container()
+        self._x_wrapper = self._sa._get_element_by_tag_name('x-wrapper-re-1-4',
+                                                            self._container)
+
+    def _field_getters(self):
+        """
+        Get the function extracting each field.
+
+        """
+        return {'brand_name': lambda: self._get_brand_name(_from=self._x_wrapper),
+                'article_name': lambda: self._get_name(_from=self._x_wrapper),
+                'price_label': lambda: self._get_price(_from=self._x_wrapper),
+                'available_colors': lambda: self._get_colors(_from=self._x_wrapper),
+                'available_sizes': lambda: self._get_sizes(_from=self._container),
+                'other_details': lambda: self._get_extra_details(_from=self._container)}
+
+    def _extract(self, field: str, getter):
+        """
+        Extract a field, re-trying it in place (with the containers
+        located again) up to `field_retries` times.
+
+        Return the (value, error) of the field, where the value is None
+        if it failed, and the error is None if it succeeded.
+
+        """
+        error = None
+        for attempt in range(self._field_retries + 1):
+            try:
+                # NOTE : Locating the containers again may fail too, in
+                # which case the field is re-tried (or missing).
+                if attempt > 0:
+                    self._sa._sleep_t_sec(.5)
+                    self._locate_containers()
+                return getter(), None
+            except FIELD_ERRORS as e:
+                error = e
+                self._sa.logger.debug("The field {} failed (attempt {}) : {}"
+                                      "".format(field, attempt + 1, type(e).__name__))
+        return None, error
+
+    def _scrape(self, url: str = None, fields: list = None):
         """
         Get all details of the article displayed in the current
-        browser.
+        browser (or only the specified `fields`).
+
+        Each field is extracted (and re-tried) on its own : the fields
+        that still failed are set to None, and listed in the details'
+        `missing_fields`. If all of them failed, the last error is raised.
         
         `url` parameter is used only for logging.
 
@@ -291,69 +366,98 @@ class ArticleScraper():
         st_msg = ("Processing new article started{}"
                   "".format(f" {url}" if url else "."))
         self._sa.logger.info(st_msg)
-        # Get the article container.
-        article_container = self._get_container()
-        # Get the data in x-wrapper-re-1-4 container.
-        x_wrapper_container = self._sa._get_element_by_tag_name('x-wrapper-re-1-4',
-                                                                article_container)
-        # The name of the brand
-        brand_name = self._get_brand_name(_from=x_wrapper_container)
-        self._sa.logger.debug('Brand name found : {}'.format(brand_name))
-        # The name of the article 
-        article_name = self._get_name(_from=x_wrapper_container)
-        self._sa.logger.debug('Article name found : {}'.format(article_name))
-        # The price label (it may be in format : from $xx)
-        price_label = self._get_price(_from=x_wrapper_container)
-        self._sa.logger.debug('Price found : {}'.format(price_label))
-        # All the available colors
-        available_colors = self._get_colors(_from=x_wrapper_container)
-        self._sa.logger.debug('Colors found : {}'.format(available_colors))
-        # All available sizes
-        available_sizes = self._get_sizes(_from=article_container)
-        self._sa.logger.debug('Sizes found : {}'.format(available_sizes))
-        # The other details : Fit & Size, Material & Care, and Details
-        other_details = self._get_extra_details(_from=article_container)
-        self._sa.logger.debug('Extra details found : {}'.format(other_details))
-        # Concatenate the details into one dictionary
-        article_details = {'brand_name': brand_name,
-                           'article_name': article_name,
-                           'price_label': price_label,
-                           'available_sizes': available_sizes,
-                           'available_colors': available_colors,
-                           'other_details': other_details}
+        # Get the article's containers.
+        self._locate_containers()
+        # Extract the fields.
+        getters = self._field_getters()
+        article_details, missing_fields, error = {}, [], None
+        for field in (fields or FIELDS):
+            value, field_error = self._extract(field, getters[field])
+            if field_error is not None:
+                error = field_error
+                missing_fields.append(field)
+            else:
+                self._sa.logger.debug('{} found : {}'.format(field, value))
+            article_details.update({field: value})
+        # If no field was extracted, the article failed.
+        if len(missing_fields) == len(article_details):
+            raise error
+        # Flag the partial article.
+        if missing_fields:
+            self._sa.logger.warn("Partially processed (missing : {})."
+                                 "".format(", ".join(missing_fields)))
+            article_details.update({'missing_fields': missing_fields})
         # Inform the end of processing the article.
-        self._sa.logger.info("Finished successfully.")
+        else:
+            self._sa.logger.info("Finished successfully.")
         # Return the details
         return article_details
     
-    def scrape(self, url: str = None):
+    def _snapshot(self, url: str = None):
+        """
+        Get a snapshot (page source) of the article displayed in the
+        current browser, to be parsed later.
+
+        `url` parameter is used only for logging.
+
+        """
+        self._sa.logger.info("Taking a snapshot of the article{}"
+                             "".format(f" {url}" if url else "."))
+        # Wait the article's container to be present.
+        self._get_container()
+        # Open the size picker (if any), so that the sizes are rendered.
+        size_picker = self._sa._get_element_by_id('picker-trigger', required=False)
+        if size_picker is not None:
+            self._sa._move_mouse_to_and_click(size_picker)
+            self._sa._sleep_t_sec()
+        # Take the snapshot.
+        return self._sa.driver.page_source
+
+    def snapshot(self, url: str = None):
+        """
+        Get a snapshot (page source) of the article displayed in the
+        current browser, to be parsed later.
+
+        """
+        try: return self._snapshot(url)
+        except BaseException as e:
+            self._raise_processing_exception(e)
+
+    def scrape(self, url: str = None, fields: list = None):
         """
         Get all details of the article displayed in the current
-        browser.
+        browser (or only the specified `fields`).
         
         """
-        try: return self._scrape(url)
-        # Catch the timeout exception that may raised
-        # if the new tab took too much time to be loaded.
-        except TimeoutException as e:
+        try: return self._scrape(url, fields)
+        except BaseException as e:
+            self._raise_processing_exception(e)
+
+    def _raise_processing_exception(self, e: BaseException):
+        """
+        Raise the `ArticleProcessingException` (or the
+        `KeyboardInterruptException`) corresponding to `e`.
+
+        """
+        # If it's a timeout exception, that may be raised if the
+        # new tab took too much time to be loaded, skip the article.
+        if isinstance(e, TimeoutException):
             # Log the trace to show the skipping cause.
             raise ArticleProcessingException("Skipped (Time out).",
                                              e, self._sa.logger).dbg()
-        # Catch any other exceptions, and raise a
-        # `ArticleProcessingException` exception.
-        except BaseException as e:
-            if isinstance(e, KeyboardInterrupt):
-                exc_message = "Processing forcibly stopped using CTR + C."
-                raise KeyboardInterruptException(exc_message, e,
-                                                 self._sa.logger).dbg()
-            elif isinstance(e, NoSuchWindowException):
-                exc_message = ("Probably due to forcibly close "
-                               "the Article's window.")
-            elif isinstance(e, WebDriverException):
-                exc_message = ("An unexpected Web Driver Exception "
-                               "raised. Probably due to forcibly close "
-                               "the browser.")
-            else:
-                exc_message = "Unexpected error."
-            raise ArticleProcessingException(exc_message, e,
+        # Otherwise, raise a `ArticleProcessingException` exception.
+        if isinstance(e, KeyboardInterrupt):
+            exc_message = "Processing forcibly stopped using CTR + C."
+            raise KeyboardInterruptException(exc_message, e,
                                              self._sa.logger).dbg()
+        elif isinstance(e, NoSuchWindowException):
+            exc_message = ("Probably due to forcibly close "
+                           "the Article's window.")
+        elif isinstance(e, WebDriverException):
+            exc_message = ("An unexpected Web Driver Exception "
+                           "raised. Probably due to forcibly close "
+                           "the browser.")
+        else:
+            exc_message = "Unexpected error."
+        raise ArticleProcessingException(exc_message, e,
+                                         self._sa.logger).dbg()
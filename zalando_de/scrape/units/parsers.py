@@ -0,0 +1,305 @@
+from html.parser import HTMLParser
+
+from zalando_de.scrape.commun.cleaners import Cleaner
+from zalando_de.scrape.commun.selectors import DEFAULT_SELECTORS
+
+
+# The elements that have no closing tag.
+VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                 'link', 'meta', 'source', 'track', 'wbr'}
+
+# The elements whose content is not visible text.
+HIDDEN_ELEMENTS = {'script', 'style', 'template', 'noscript'}
+
+# The elements whose text content is serialized as is (not escaped).
+RAW_TEXT_ELEMENTS = {'style', 'script', 'xmp', 'iframe', 'noembed',
+                     'noframes', 'plaintext', 'noscript'}
+
+
+def _escape(text: str, attribute: bool = False):
+    """
+    Escape a text (or an attribute's value) as the browser does when
+    serializing the HTML (e.g. `innerHTML`).
+
+    """
+    text = text.replace('&', '&amp;').replace('\xa0', '&nbsp;')
+    if attribute:
+        return text.replace('"', '&quot;')
+    return text.replace('<', '&lt;').replace('>', '&gt;')
+
+
+class Comment(str):
+
+    """
+    A comment of a parsed HTML document (kept to serialize the HTML,
+    but not part of the text).
+
+    """
+
+
+class Node():
+
+    """
+    A lightweight element of a parsed HTML document.
+
+    """
+
+    __slots__ = ('tag', 'attrs', 'classes', 'children', 'parent')
+
+    def __init__(self, tag: str, attrs: dict = None, parent = None) -> None:
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.classes = frozenset(self.attrs.get('class', '').split())
+        self.children = []
+        self.parent = parent
+
+    def has_classes(self, classes: frozenset):
+        return classes <= self.classes
+
+    def iter(self):
+        """
+        Iterate over all the descendant elements (depth first).
+
+        """
+        pending = list(reversed(self.children))
+        while pending:
+            child = pending.pop()
+            if isinstance(child, Node):
+                yield child
+                pending.extend(reversed(child.children))
+
+    def find_all(self, class_names: str = None, tag: str = None):
+        """
+        Get all the descendant elements having all `class_names`
+        (and the tag name `tag`, if specified).
+
+        """
+        classes = frozenset((class_names or '').split())
+        return [node for node in self.iter()
+                if node.has_classes(classes) and (tag is None or node.tag == tag)]
+
+    def find(self, class_names: str = None, tag: str = None):
+        """
+        Get the first descendant element having all `class_names`
+        (and the tag name `tag`, if specified), or None.
+
+        """
+        classes = frozenset((class_names or '').split())
+        for node in self.iter():
+            if node.has_classes(classes) and (tag is None or node.tag == tag):
+                return node
+        return None
+
+    def text_parts(self):
+        """
+        Get the visible text chunks of the element.
+
+        """
+        if self.tag in HIDDEN_ELEMENTS:
+            return []
+        parts = []
+        for child in self.children:
+            if isinstance(child, Node):
+                parts.extend(child.text_parts())
+            elif not isinstance(child, Comment) and child.strip():
+                parts.append(child.strip())
+        return parts
+
+    @property
+    def text(self):
+        """
+        The visible text of the element, with a new line between
+        each chunk (close to the browser's `innerText`).
+
+        """
+        return '\n'.join(self.text_parts())
+
+    @property
+    def outer_html(self):
+        """
+        The element serialized as the browser's `outerHTML`.
+
+        """
+        attrs = ''.join(' {}="{}"'.format(name, _escape(value, attribute=True))
+                        for name, value in self.attrs.items())
+        if self.tag in VOID_ELEMENTS:
+            return f"<{self.tag}{attrs}>"
+        return f"<{self.tag}{attrs}>{self.inner_html}</{self.tag}>"
+
+    @property
+    def inner_html(self):
+        """
+        The HTML content of the element, serialized as the browser's
+        `innerHTML`.
+
+        """
+        parts = []
+        for child in self.children:
+            if isinstance(child, Node):
+                parts.append(child.outer_html)
+            elif isinstance(child, Comment):
+                parts.append(f"<!--{child}-->")
+            elif self.tag in RAW_TEXT_ELEMENTS:
+                parts.append(child)
+            else:
+                parts.append(_escape(child))
+        return ''.join(parts)
+
+
+class _TreeBuilder(HTMLParser):
+
+    """
+    Build a tree of :class:`Node` from an HTML document.
+
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root = Node('#document')
+        self._current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, {name: value or '' for name, value in attrs}, self._current)
+        self._current.children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self._current = node
+
+    def handle_startendtag(self, tag, attrs):
+        node = Node(tag, {name: value or '' for name, value in attrs}, self._current)
+        self._current.children.append(node)
+
+    def handle_endtag(self, tag):
+        # Close the nearest opened element with the same tag (the
+        # unclosed elements in between are implicitly closed).
+        node = self._current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self._current = node.parent
+
+    def handle_data(self, data):
+        self._current.children.append(data)
+
+    def handle_comment(self, data):
+        self._current.children.append(Comment(data))
+
+
+def parse_html(html: str):
+    """
+    Parse an HTML document, and return its root :class:`Node`.
+
+    """
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+class ArticleParser():
+
+    """
+    Extract the details of an article from a snapshot of its page
+    (`driver.page_source`), in the same format as :class:`ArticleScraper`.
+
+    NOTE : The sizes are rendered only when the size picker is opened,
+    hence the snapshot must be taken after opening it.
+
+    """
+
+    def __init__(self, html: str, selectors: dict = None) -> None:
+        self._root = parse_html(html)
+        # The fields' class names, and their fallbacks.
+        self._selectors = selectors or DEFAULT_SELECTORS
+
+    def _find_all(self, name: str, _from: Node):
+        """
+        Get the elements of the field `name`, using the first of its
+        selectors that matches.
+
+        """
+        for class_names in self._selectors[name]:
+            nodes = _from.find_all(class_names)
+            if nodes:
+                return nodes
+        return []
+
+    def _find(self, name: str, _from: Node):
+        nodes = self._find_all(name, _from)
+        return nodes[0] if nodes else None
+
+    def _get_container(self):
+        container = self._find('container', self._root)
+        if container is None:
+            raise ValueError("The article's details container was not found.")
+        return container
+
+    def _value(self, name: str, _from: Node):
+        node = self._find(name, _from)
+        return node.text if node else ""
+
+    def _get_colors(self, _from: Node):
+        colors = []
+        for color_element in self._find_all('colors', _from):
+            img = color_element.find(tag='img')
+            if img is not None:
+                colors.append(img.attrs.get('alt', ''))
+        # If no color was found, return the currently displayed one.
+        if not colors:
+            return [self._value('displayed_color', _from)]
+        return colors
+
+    def _get_sizes(self):
+        sizes = {}
+        for size_element in self._find_all('sizes', self._root):
+            availability_label = self._value('size_availability', size_element)
+            price_label = self._value('size_price', size_element)
+            selector = ('size_label'
+                        if availability_label != "Notify Me"
+                        else 'size_label_unavailable')
+            size_label = self._value(selector, size_element)
+            sizes.update({size_label: {'count': availability_label,
+                                       'price': price_label}})
+        return sizes
+
+    def _get_extra_details(self, _from: Node):
+        details = {}
+        for item_element in self._find_all('details_items', _from):
+            item_name = self._value('details_name', item_element)
+            item_keys = self._find_all('details_key', item_element)
+            item_vals = self._find_all('details_value', item_element)
+            # NOTE : The entries are the elements' HTML content, as
+            # the driver's (see :meth:`ArticleScraper._get_extra_details`).
+            details.update({item_name: {key.inner_html.replace(':', ''): value.inner_html
+                                        for key, value in zip(item_keys, item_vals)}})
+        return details
+
+    def parse(self):
+        """
+        Get all details of the article.
+
+        """
+        article_container = self._get_container()
+        x_wrapper_container = (article_container.find(tag='x-wrapper-re-1-4')
+                               or article_container)
+        price_label = self._value('price', x_wrapper_container)
+        return {'brand_name': self._value('brand_name', x_wrapper_container),
+                'article_name': self._value('article_name', x_wrapper_container),
+                'price_label': price_label.replace('\n', ' | '),
+                'available_sizes': self._get_sizes(),
+                'available_colors': self._get_colors(x_wrapper_container),
+                'other_details': self._get_extra_details(article_container)}
+
+
+def parse_and_clean(html: str, url: str, scraped_in: str,
+                    selectors: dict = None):
+    """
+    Parse an article's page snapshot, and clean its details.
+
+    Intended to be executed in a worker process. Return both the
+    (uncleaned) details and the cleaned ones.
+
+    """
+    article_details = ArticleParser(html, selectors).parse()
+    article_details.update({'url': url,
+                            'scraped_in': scraped_in})
+    return article_details, Cleaner().clean(article_details)
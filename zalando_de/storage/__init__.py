@@ -0,0 +1 @@
+from zalando_de.storage.merge import merge_csv
@@ -0,0 +1,81 @@
+import pandas as pd
+
+
+# The default number of rows per batch.
+BATCH_SIZE = 1000
+
+
+class ColumnBuffer():
+
+    """
+    A context manager to accumulate the cleaned articles' rows into
+    per-column buffers, with a tracked schema (the columns, in order :
+    the initial ones, then the new ones as they're met, backfilled with
+    None for the buffered rows), and to flush them as a dataframe to
+    the `sink` every `batch_size` rows.
+
+    Hence the dataframes are built column-wise, and their size (and the
+    peak memory) grows with the batch size, not with the run's size.
+
+    """
+
+    def __init__(self, columns: list, sink, batch_size: int = BATCH_SIZE) -> None:
+        self.columns = []
+        self._sink = sink
+        self._batch_size = batch_size
+        self._buffers = {}
+        self._rows = 0
+        self.written = 0
+        self.add_columns(columns)
+
+    def __len__(self):
+        return self._rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        # NOTE : The buffered rows are not flushed on errors.
+        if exc_type is None:
+            self.close()
+
+    def add_columns(self, columns):
+        """
+        Add the new columns to the schema.
+
+        """
+        for column in columns:
+            if column not in self._buffers:
+                self.columns.append(column)
+                self._buffers[column] = [None] * self._rows
+
+    def append(self, row: dict):
+        """
+        Buffer a row, and flush the batch once it's full.
+
+        """
+        if row.keys() - self._buffers.keys():
+            self.add_columns(row)
+        for column, buffer in self._buffers.items():
+            buffer.append(row.get(column))
+        self._rows += 1
+        if self._rows >= self._batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Flush the buffered rows to the sink (as a dataframe).
+
+        """
+        if not self._rows:
+            return 0
+        frame = pd.DataFrame(self._buffers, columns=self.columns)
+        self._sink(frame)
+        flushed = self._rows
+        self._buffers = {column: [] for column in self.columns}
+        self._rows = 0
+        self.written += flushed
+        return flushed
+
+    def close(self):
+        self.flush()
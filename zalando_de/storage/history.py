@@ -0,0 +1,175 @@
+import argparse
+import itertools
+import json
+import sqlite3
+import time
+
+from zalando_de.storage.schema import is_missing
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS points (
+    id TEXT NOT NULL,
+    observed_at INTEGER NOT NULL,
+    price REAL,
+    sold INTEGER,
+    sizes TEXT,
+    PRIMARY KEY (id, observed_at)
+) WITHOUT ROWID;
+"""
+
+# The default number of points written per transaction.
+BATCH_SIZE = 500
+# The default age (in seconds) of the points to compact, and the
+# resolution (in seconds) they're compacted to : a point per day.
+COMPACT_AFTER = 30 * 24 * 3600
+COMPACT_RESOLUTION = 24 * 3600
+
+
+class HistoryStore():
+
+    """
+    A context manager to store the history of the articles' price,
+    discount, and per-size availability into a SQLite database : a
+    point is written only when one of them changed since the article's
+    last point (each point holds until the next one), hence the storage
+    grows with the articles' changes, not with the crawls.
+
+    The old points are compacted (see :meth:`compact`).
+
+    """
+
+    def __init__(self, path: str, batch_size: int = BATCH_SIZE) -> None:
+        self.path = path
+        self._batch_size = batch_size
+        # NOTE : The store is used by a single scraper, which may run
+        # in another thread than the one it was created in.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode = WAL;")
+        self._connection.executescript(SCHEMA)
+        # The last values of each article (to detect the changes), and
+        # the points to write.
+        self._last = {article_id: (price, sold, sizes)
+                      for article_id, price, sold, sizes, _ in
+                      self._connection.execute("SELECT id, price, sold, sizes, "
+                                               "MAX(observed_at) FROM points "
+                                               "GROUP BY id;")}
+        self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+    def record(self, article_id: str, price: float, sold: int, sizes: dict,
+               observed_at: float = None):
+        """
+        Record the article's price, discount, and sizes' availability
+        ({size: availability label}) observed at `observed_at` (now by
+        default).
+
+        Return True if they changed (i.e. a point is written).
+
+        """
+        values = (None if is_missing(price) else float(price),
+                  None if is_missing(sold) else int(sold),
+                  json.dumps(sizes or {}, sort_keys=True, ensure_ascii=False))
+        if self._last.get(article_id) == values:
+            return False
+        self._last[article_id] = values
+        self._pending.append((article_id, int(observed_at or time.time())) + values)
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+        return True
+
+    def flush(self):
+        """
+        Write the pending points.
+
+        """
+        if not self._pending:
+            return 0
+        with self._connection:
+            # NOTE : A second change in the same second replaces the first.
+            self._connection.executemany("INSERT OR REPLACE INTO points "
+                                         "(id, observed_at, price, sold, sizes) "
+                                         "VALUES (?, ?, ?, ?, ?);", self._pending)
+        flushed, self._pending = len(self._pending), []
+        return flushed
+
+    def points(self, article_id: str):
+        """
+        Get the article's points, from the oldest one.
+
+        """
+        self.flush()
+        return [{'observed_at': observed_at, 'price': price, 'sold': sold,
+                 'sizes': json.loads(sizes)}
+                for observed_at, price, sold, sizes in
+                self._connection.execute("SELECT observed_at, price, sold, sizes "
+                                         "FROM points WHERE id = ? "
+                                         "ORDER BY observed_at;", (article_id,))]
+
+    def compact(self, older_than: float = COMPACT_AFTER,
+                resolution: float = COMPACT_RESOLUTION):
+        """
+        Compact the points older than `older_than` seconds : keep only
+        the last point of each article per `resolution` seconds, then
+        drop the points that no longer differ from their previous one.
+
+        Return the number of deleted points.
+
+        """
+        self.flush()
+        cutoff = int(time.time() - older_than)
+        rows = self._connection.execute("SELECT id, observed_at, price, sold, sizes "
+                                        "FROM points ORDER BY id, observed_at;")
+        deleted = []
+        for _, points in itertools.groupby(rows, key=lambda row: row[0]):
+            points = list(points)
+            # Keep the last old point of each period.
+            kept = []
+            for point, following in zip(points, points[1:] + [None]):
+                if (following is not None and
+                        point[1] < cutoff and following[1] < cutoff and
+                        point[1] // resolution == following[1] // resolution):
+                    deleted.append(point[:2])
+                else:
+                    kept.append(point)
+            # Drop the old points repeating their previous one.
+            for previous, point in zip(kept, kept[1:]):
+                if point[1] < cutoff and point[2:] == previous[2:]:
+                    deleted.append(point[:2])
+        with self._connection:
+            self._connection.executemany("DELETE FROM points WHERE id = ? "
+                                         "AND observed_at = ?;", deleted)
+        return len(deleted)
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description=("Compact the price and "
+                                                  "availability history."))
+    parser.add_argument('path', type=str,
+                        help="Specifies the history SQLite database.")
+    parser.add_argument('--older_than', type=float, default=COMPACT_AFTER / 3600 / 24,
+                        help="Specifies the age (in days) of the points to compact.")
+    parser.add_argument('--resolution', type=float, default=COMPACT_RESOLUTION / 3600,
+                        help="Specifies the compacted points' resolution (in hours).")
+    return parser.parse_args()
+
+
+def run():
+    args = parse_arguments()
+    with HistoryStore(args.path) as store:
+        deleted = store.compact(args.older_than * 24 * 3600, args.resolution * 3600)
+    print("{} points compacted from {}".format(deleted, args.path))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(run())
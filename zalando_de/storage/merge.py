@@ -0,0 +1,134 @@
+import argparse
+import csv
+import heapq
+import itertools
+import os
+import sys
+import tempfile
+
+from zalando_de.storage.schema import ID_COLNAME, DATE_COLNAME, scraped_time
+from zalando_de.utils.compression import open_input
+
+
+# The default number of rows sorted in memory at once.
+CHUNK_ROWS = 100000
+
+# NOTE : The articles' details may be longer than the default limit.
+csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+
+
+def read_columns(paths: list, sep: str = ","):
+    """
+    Get the union of the CSV files' columns, in the order they first
+    appear (reading only their headers).
+
+    """
+    columns = [ID_COLNAME]
+    for path in paths:
+        with open_input(path, newline='') as cf:
+            header = next(csv.reader(cf, delimiter=sep), [])
+        columns.extend(column for column in header if column not in columns)
+    return columns
+
+
+def _sort_key(row: list):
+    # The rows are sorted by ID, then the newest first (and for the same
+    # scrape date, the one from the last file first).
+    return row[0], -row[1], -row[2]
+
+
+def _write_run(rows: list, directory: str, index: int):
+    """
+    Sort a chunk of rows, and write it to a temporary run file.
+
+    """
+    rows.sort(key=_sort_key)
+    path = os.path.join(directory, f"run_{index}.csv")
+    with open(path, 'w', encoding='utf-8', newline='') as rf:
+        writer = csv.writer(rf)
+        writer.writerows(rows)
+    return path
+
+
+def _read_run(path: str):
+    with open(path, 'r', encoding='utf-8', newline='') as rf:
+        for row in csv.reader(rf):
+            row[1], row[2] = float(row[1]), int(row[2])
+            yield row
+
+
+def merge_csv(paths: list, output_path: str, sep: str = ",",
+              chunk_rows: int = CHUNK_ROWS):
+    """
+    Merge the articles' CSV files (e.g. of several runs or workers) into
+    `output_path` : the columns are the union of theirs, and each article
+    is kept once, with its newest scrape date.
+
+    The rows are sorted in chunks of `chunk_rows` rows (written to
+    temporary run files), which are then merged, so the memory does not
+    grow with the files' size.
+
+    NOTE : The rows without an ID can't be told apart, hence they're all
+    kept as is (written first).
+
+    Return the number of rows written : the (distinct) articles, and
+    the rows without an ID.
+
+    """
+    columns = read_columns(paths, sep)
+    written = 0
+    with tempfile.TemporaryDirectory() as directory:
+        with open(output_path, 'w', encoding='utf-8', newline='') as of:
+            writer = csv.writer(of, delimiter=sep)
+            writer.writerow(columns)
+            # Sort the rows in chunks. Each row is saved as : its ID, its
+            # scrape time, its file's index, then the values of all the columns.
+            runs, chunk = [], []
+            for file_index, path in enumerate(paths):
+                with open_input(path, newline='') as cf:
+                    for record in csv.DictReader(cf, delimiter=sep):
+                        values = [record.get(column) or '' for column in columns]
+                        if not values[0].strip():
+                            writer.writerow(values)
+                            written += 1
+                            continue
+                        chunk.append([values[0],
+                                      scraped_time(record.get(DATE_COLNAME), float('-inf')),
+                                      file_index] + values)
+                        if len(chunk) >= chunk_rows:
+                            runs.append(_write_run(chunk, directory, len(runs)))
+                            chunk = []
+            if chunk:
+                runs.append(_write_run(chunk, directory, len(runs)))
+            # Merge the runs, and keep the first (newest) row of each ID.
+            merged = heapq.merge(*[_read_run(run) for run in runs], key=_sort_key)
+            for _, rows in itertools.groupby(merged, key=lambda row: row[0]):
+                writer.writerow(next(rows)[3:])
+                written += 1
+    return written
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description=("Merge articles' CSV files, "
+                                                  "keeping the newest row of "
+                                                  "each article."))
+    parser.add_argument('output', type=str,
+                        help="Specifies the merged CSV file.")
+    parser.add_argument('inputs', type=str, nargs='+',
+                        help="Specifies the CSV files to merge.")
+    parser.add_argument('--sep', type=str, default=",",
+                        help="Specifies the CSV files' separator.")
+    parser.add_argument('--chunk_rows', type=int, default=CHUNK_ROWS,
+                        help="Specifies the number of rows sorted in memory at once.")
+    return parser.parse_args()
+
+
+def run():
+    args = parse_arguments()
+    written = merge_csv(args.inputs, args.output, args.sep, args.chunk_rows)
+    print("{} rows merged into {}".format(written, args.output))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(run())
@@ -0,0 +1,197 @@
+import os
+import time
+
+# Handle import error on pyarrow module.
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    pyarrow_imported = True
+except ImportError:
+    pa = pq = None
+    pyarrow_imported = False
+
+from zalando_de.storage.schema import CORE_COLUMNS, DATE_COLNAME, is_missing, scraped_time
+
+
+# The partitioning column (a directory per scrape day).
+PARTITION_COLNAME = 'scrape_day'
+
+# The default number of articles per row group.
+BATCH_SIZE = 1000
+
+
+def _require_pyarrow():
+    if not pyarrow_imported:
+        raise ImportError("The Parquet backend requires pyarrow "
+                          "(pip install pyarrow).")
+
+
+def articles_schema():
+    """
+    The articles' Parquet schema : the typed core columns, and the
+    dynamic entries ('Material & care', 'Size & fit', and 'Details')
+    as a single map column.
+
+    """
+    _require_pyarrow()
+    return pa.schema([pa.field('id', pa.string(), nullable=False),
+                      pa.field('url', pa.string()),
+                      pa.field('brand', pa.dictionary(pa.int32(), pa.string())),
+                      pa.field('name', pa.string()),
+                      pa.field('price', pa.float64()),
+                      pa.field('sold', pa.int32()),
+                      pa.field('sizes', pa.list_(pa.string())),
+                      pa.field('colors', pa.list_(pa.string())),
+                      pa.field('details', pa.map_(pa.string(), pa.string())),
+                      pa.field('scraped_in', pa.timestamp('s', tz='UTC'))])
+
+
+def _split(value: str, sep: str = ';'):
+    if is_missing(value) or value == '':
+        return []
+    return str(value).split(sep)
+
+
+def _to_row(article_id: str, cleaned: dict):
+    price = cleaned.get('Price')
+    sold = cleaned.get('Sold (%)')
+    scraped_in = scraped_time(cleaned.get(DATE_COLNAME))
+    return {'id': article_id,
+            'url': cleaned.get('URL'),
+            'brand': None if is_missing(cleaned.get('Brand')) else cleaned.get('Brand'),
+            'name': None if is_missing(cleaned.get('Name')) else cleaned.get('Name'),
+            'price': None if is_missing(price) else float(price),
+            'sold': None if is_missing(sold) else int(sold),
+            'sizes': _split(cleaned.get('Available Sizes')),
+            'colors': _split(cleaned.get('Available Colors')),
+            'details': [(key, str(value)) for key, value in cleaned.items()
+                        if key not in CORE_COLUMNS and not is_missing(value)],
+            'scraped_in': (None if scraped_in is None else int(scraped_in))}
+
+
+def _to_table(rows: list, schema):
+    column = lambda name: [row[name] for row in rows]
+    return pa.Table.from_arrays(
+        [pa.array(column('id'), pa.string()),
+         pa.array(column('url'), pa.string()),
+         pa.array(column('brand'), pa.string()).dictionary_encode(),
+         pa.array(column('name'), pa.string()),
+         pa.array(column('price'), pa.float64()),
+         pa.array(column('sold'), pa.int32()),
+         pa.array(column('sizes'), pa.list_(pa.string())),
+         pa.array(column('colors'), pa.list_(pa.string())),
+         pa.array(column('details'), pa.map_(pa.string(), pa.string())),
+         pa.array(column('scraped_in'), pa.int64()).cast(pa.timestamp('s', tz='UTC'))],
+        schema=schema)
+
+
+class ParquetWriter():
+
+    """
+    A context manager to write the cleaned articles into a Parquet
+    dataset, partitioned by scrape day (`<path>/scrape_day=YYYY-MM-DD/`).
+
+    The articles are buffered, and written as a row group every
+    `batch_size` articles of a same day, hence during the run. Each
+    writer writes its own file per day, so that the previous runs'
+    files are never re-written.
+
+    NOTE : The re-processed articles are appended (not replaced) : the
+    readers keep the last scraped row of each ID.
+
+    """
+
+    def __init__(self, path: str, batch_size: int = BATCH_SIZE) -> None:
+        _require_pyarrow()
+        self.path = path
+        self._batch_size = batch_size
+        self._schema = articles_schema()
+        # The buffered rows and the open file writer of each day.
+        self._rows = {}
+        self._writers = {}
+        self.written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def _file_writer(self, day: str):
+        if day not in self._writers:
+            directory = os.path.join(self.path, f"{PARTITION_COLNAME}={day}")
+            os.makedirs(directory, exist_ok=True)
+            filename = "part-{}-{}.parquet".format(int(time.time() * 1000), os.getpid())
+            self._writers[day] = pq.ParquetWriter(os.path.join(directory, filename),
+                                                  self._schema,
+                                                  compression='snappy')
+        return self._writers[day]
+
+    def _flush(self, day: str):
+        rows = self._rows.pop(day, [])
+        if rows:
+            self._file_writer(day).write_table(_to_table(rows, self._schema),
+                                               row_group_size=self._batch_size)
+            self.written += len(rows)
+
+    def write(self, article_id: str, cleaned: dict):
+        """
+        Buffer a cleaned article, and write its day's row group once
+        it's full.
+
+        """
+        row = _to_row(article_id, cleaned)
+        day = time.strftime("%Y-%m-%d", time.localtime(row['scraped_in'] or time.time()))
+        self._rows.setdefault(day, []).append(row)
+        if len(self._rows[day]) >= self._batch_size:
+            self._flush(day)
+
+    def flush(self):
+        for day in list(self._rows):
+            self._flush(day)
+
+    def close(self):
+        """
+        Write the buffered articles, and close the files.
+
+        """
+        self.flush()
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
+
+
+def _read_columns(path: str, columns: list):
+    _require_pyarrow()
+    if not os.path.exists(path):
+        return None
+    return pq.read_table(path, columns=columns)
+
+
+def read_ids(path: str):
+    """
+    Get the IDs of the articles of a Parquet dataset (reading only
+    their column).
+
+    """
+    table = _read_columns(path, ['id'])
+    return set() if table is None else set(table.column('id').to_pylist())
+
+
+def read_scraped_times(path: str):
+    """
+    Get the last time each article of a Parquet dataset was scraped
+    (as a timestamp).
+
+    """
+    table = _read_columns(path, ['id', 'scraped_in'])
+    if table is None:
+        return {}
+    scraped_times = {}
+    for article_id, scraped_in in zip(table.column('id').to_pylist(),
+                                      table.column('scraped_in')
+                                           .cast(pa.int64()).to_pylist()):
+        if scraped_in is not None:
+            scraped_times[article_id] = max(scraped_in,
+                                            scraped_times.get(article_id, scraped_in))
+    return scraped_times
@@ -0,0 +1,32 @@
+import time
+
+
+# The articles' outputs columns.
+ID_COLNAME = 'ID'
+DATE_COLNAME = 'Scrape Date'
+DATE_FORMAT = "%b %d, %Y %H:%M:%S"
+
+# The cleaned articles' core columns (the others are the dynamic
+# 'Material & care', 'Size & fit', and 'Details' entries).
+CORE_COLUMNS = ['URL', 'Brand', 'Name', 'Price', 'Sold (%)',
+                'Available Sizes', 'Available Colors', DATE_COLNAME]
+
+
+def is_missing(value):
+    """
+    Whether a cleaned article's value is missing (None, or NaN as read
+    by pandas).
+
+    """
+    return value is None or value != value
+
+
+def scraped_time(scraped_in: str, default=None):
+    """
+    Convert a scrape date into a timestamp (`default` if it's invalid).
+
+    """
+    try:
+        return time.mktime(time.strptime(scraped_in, DATE_FORMAT))
+    except (TypeError, ValueError):
+        return default
@@ -0,0 +1,155 @@
+import sqlite3
+
+from zalando_de.storage.schema import CORE_COLUMNS, DATE_COLNAME, is_missing
+
+
+# The articles table's columns, for each cleaned article's core column.
+ARTICLES_COLUMNS = {'URL': 'url',
+                    'Brand': 'brand',
+                    'Name': 'name',
+                    'Price': 'price',
+                    'Sold (%)': 'sold',
+                    'Available Sizes': 'sizes',
+                    'Available Colors': 'colors',
+                    DATE_COLNAME: 'scraped_in'}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id TEXT PRIMARY KEY,
+    url TEXT,
+    brand TEXT,
+    name TEXT,
+    price REAL,
+    sold INTEGER,
+    sizes TEXT,
+    colors TEXT,
+    scraped_in TEXT
+);
+CREATE TABLE IF NOT EXISTS details (
+    id TEXT NOT NULL REFERENCES articles (id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (id, key)
+);
+CREATE TABLE IF NOT EXISTS sizes (
+    id TEXT NOT NULL,
+    size TEXT NOT NULL,
+    available INTEGER,
+    stock INTEGER,
+    price REAL,
+    PRIMARY KEY (id, size)
+);
+CREATE TABLE IF NOT EXISTS colors (
+    id TEXT NOT NULL,
+    color TEXT NOT NULL,
+    PRIMARY KEY (id, color)
+);
+CREATE INDEX IF NOT EXISTS articles_brand ON articles (brand);
+CREATE INDEX IF NOT EXISTS articles_price ON articles (price);
+CREATE INDEX IF NOT EXISTS sizes_size ON sizes (size, available);
+CREATE INDEX IF NOT EXISTS colors_color ON colors (color);
+"""
+
+# The default number of articles upserted per transaction.
+BATCH_SIZE = 500
+
+
+class SQLiteStore():
+
+    """
+    A context manager to store the cleaned articles into a SQLite
+    database : their core columns into the `articles` table, and their
+    dynamic entries ('Material & care', 'Size & fit', and 'Details')
+    into the `details` key-value table.
+
+    The articles are upserted by ID, in transactions of `batch_size`
+    articles.
+
+    """
+
+    def __init__(self, path: str, batch_size: int = BATCH_SIZE) -> None:
+        self.path = path
+        self._batch_size = batch_size
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode = WAL;")
+        self._connection.execute("PRAGMA foreign_keys = ON;")
+        self._connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def close(self):
+        self._connection.close()
+
+    def ids(self):
+        """
+        Get the IDs of the stored articles.
+
+        """
+        return {row[0] for row in self._connection.execute("SELECT id FROM articles;")}
+
+    def scraped_dates(self):
+        """
+        Get the scrape date of each stored article.
+
+        """
+        return dict(self._connection.execute("SELECT id, scraped_in FROM articles;"))
+
+    def _upsert_batch(self, batch: list):
+        columns = list(ARTICLES_COLUMNS.values())
+        articles, details = [], []
+        for article_id, cleaned in batch:
+            articles.append([article_id] + [None if is_missing(cleaned.get(column))
+                                            else cleaned.get(column)
+                                            for column in ARTICLES_COLUMNS])
+            details.extend((article_id, key, str(value))
+                           for key, value in cleaned.items()
+                           if key not in CORE_COLUMNS and not is_missing(value))
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO articles (id, {}) VALUES (?, {}) "
+                "ON CONFLICT (id) DO UPDATE SET {};"
+                "".format(", ".join(columns),
+                          ", ".join("?" * len(columns)),
+                          ", ".join(f"{column} = excluded.{column}" for column in columns)),
+                articles)
+            # The previous details of the re-processed articles are replaced.
+            self._connection.executemany("DELETE FROM details WHERE id = ?;",
+                                         [(article_id,) for article_id, _ in batch])
+            self._connection.executemany("INSERT INTO details (id, key, value) "
+                                         "VALUES (?, ?, ?);", details)
+
+    def upsert(self, articles: dict):
+        """
+        Insert (or update) the cleaned articles ({ID: cleaned details}).
+
+        Return the number of upserted articles.
+
+        """
+        items = list(articles.items())
+        for start in range(0, len(items), self._batch_size):
+            self._upsert_batch(items[start:start + self._batch_size])
+        return len(items)
+
+    def replace_rows(self, table: str, rows: dict):
+        """
+        Replace the articles' rows of a long-format table ('sizes' or
+        'colors') : {ID: [row, ...]}, each row without the ID.
+
+        """
+        if table not in ('sizes', 'colors'):
+            raise ValueError("Unknown table : {}".format(table))
+        flat_rows = [(article_id,) + tuple(row)
+                     for article_id, article_rows in rows.items()
+                     for row in article_rows]
+        with self._connection:
+            self._connection.executemany(f"DELETE FROM {table} WHERE id = ?;",
+                                         [(article_id,) for article_id in rows])
+            if flat_rows:
+                self._connection.executemany(
+                    f"INSERT OR REPLACE INTO {table} VALUES "
+                    f"({', '.join('?' * len(flat_rows[0]))});", flat_rows)
+        return len(flat_rows)
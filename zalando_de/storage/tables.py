@@ -0,0 +1,129 @@
+import csv
+import os
+import shutil
+
+from zalando_de.storage.schema import ID_COLNAME, DATE_COLNAME
+from zalando_de.storage.sqlite import SQLiteStore
+from zalando_de.utils.compression import (compressed_path, find_path, discard_variants,
+                                          open_output, open_input)
+
+
+# The long-format tables' columns (a row per article's size or color).
+SIZES_COLUMNS = [ID_COLNAME, 'Size', 'Available', 'Stock', 'Size Price', DATE_COLNAME]
+COLORS_COLUMNS = [ID_COLNAME, 'Color', DATE_COLNAME]
+
+# The default number of articles buffered before writing their rows.
+BATCH_SIZE = 200
+
+
+class LongTablesWriter():
+
+    """
+    A context manager to write the articles' sizes (size, availability,
+    stock, size price) and colors as long-format tables, a row per
+    article's size or color, every `batch_size` articles (hence during
+    the run) :
+
+    - into the `sizes` and `colors` tables of the SQLite database, where
+      the re-processed articles' rows are replaced,
+    - or appended to the `<output>_sizes.csv` and `<output>_colors.csv`
+      files (compressed if `compression` is set, each batch as a new
+      gzip member or zstd frame), with the articles' scrape date (the
+      last scraped rows of each article are the current ones). The rows
+      of a file written with another compression are carried over.
+
+    """
+
+    def __init__(self, out: str, output_filename: str,
+                 sqlite_path: str = None,
+                 batch_size: int = BATCH_SIZE,
+                 sep: str = ",",
+                 compression: str = None) -> None:
+        self._sqlite_path = sqlite_path
+        self._compression = compression
+        self._base_paths = {'sizes': f"{out}/{output_filename}_sizes.csv",
+                            'colors': f"{out}/{output_filename}_colors.csv"}
+        self._csv_paths = {table: compressed_path(path, compression)
+                           for table, path in self._base_paths.items()}
+        self._columns = {'sizes': SIZES_COLUMNS, 'colors': COLORS_COLUMNS}
+        self._batch_size = batch_size
+        self._sep = sep
+        # The buffered rows of each table : {ID: (scrape date, rows)}.
+        self._rows = {'sizes': {}, 'colors': {}}
+        self.written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    @property
+    def paths(self):
+        return ([self._sqlite_path] if self._sqlite_path
+                else list(self._csv_paths.values()))
+
+    def write(self, article_id: str, scraped_in: str,
+              sizes: list = None, colors: list = None):
+        """
+        Buffer the article's sizes and colors rows (None to keep the
+        previous ones, e.g. if the field is missing).
+
+        """
+        for table, rows in (('sizes', sizes), ('colors', colors)):
+            if rows is not None:
+                self._rows[table][article_id] = (scraped_in, rows)
+        if max(len(rows) for rows in self._rows.values()) >= self._batch_size:
+            self.flush()
+
+    def _carry_over(self, table: str):
+        """
+        Copy the rows of the table's file written with another compression
+        (if any) into its file, and remove the former. Return True if
+        they were carried over.
+
+        """
+        prev_path = find_path(self._base_paths[table])
+        if prev_path is None:
+            return False
+        with open_input(prev_path, newline='') as pf:
+            with open_output(self._csv_paths[table], self._compression, newline='') as tf:
+                shutil.copyfileobj(pf, tf)
+        discard_variants(self._base_paths[table], self._csv_paths[table])
+        return True
+
+    def _append_csv(self, table: str, rows: dict):
+        path = self._csv_paths[table]
+        new_file = not os.path.exists(path) and not self._carry_over(table)
+        with open_output(path, self._compression, newline='', append=True) as tf:
+            writer = csv.writer(tf, delimiter=self._sep)
+            if new_file:
+                writer.writerow(self._columns[table])
+            for article_id, (scraped_in, article_rows) in rows.items():
+                writer.writerows((article_id,) + tuple(row) + (scraped_in,)
+                                 for row in article_rows)
+
+    def flush(self):
+        """
+        Write the buffered rows.
+
+        """
+        if not any(self._rows.values()):
+            return 0
+        written = 0
+        if self._sqlite_path:
+            with SQLiteStore(self._sqlite_path) as store:
+                for table, rows in self._rows.items():
+                    written += store.replace_rows(table, {article_id: article_rows
+                                                          for article_id, (_, article_rows)
+                                                          in rows.items()})
+        else:
+            for table, rows in self._rows.items():
+                self._append_csv(table, rows)
+                written += sum(len(article_rows) for _, article_rows in rows.values())
+        self._rows = {'sizes': {}, 'colors': {}}
+        self.written += written
+        return written
+
+    def close(self):
+        self.flush()
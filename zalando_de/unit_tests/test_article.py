@@ -0,0 +1,51 @@
+from selenium.common.exceptions import TimeoutException
+
+from zalando_de.scrape.commun.cleaners import Cleaner
+from zalando_de.scrape.units.article import ArticleScraper
+from zalando_de.utils.logging import Logger
+
+
+class FakeAssistant():
+
+    def __init__(self) -> None:
+        self.driver = None
+        self.logger = Logger()
+
+    def _sleep_t_sec(self, t: float = 1):
+        pass
+
+
+class FlakyArticleScraper(ArticleScraper):
+
+    def _locate_containers(self):
+        raise TimeoutException("The container is not rendered.")
+
+
+def test_extract_retry_locate_failure():
+    """
+    Test that a failure locating the containers on a field's re-try
+    leaves the field missing (instead of failing the article).
+    """
+    scraper = FlakyArticleScraper(FakeAssistant(), field_retries=2)
+    attempts = []
+    def getter():
+        attempts.append(1)
+        raise TimeoutException("The price is not rendered.")
+    value, error = scraper._extract('price_label', getter)
+    assert value is None and isinstance(error, TimeoutException)
+    assert len(attempts) == 1
+
+
+def test_clean_partial_article():
+    """
+    Test cleaning an article saved with missing fields.
+    """
+    cleaned = Cleaner().clean({'brand_name': "Pier One",
+                               'article_name': "Shirt",
+                               'price_label': None,
+                               'available_sizes': {'M': {'count': '', 'price': ''}},
+                               'available_colors': ['white'],
+                               'other_details': None,
+                               'missing_fields': ['price_label', 'other_details']})
+    assert cleaned['Price'] is None and cleaned['Sold (%)'] == 0
+    assert cleaned['Available Sizes'] == "M"
@@ -0,0 +1,120 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from zalando_de.scrape.commun.assistants import ScraperAssistant
+from zalando_de.scrape.units import article
+from zalando_de.scrape.units.article import ArticleScraper
+from zalando_de.utils.logging import Logger
+
+
+class FakeDriver():
+
+    """
+    A driver whose elements (by css selector) are rendered after the
+    page was searched `delay` times.
+
+    """
+
+    def __init__(self, elements: dict, delay: int = 0) -> None:
+        self._elements = elements
+        self._delay = delay
+        self.searches = 0
+
+    def find_elements(self, by, value):
+        self.searches += 1
+        if self.searches <= self._delay:
+            return []
+        return list(self._elements.get(value, []))
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(value)
+        return elements[0]
+
+    def quit(self):
+        pass
+
+
+def _assistant(driver: FakeDriver):
+    assistant = ScraperAssistant(driver, Logger()).__enter__()
+    assistant.short_wait = WebDriverWait(driver, .2, poll_frequency=.01)
+    return assistant
+
+
+def test_required_element():
+    """
+    Test that a required element is waited for, and that its absence
+    raises a TimeoutException.
+    """
+    assistant = _assistant(FakeDriver({'#picker-trigger': ['picker']}, delay=2))
+    assert assistant._get_element_by_id('picker-trigger') == 'picker'
+    with pytest.raises(TimeoutException):
+        _assistant(FakeDriver({}))._get_element_by_id('picker-trigger')
+
+
+def test_optional_element():
+    """
+    Test that an optional element is only waited for if requested, and
+    that None is returned if it's missing.
+    """
+    driver = FakeDriver({'#picker-trigger': ['picker']}, delay=2)
+    assistant = _assistant(driver)
+    assert assistant._get_element_by_id('picker-trigger', required=False) is None
+    assert assistant._get_element_by_id('picker-trigger', required=False, wait=1) == 'picker'
+    assert _assistant(FakeDriver({}))._get_element_by_id('picker-trigger', required=False,
+                                                         wait=.1) is None
+
+
+def test_optional_field():
+    """
+    Test that a missing optional field is empty, and a missing required
+    one raises an exception.
+    """
+    assistant = _assistant(FakeDriver({}))
+    assert assistant._find_all('size_price', required=False) == []
+    assert assistant._find_value('size_price', required=False) == ""
+    with pytest.raises(TimeoutException):
+        assistant._find('size_price')
+
+
+class FakeElement():
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+
+    def get_attribute(self, name: str):
+        return self._text
+
+
+def test_single_size_article(monkeypatch):
+    """
+    Test that an article without a size picker (once waited for, times
+    the pace) has no sizes only if its single size is labelled, and that
+    its sizes are missing otherwise.
+    """
+    monkeypatch.setattr(article, 'SIZE_PICKER_WAIT', .3)
+    driver = FakeDriver({'._0xLoFW._78xIQ-': [FakeElement("29,99 €")],
+                         '._0Qm8W1._7Cm1F9.dgII7d.pVrzNP._65i7kZ': [FakeElement("One Size")]})
+    assistant = _assistant(driver)
+    assistant.pace = 2
+    assert ArticleScraper(assistant)._get_sizes() == {}
+    assert driver.searches > 1
+    # The page is not rendered yet.
+    with pytest.raises(NoSuchElementException):
+        ArticleScraper(_assistant(FakeDriver({})))._get_sizes()
+
+
+def test_missing_displayed_color():
+    """
+    Test that an article without a color picker has the displayed color,
+    and that its colors are missing if that one is missing too.
+    """
+    driver = FakeDriver({'._0Qm8W1.u-6V88.dgII7d.pVrzNP.zN9KaA': [FakeElement("white")]})
+    assert ArticleScraper(_assistant(driver))._get_colors() == ["white"]
+    with pytest.raises(TimeoutException):
+        ArticleScraper(_assistant(FakeDriver({})))._get_colors()
+    driver = FakeDriver({'._0Qm8W1.u-6V88.dgII7d.pVrzNP.zN9KaA': [FakeElement("")]})
+    with pytest.raises(NoSuchElementException):
+        ArticleScraper(_assistant(driver))._get_colors()
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from zalando_de.scrape.categories import load_manifest
+
+
+def _manifest(tmp_path, content: str):
+    path = tmp_path / "categories.json"
+    path.write_text(content, encoding='utf-8')
+    return str(path)
+
+
+def test_load_manifest(tmp_path):
+    """
+    Test reading the categories of a manifest.
+    """
+    path = _manifest(tmp_path, json.dumps([
+        {'url': "https://en.zalando.de/mens-clothing-shirts/", 'output': "zalando_de_mens_shirts"},
+        {'url': "https://en.zalando.de/mens-clothing-jeans/", 'output': "zalando_de_mens_jeans"}]))
+    assert load_manifest(path) == [("https://en.zalando.de/mens-clothing-shirts/",
+                                    "zalando_de_mens_shirts"),
+                                   ("https://en.zalando.de/mens-clothing-jeans/",
+                                    "zalando_de_mens_jeans")]
+
+
+@pytest.mark.parametrize('content', [
+    # The outputs are not distinct.
+    json.dumps([{'url': "https://en.zalando.de/mens-clothing-shirts/", 'output': "mens"},
+                {'url': "https://en.zalando.de/mens-clothing-jeans/", 'output': "mens"}]),
+    # The output is missing.
+    json.dumps([{'url': "https://en.zalando.de/mens-clothing-shirts/"}]),
+    # The categories are not listed.
+    json.dumps({'url': "https://en.zalando.de/mens-clothing-shirts/", 'output': "mens"}),
+    # A category is not an object.
+    json.dumps(["https://en.zalando.de/mens-clothing-shirts/"]),
+    # The json is malformed.
+    '[{"url": "https://en.zalando.de/mens-clothing-shirts/", "output": ',
+])
+def test_load_invalid_manifest(tmp_path, content):
+    """
+    Test that an invalid or malformed manifest is rejected.
+    """
+    with pytest.raises(ValueError):
+        load_manifest(_manifest(tmp_path, content))
@@ -0,0 +1,66 @@
+import os
+
+import pandas as pd
+
+from zalando_de.scrape import main
+from zalando_de.scrape.main import Scraper
+from zalando_de.storage.columns import ColumnBuffer
+from zalando_de.utils.logging import Logger
+
+
+def test_column_buffer():
+    """
+    Test flushing the rows in batches, and tracking the new columns.
+    """
+    frames = []
+    with ColumnBuffer(['ID', 'Price'], frames.append, batch_size=2) as buffer:
+        buffer.append({'ID': 'a', 'Price': 29.95})
+        buffer.append({'ID': 'b', 'Price': 19.95, 'Fit': 'Slim'})
+        buffer.append({'ID': 'c', 'Collar': 'Kent'})
+    assert buffer.written == 3
+    assert [len(frame) for frame in frames] == [2, 1]
+    assert list(frames[0].columns) == ['ID', 'Price', 'Fit']
+    assert frames[0]['Fit'].tolist() == [None, 'Slim']
+    assert list(frames[1].columns) == ['ID', 'Price', 'Fit', 'Collar']
+
+
+class FakeAssistant():
+
+    def __init__(self) -> None:
+        self.logger = Logger()
+
+
+def _details(id: str, price: str, details: dict = None):
+    return {'brand_name': "Pier One",
+            'article_name': "Shirt",
+            'price_label': price,
+            'available_sizes': {'M': {'count': '', 'price': ''}},
+            'available_colors': ['white'],
+            'other_details': {'Details': details or {}},
+            'url': f"https://www.zalando.de/pier-one-shirt-{id.lower()}.html",
+            'scraped_in': "2026-10-19 10:00:00"}
+
+
+def test_cleaned_articles_flushed(tmp_path, monkeypatch):
+    """
+    Test that the cleaned articles are spooled every batch (and not held
+    until the end), and merged into the CSV file (the latest row of each)
+    by the next save, even after an interrupted run.
+    """
+    monkeypatch.setattr(main, 'CHECKPOINT_SIZE', 2)
+    scraper = Scraper(FakeAssistant(), str(tmp_path))
+    scraper._save_article('PI922D00W-A11', _details('PI922D00W-A11', "29,99 €"))
+    scraper._save_article('PI922D00W-A12', _details('PI922D00W-A12', "19,99 €",
+                                                     {'Collar': "Kent"}))
+    assert not scraper._cleaned_articles
+    scraper._save_article('PI922D00W-A11', _details('PI922D00W-A11', "24,99 €"))
+    assert len(scraper._cleaned_articles) == 1
+    # The run is interrupted : the spooled articles are kept.
+    restarted = Scraper(FakeAssistant(), str(tmp_path))
+    assert 'PI922D00W-A12' in restarted._processed_articles
+    restarted._save_article('PI922D00W-A13', _details('PI922D00W-A13', "9,99 €"))
+    restarted._save()
+    assert not os.path.exists(restarted._spool_path)
+    frame = pd.read_csv(restarted._articles_path)
+    assert frame['ID'].tolist() == ['PI922D00W-A11', 'PI922D00W-A12', 'PI922D00W-A13']
+    assert frame['Collar'].tolist()[1] == "Kent"
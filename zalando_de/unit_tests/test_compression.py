@@ -0,0 +1,23 @@
+import pytest
+
+from zalando_de.utils.compression import (compressed_path, find_path,
+                                          open_input, open_output)
+
+
+@pytest.mark.parametrize('compression', [None, 'gzip'])
+def test_compression_round_trip(tmp_path, compression):
+    """
+    Test reading back an output, detecting its compression.
+    """
+    path = str(tmp_path / "metadata.json")
+    output_path = compressed_path(path, compression)
+    with open_output(output_path, compression) as output_file:
+        output_file.write('{"processed_articles": 3}')
+    assert find_path(path) == output_path
+    with open_input(output_path) as input_file:
+        assert input_file.read() == '{"processed_articles": 3}'
+
+
+def test_compression_invalid():
+    with pytest.raises(ValueError):
+        compressed_path("metadata.json", 'bz2')
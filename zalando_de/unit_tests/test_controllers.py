@@ -0,0 +1,24 @@
+from zalando_de.scrape.commun.controllers import (AdaptiveController,
+                                                  FAILURES_TO_OPEN,
+                                                  INCREASE_EVERY)
+
+
+def test_adaptive_controller():
+    """
+    Test the controller backs off on timeouts, opens the circuit breaker
+    after successive ones, and ramps back up once the requests succeed.
+    """
+    controller = AdaptiveController(max_concurrency=4, max_outage=0)
+    controller.failure()
+    assert (controller.concurrency, controller.pace) == (2, 2.0)
+    assert not controller.is_open and controller.delay() == 0
+    for _ in range(FAILURES_TO_OPEN - 1):
+        controller.failure()
+    assert controller.is_open and controller.delay() > 0
+    # NOTE : With `max_outage=0`, the controller gives up at once.
+    assert controller.gave_up
+    controller.success()
+    assert not controller.is_open
+    for _ in range(INCREASE_EVERY):
+        controller.success()
+    assert controller.concurrency == 2 and controller.pace < 8.0
@@ -0,0 +1,103 @@
+import threading
+import time
+
+from zalando_de.scrape import coordinators
+from zalando_de.scrape.coordinators import (Coordinator, CoordinatorClient,
+                                            Heartbeat, LeaseTable, ShardWorker,
+                                            page_shards)
+from zalando_de.utils.logging import Logger
+
+
+class FakeShardWorker(ShardWorker):
+
+    """
+    A worker crawling its shards without a browser.
+
+    """
+
+    poll_delay = .3
+
+    def _crawl_shard(self, shard: dict, stop_event: threading.Event = None):
+        return {'processed_articles': 1}
+
+
+def test_lease_reassignment():
+    """
+    Test a shard leased by a dead worker is leased again once its lease
+    expired, and given up after the maximum attempts.
+    """
+    table = LeaseTable(page_shards(1, 5, 10), ttl=0.05, max_attempts=2)
+    shard = table.acquire('dead')
+    assert shard['links'] == [1, 5] and table.acquire('alive') is None
+    time.sleep(0.1)
+    assert table.acquire('alive')['id'] == shard['id']
+    assert not table.heartbeat('dead', shard['id'])
+    assert table.release('alive', shard['id'], "Error")
+    assert table.status()['shards']['failed'] == 1
+
+
+def test_coordinator():
+    """
+    Test leasing, renewing, and completing the shards over HTTP.
+    """
+    with Coordinator(page_shards(1, 25, 10), port=0, ttl=60) as coordinator:
+        client = CoordinatorClient(coordinator.url, 'worker-1')
+        shards = []
+        while True:
+            shard = client.lease()
+            if shard is None:
+                break
+            assert client.heartbeat(shard['id'])
+            assert client.complete(shard['id'], {'processed_articles': 1})
+            shards.append(shard['links'])
+        assert shards == [[1, 10], [11, 20], [21, 25]]
+        status = client.status()
+        assert status['finished'] and len(status['reports']) == 3
+
+
+def test_coordinator_stopped_while_polling(tmp_path, monkeypatch):
+    """
+    Test that a worker waiting for the others' shards considers the
+    crawl finished once the coordinator stopped.
+    """
+    polling = threading.Event()
+    sleep = time.sleep
+    def poll(delay):
+        polling.set()
+        sleep(delay)
+    monkeypatch.setattr(coordinators.time, 'sleep', poll)
+    coordinator = Coordinator(page_shards(1, 20, 10), port=0, ttl=60).__enter__()
+    other = CoordinatorClient(coordinator.url, 'worker-2')
+    shard = other.lease()
+    worker = FakeShardWorker(CoordinatorClient(coordinator.url, 'worker-1', timeout=1),
+                             str(tmp_path), Logger())
+    errors = []
+    def crawl():
+        try:
+            worker.crawl()
+        except BaseException as e:
+            errors.append(e)
+    thread = threading.Thread(target=crawl)
+    thread.start()
+    assert polling.wait(5)
+    # The other worker completes the last shard, and the coordinator stops.
+    assert other.complete(shard['id'])
+    coordinator.__exit__(None, None, None)
+    thread.join(5)
+    assert not thread.is_alive() and not errors
+
+
+def test_heartbeat_lost_lease():
+    """
+    Test that a lost lease is signaled.
+    """
+    table = LeaseTable(page_shards(1, 10, 10), ttl=0.03)
+    shard = table.acquire('worker-1')
+    time.sleep(0.05)
+    table.acquire('worker-2')
+    class Client():
+        ttl = 0.03
+        def heartbeat(self, shard_id):
+            return table.heartbeat('worker-1', shard_id)
+    with Heartbeat(Client(), shard['id']) as heartbeat:
+        assert heartbeat.lost.wait(1)
@@ -0,0 +1,218 @@
+import os
+
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from zalando_de.scrape import main
+from zalando_de.scrape.commun import drivers
+from zalando_de.scrape.commun.drivers import (CONSENT_MARKER, DriverManager,
+                                              RecyclePolicy, browser_memory)
+from zalando_de.scrape.main import Scraper
+from zalando_de.utils.logging import Logger
+
+
+class FakeProcess():
+
+    def __init__(self, pid: int) -> None:
+        self.pid = pid
+
+
+class FakeService():
+
+    def __init__(self, pid: int) -> None:
+        self.process = FakeProcess(pid)
+
+
+class FakeDriver():
+
+    """
+    A driver whose "browser" is the current process.
+
+    """
+
+    def __init__(self, pid: int = None) -> None:
+        self.service = FakeService(pid or os.getpid())
+
+
+def test_recycle_every():
+    """
+    Test recycling the browser every N articles.
+    """
+    policy = RecyclePolicy(every=3)
+    assert policy and not RecyclePolicy()
+    assert policy.should_recycle(2, FakeDriver()) is None
+    assert policy.should_recycle(3, FakeDriver()) == {'reason': 'articles',
+                                                      'articles': 3}
+
+
+def test_recycle_max_rss(monkeypatch):
+    """
+    Test recycling the browser once its memory exceeds the threshold.
+    """
+    monkeypatch.setattr(drivers, 'browser_memory', lambda driver: 512.04)
+    event = RecyclePolicy(max_rss=500).should_recycle(7, FakeDriver())
+    assert event == {'reason': 'memory', 'articles': 7, 'rss_mb': 512.0}
+    assert RecyclePolicy(max_rss=1024).should_recycle(7, FakeDriver()) is None
+    # The unknown memory never triggers the recycling.
+    monkeypatch.setattr(drivers, 'browser_memory', lambda driver: None)
+    assert RecyclePolicy(max_rss=500).should_recycle(7, FakeDriver()) is None
+
+
+@pytest.mark.skipif(not os.path.isdir('/proc'), reason="/proc is not available")
+def test_browser_memory_proc_fallback(monkeypatch):
+    """
+    Test measuring the browser's memory by reading /proc when psutil
+    is missing.
+    """
+    monkeypatch.setattr(drivers, 'psutil_imported', False)
+    rss = browser_memory(FakeDriver())
+    assert rss is not None and rss > 0
+    # The driver without a local process (e.g. a remote one).
+    assert browser_memory(object()) is None
+
+
+class FakeChrome():
+
+    """
+    A mocked `webdriver.Chrome`, recording its launches.
+
+    """
+
+    launched = []
+
+    def __init__(self, options = None) -> None:
+        self.arguments = list(options.arguments)
+        self._handles = ['first', 'second']
+        self.current_handle = None
+        self.alive = True
+        FakeChrome.launched.append(self)
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise WebDriverException("disconnected: not connected to DevTools")
+        return self._handles
+
+    @property
+    def switch_to(self):
+        return self
+
+    def window(self, handle):
+        self.current_handle = handle
+
+    def close(self):
+        self._handles.remove(self.current_handle)
+
+    def quit(self):
+        self.alive = False
+
+
+@pytest.fixture
+def fake_chrome(monkeypatch):
+    FakeChrome.launched = []
+    monkeypatch.setattr(drivers, 'WEB_DRIVER', FakeChrome)
+    return FakeChrome
+
+
+def test_driver_manager_reuse(tmp_path, fake_chrome):
+    """
+    Test that the warm browser (and its profile) is reused, and that a
+    dead one is re-launched.
+    """
+    profile_dir = str(tmp_path / "profile")
+    with DriverManager(profile_dir) as manager:
+        driver = manager.get()
+        assert f"--user-data-dir={os.path.abspath(profile_dir)}" in driver.arguments
+        # The warm browser is reused, with its left opened tabs closed.
+        assert manager.get() is driver
+        assert driver.window_handles == ['first'] and driver.current_handle == 'first'
+        # The dead browser is re-launched, using the same profile.
+        driver.alive = False
+        relaunched = manager.get()
+        assert relaunched is not driver and relaunched.arguments == driver.arguments
+        assert len(fake_chrome.launched) == 2
+    assert not relaunched.alive
+
+
+def test_driver_manager_consent(tmp_path, fake_chrome):
+    """
+    Test that the cookies consent is remembered by the profile's marker
+    file across the browsers and the runs.
+    """
+    profile_dir = tmp_path / "profile"
+    profile_dir.mkdir()
+    manager = DriverManager(str(profile_dir))
+    assert not manager.consent_handled
+    manager.consent_handled = True
+    assert (profile_dir / CONSENT_MARKER).exists()
+    manager.restart()
+    assert manager.consent_handled
+    assert DriverManager(str(profile_dir)).consent_handled
+    manager.consent_handled = False
+    assert not (profile_dir / CONSENT_MARKER).exists()
+    # Without a profile, the consent is only remembered by the manager.
+    manager = DriverManager()
+    manager.consent_handled = True
+    assert manager.consent_handled and not DriverManager().consent_handled
+
+
+class FakeWait():
+
+    def until(self, method, message: str = ''):
+        raise TimeoutException(message)
+
+
+class ConsentAssistant():
+
+    """
+    An assistant whose page shows the cookies banner if `banner`, and
+    whose browser has the consent's cookie if `cookie`.
+
+    """
+
+    def __init__(self, cookie: bool, banner: bool, handled: bool) -> None:
+        self.logger = Logger()
+        self.pace = 1.0
+        self.driver = self
+        self.xlong_wait = FakeWait()
+        self.cookie = cookie
+        self.banner = banner
+        self.handled = [handled]
+        self.waits = []
+
+    def get_cookie(self, name: str):
+        return {'name': name, 'value': 'true'} if self.cookie else None
+
+    def _get_element_by_id(self, id_name: str, required: bool = True, wait: float = None):
+        self.waits.append(wait)
+        return 'banner' if self.banner else None
+
+    @property
+    def consent_handled(self):
+        return self.handled[-1]
+
+    @consent_handled.setter
+    def consent_handled(self, handled: bool):
+        self.handled.append(handled)
+
+
+def test_handle_cookies_consent(tmp_path, monkeypatch):
+    """
+    Test that the consent is decided by its cookie, that the banner is
+    only waited for shortly if it's supposedly retained, and that its
+    retention is forgotten once the banner shows up again.
+    """
+    monkeypatch.setattr(main, 'CONSENT_BANNER_WAIT', 3)
+    # The consent's cookie is set.
+    assistant = ConsentAssistant(cookie=True, banner=True, handled=False)
+    Scraper(assistant, str(tmp_path))._handle_cookies()
+    assert assistant.consent_handled and not assistant.waits
+    # The consent is retained, and the banner doesn't show up.
+    assistant = ConsentAssistant(cookie=False, banner=False, handled=True)
+    assistant.pace = 2
+    Scraper(assistant, str(tmp_path))._handle_cookies()
+    assert assistant.waits == [6] and assistant.handled == [True]
+    # The consent was lost.
+    assistant = ConsentAssistant(cookie=False, banner=True, handled=True)
+    Scraper(assistant, str(tmp_path))._handle_cookies()
+    assert assistant.handled == [True, False, True]
@@ -0,0 +1,21 @@
+from zalando_de.utils import helpers
+from zalando_de.utils.helpers import backoff_delay
+
+
+def test_backoff_delay_growth(monkeypatch):
+    """
+    Test that the backoff delay doubles with each attempt.
+    """
+    # The random half of the delay at its maximum.
+    monkeypatch.setattr(helpers.random, 'uniform', lambda low, high: high)
+    assert [backoff_delay(attempt, base=5, cap=600) for attempt in range(5)] == [5, 5, 10, 20, 40]
+
+
+def test_backoff_delay_cap():
+    """
+    Test that the backoff delay never exceeds the cap, and that at least
+    half of it is fixed.
+    """
+    for attempt in (8, 20, 1000):
+        delays = [backoff_delay(attempt, base=5, cap=600) for _ in range(100)]
+        assert all(300 <= delay <= 600 for delay in delays)
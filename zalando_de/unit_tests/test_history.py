@@ -0,0 +1,34 @@
+import time
+
+from zalando_de.storage.history import HistoryStore
+
+
+def test_history_change_only(tmp_path):
+    """
+    Test writing a point only when the price or the availability changed.
+    """
+    path = str(tmp_path / "history.sqlite")
+    with HistoryStore(path) as store:
+        assert store.record('a', 29.95, 0, {'M': '', 'L': 'Notify Me'}, 100)
+        assert not store.record('a', 29.95, 0, {'L': 'Notify Me', 'M': ''}, 200)
+        assert store.record('a', 19.95, 30, {'M': '', 'L': 'Notify Me'}, 300)
+    with HistoryStore(path) as store:
+        assert not store.record('a', 19.95, 30, {'M': '', 'L': 'Notify Me'}, 400)
+        assert [point['price'] for point in store.points('a')] == [29.95, 19.95]
+
+
+def test_history_compact(tmp_path):
+    """
+    Test compacting the old points to a point per day.
+    """
+    day = 24 * 3600
+    old = (int(time.time()) // day - 100) * day
+    with HistoryStore(str(tmp_path / "history.sqlite")) as store:
+        store.record('a', 10, 0, {}, old)
+        store.record('a', 12, 0, {}, old + 60)
+        store.record('a', 10, 0, {}, old + 120)
+        store.record('a', 10, 0, {}, old + day)
+        store.record('a', 10, 20, {}, old + 2 * day)
+        store.record('a', 12, 20, {}, time.time())
+        assert store.compact(older_than=30 * day, resolution=day) == 2
+        assert [(point['price'], point['sold']) for point in store.points('a')] == [(10, 0), (10, 20), (12, 20)]
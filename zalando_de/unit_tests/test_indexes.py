@@ -0,0 +1,73 @@
+import threading
+
+from zalando_de.scrape.commun.indexes import ContentHashes, ProcessedIndex, content_hash
+
+
+def test_content_hashes(tmp_path):
+    """
+    Test skipping the articles whose normalized content did not change.
+    """
+    details = {'url': "https://en.zalando.de/a.html", 'brand_name': "OLYMP",
+               'price_label': "59,95\xa0€", 'available_colors': ["bleu\n\n"],
+               'available_sizes': {'39': {'count': '', 'price': ''}},
+               'scraped_in': "Apr 12, 2023 10:00:00"}
+    same = dict(details, url="https://en.zalando.de/a.html?p=2",
+                available_colors=["bleu"], scraped_in="Apr 13, 2023 10:00:00")
+    assert content_hash(details) == content_hash(same)
+    assert content_hash(details) != content_hash(dict(details, price_label="39,95\xa0€"))
+    path = str(tmp_path / "hashes.json")
+    hashes = ContentHashes(path)
+    assert not hashes.seen('a', content_hash(details), 100)
+    hashes.save()
+    hashes = ContentHashes(path)
+    assert hashes.seen('a', content_hash(same), 200)
+    assert hashes.last_seen('a') == 200
+
+
+def test_content_hashes_compressed(tmp_path):
+    """
+    Test persisting the hashes compressed, and reading them back once
+    the compression is switched (the stale file is removed).
+    """
+    path = str(tmp_path / "hashes.json")
+    hashes = ContentHashes(path, compression='gzip')
+    hashes.seen('a', "0" * 40, 100)
+    assert hashes.save() == path + ".gz"
+    hashes = ContentHashes(path)
+    assert hashes.last_seen('a') == 100
+    assert hashes.save() == path
+    assert not (tmp_path / "hashes.json.gz").exists()
+
+
+def test_content_hashes_last_seen(tmp_path):
+    """
+    Test bumping the scraping times read from the outputs to the last
+    time the (unchanged) articles were seen.
+    """
+    hashes = ContentHashes(str(tmp_path / "hashes.json"))
+    hashes.seen('a', "0" * 40, 300)
+    hashes.seen('b', "1" * 40, 100)
+    assert hashes.with_last_seen({'a': 200, 'b': 200, 'c': 200}) == {'a': 300, 'b': 200, 'c': 200}
+
+
+def test_processed_index_claim():
+    """
+    Test that each article is claimed by a single one of the scrapers
+    sharing the index.
+    """
+    index = ProcessedIndex(['a'])
+    claimed = []
+    barrier = threading.Barrier(8)
+    def claim():
+        barrier.wait()
+        claimed.extend(article_id for article_id in ['a', 'b', 'c', 'd']
+                       if index.claim(article_id))
+    threads = [threading.Thread(target=claim) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(claimed) == ['b', 'c', 'd']
+    # A released article can be claimed again.
+    index.discard('b')
+    assert index.claim('b') and not index.claim('b')
@@ -0,0 +1,44 @@
+import pandas as pd
+
+from zalando_de.storage.merge import merge_csv
+
+
+def test_merge_csv(tmp_path):
+    """
+    Test merging overlapping CSV files with different columns, in chunks.
+    """
+    old = tmp_path / "worker_1.csv"
+    new = tmp_path / "worker_2.csv"
+    pd.DataFrame({'ID': ['a', 'b', 'c'],
+                  'Price': [10.0, 20.0, 30.0],
+                  'Fit': ['Slim', None, 'Regular'],
+                  'Scrape Date': ['Apr 10, 2023 10:00:00'] * 3}).to_csv(old, index=False)
+    pd.DataFrame({'ID': ['b', 'd', 'a'],
+                  'Price': [25.0, 40.0, 5.0],
+                  'Collar': ['Kent', 'Button-down', 'Kent'],
+                  'Scrape Date': ['Apr 12, 2023 10:00:00', 'Apr 12, 2023 10:00:00',
+                                  'Apr 01, 2023 10:00:00']}).to_csv(new, index=False)
+    output = tmp_path / "merged.csv"
+    assert merge_csv([str(old), str(new)], str(output), chunk_rows=2) == 4
+    merged = pd.read_csv(output).set_index('ID')
+    assert list(merged.columns) == ['Price', 'Fit', 'Scrape Date', 'Collar']
+    # The newest row of each article is kept.
+    assert merged['Price'].to_dict() == {'a': 10.0, 'b': 25.0, 'c': 30.0, 'd': 40.0}
+    assert merged.loc['b', 'Collar'] == 'Kent'
+
+
+def test_merge_csv_missing_ids(tmp_path):
+    """
+    Test that the rows without an ID are all kept as is (and not merged
+    together).
+    """
+    path = tmp_path / "worker_1.csv"
+    pd.DataFrame({'ID': ['a', None, 'a', ''],
+                  'Price': [10.0, 20.0, 30.0, 40.0],
+                  'Scrape Date': ['Apr 10, 2023 10:00:00', 'Apr 10, 2023 10:00:00',
+                                  'Apr 12, 2023 10:00:00', 'Apr 12, 2023 10:00:00']}).to_csv(path, index=False)
+    output = tmp_path / "merged.csv"
+    assert merge_csv([str(path)], str(output)) == 3
+    merged = pd.read_csv(output, keep_default_na=False)
+    assert merged['ID'].tolist() == ['', '', 'a']
+    assert merged['Price'].tolist() == [20.0, 40.0, 30.0]
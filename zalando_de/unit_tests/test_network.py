@@ -0,0 +1,112 @@
+from zalando_de.scrape.commun.network import decode_articles
+from zalando_de.scrape.commun.cleaners import Cleaner
+from zalando_de.scrape.commun.indexes import ProcessedIndex
+from zalando_de.scrape.main import Scraper
+from zalando_de.utils.logging import Logger
+
+
+CATALOG_PAYLOAD = {
+    'articles': [
+        {'sku': 'SIC22D048-A12',
+         'name': 'WILT - Shirt',
+         'brand_name': 'Sir Raymond Tailor',
+         'url_key': 'sir-raymond-tailor-shirt-white-sic22d048-a12',
+         'price': {'original': '79,95 €',
+                   'promotional': '39,95 €'},
+         'discount': '-50%',
+         'sizes': ['S', 'M', 'L']},
+        {'sku': 'OL022D04G-K11',
+         'name': 'No. 6 - Formal shirt',
+         'brand': {'name': 'OLYMP'},
+         'uri': '/olymp-no-six-formal-shirt-bleu-ol022d04g-k11.html',
+         'price': {'original': 59.95},
+         'sizes': [{'size': '39', 'available': True},
+                   {'size': '40', 'available': False}],
+         'color': 'bleu'},
+    ],
+    'pagination': {'page': 1},
+}
+
+
+def test_decode_articles():
+    """
+    Test decoding a catalog payload into articles' details.
+    """
+
+    articles = dict(decode_articles(CATALOG_PAYLOAD))
+
+    assert list(articles) == [
+        'https://en.zalando.de/sir-raymond-tailor-shirt-white-sic22d048-a12.html',
+        'https://en.zalando.de/olymp-no-six-formal-shirt-bleu-ol022d04g-k11.html',
+    ]
+
+    first, second = articles.values()
+    assert first['brand_name'] == 'Sir Raymond Tailor'
+    assert list(first['available_sizes']) == ['S', 'M', 'L']
+    assert second['brand_name'] == 'OLYMP'
+    assert second['available_colors'] == ['bleu']
+    assert second['available_sizes']['40']['count'] == 'Notify Me'
+    # The fields the payload lacks are missing (to be completed later).
+    assert first['available_colors'] is None and first['other_details'] is None
+    assert first['missing_fields'] == ['available_colors', 'other_details']
+    assert second['missing_fields'] == ['other_details']
+
+    # The decoded price labels are cleaned the same way as the scraped ones.
+    cleaner = Cleaner()
+    assert cleaner.clean(first)['Price'] == 79.95
+    assert cleaner.clean(first)['Sold (%)'] == 50
+    assert cleaner.clean(second)['Price'] == 59.95
+    assert cleaner.clean(second)['Available Sizes'] == '39'
+
+
+class FakeAssistant():
+
+    def __init__(self) -> None:
+        self.logger = Logger()
+        self.driver = self
+
+    def execute_script(self, script: str):
+        return 1000
+
+    def sleep_and_scroll(self, scroll_to = None):
+        pass
+
+    def _wait_to_load(self):
+        pass
+
+
+class FakeCapture():
+
+    def articles(self):
+        return decode_articles(CATALOG_PAYLOAD)
+
+
+class RacingIndex(ProcessedIndex):
+
+    """
+    An index whose articles `raced` are claimed meanwhile by another
+    scraper.
+
+    """
+
+    def __init__(self, raced: set) -> None:
+        super().__init__()
+        self._raced = raced
+
+    def claim(self, article_id):
+        if article_id in self._raced:
+            return False
+        return super().claim(article_id)
+
+
+def test_capture_page_claims(tmp_path):
+    """
+    Test that the captured articles are claimed before they're saved,
+    and saved as partial articles (to be completed later).
+    """
+    raced = 'sir-raymond-tailor-shirt-white-sic22d048-a12'
+    scraper = Scraper(FakeAssistant(), str(tmp_path), index=RacingIndex({raced}))
+    scraper._network = FakeCapture()
+    assert scraper._capture_page()
+    assert list(scraper._newl_processed_articles) == ['olymp-no-six-formal-shirt-bleu-ol022d04g-k11']
+    assert list(scraper._partial_articles) == ['olymp-no-six-formal-shirt-bleu-ol022d04g-k11']
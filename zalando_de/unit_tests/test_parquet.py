@@ -0,0 +1,31 @@
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from zalando_de.storage.parquet import ParquetWriter, read_ids, read_scraped_times
+
+
+def _cleaned(url, price, scraped_in, **details):
+    return {'URL': url, 'Brand': 'Olymp', 'Name': 'Shirt',
+            'Price': price, 'Sold (%)': 10,
+            'Available Sizes': 'S;M', 'Available Colors': '',
+            **details,
+            'Scrape Date': scraped_in}
+
+
+def test_parquet_writer(tmp_path):
+    import pyarrow.parquet as pq
+    path = str(tmp_path / "articles.parquet")
+    with ParquetWriter(path, batch_size=2) as writer:
+        writer.write('A1', _cleaned('a1', 29.95, "Mar 01, 2023 10:00:00", Fit='Slim'))
+        writer.write('A2', _cleaned('a2', None, "Mar 02, 2023 10:00:00"))
+        writer.write('A1', _cleaned('a1', 24.95, "Mar 03, 2023 10:00:00"))
+    assert writer.written == 3
+    table = pq.read_table(path, columns=['id', 'price', 'sizes', 'colors', 'details'])
+    rows = sorted(table.to_pylist(), key=lambda row: (row['id'], row['price'] or 0))
+    assert rows[0]['sizes'] == ['S', 'M'] and rows[0]['colors'] == []
+    assert rows[1]['details'] == [('Fit', 'Slim')]
+    assert rows[2]['price'] is None
+    assert read_ids(path) == {'A1', 'A2'}
+    scraped_times = read_scraped_times(path)
+    assert scraped_times['A1'] > scraped_times['A2']
@@ -0,0 +1,152 @@
+import pytest
+
+from zalando_de.scrape.units.article import ArticleScraper
+from zalando_de.scrape.units.parsers import ArticleParser
+from zalando_de.scrape.commun.pipelines import SnapshotPipeline
+
+
+ARTICLE_HTML = """
+<html><body>
+<div class="DT5BTM VHXqc_ rceRmQ _4NtqZU mIlIve">
+  <x-wrapper-re-1-4>
+    <h3 class="SZKKsK mt1kvu FxZV-M pVrzNP _5Yd-hZ">Sir Raymond Tailor</h3>
+    <span class="EKabf7 R_QwOV">WILT - Shirt</span>
+    <div class="_0xLoFW _78xIQ-"><p>39,95&nbsp;€</p><p>Originally:</p><p>79,95&nbsp;€</p><p>-50%</p></div>
+    <p class="_0Qm8W1 u-6V88 dgII7d pVrzNP zN9KaA">white</p>
+    <div class="pl0w2g DT5BTM A-NCMf"><img alt="white" src="a.jpg"></div>
+    <div class="pl0w2g DT5BTM A-NCMf"><img alt="light blue" src="b.jpg"/></div>
+  </x-wrapper-re-1-4>
+  <div class="y4Yt_f NN8L-8 JT3_zV MxUWj-">
+    <h5 class="JCuRr_">Material &amp; care</h5>
+    <dt class="_0Qm8W1 u-6V88 dgII7d pVrzNP zN9KaA">Outer fabric material:</dt>
+    <dd class="_0Qm8W1 u-6V88 FxZV-M pVrzNP zN9KaA">100% cotton</dd>
+  </div>
+</div>
+<div class="fOd40J _0xLoFW JT3_zV FCIprz LyRfpJ">
+  <span class="_0Qm8W1 _7Cm1F9 dgII7d pVrzNP">M</span>
+  <span class="nXkCf3">Only 1 left</span>
+</div>
+<div class="fOd40J _0xLoFW JT3_zV FCIprz LyRfpJ">
+  <span class="_0Qm8W1 _7Cm1F9 dgII7d D--idb">L</span>
+  <span class="nXkCf3">Notify Me</span>
+</div>
+<script>var ignored = "<div>";</script>
+</body></html>
+"""
+
+URL = "https://en.zalando.de/sir-raymond-tailor-shirt-white-sic22d048-a12.html"
+
+# The details, as serialized by the browser (`driver.page_source`).
+DETAILS_HTML = """
+<div class="y4Yt_f NN8L-8 JT3_zV MxUWj-">
+  <h5 class="JCuRr_">Material &amp; care</h5>
+  <dt class="_0Qm8W1 u-6V88 dgII7d pVrzNP zN9KaA">Outer fabric material:</dt>
+  <dd class="_0Qm8W1 u-6V88 FxZV-M pVrzNP zN9KaA">55% linen, 45% cotton &amp; more</dd>
+</div>
+<div class="y4Yt_f NN8L-8 JT3_zV MxUWj-">
+  <h5 class="JCuRr_">Details</h5>
+  <dt class="_0Qm8W1 u-6V88 dgII7d pVrzNP zN9KaA">Collar<!-- -->:</dt>
+  <dd class="_0Qm8W1 u-6V88 FxZV-M pVrzNP zN9KaA">Button&nbsp;down <span class="Kq1JPK">collar</span></dd>
+</div>
+"""
+
+
+class FakeElement():
+
+    """
+    A browser's web element, with its `innerHTML` (as in DETAILS_HTML)
+    and `innerText`, and its children of each field.
+
+    """
+
+    def __init__(self, inner_html: str = '', text: str = '', **children) -> None:
+        self._attributes = {'innerHTML': inner_html, 'innerText': text}
+        self.children = children
+
+    def get_attribute(self, name: str):
+        return self._attributes[name]
+
+
+class FakeAssistant():
+
+    def __init__(self) -> None:
+        self.driver = None
+
+    def _find_all(self, name: str, parent_element: FakeElement = None,
+                  required: bool = True):
+        return parent_element.children.get(name, [])
+
+    def _find_value(self, name: str, parent_element: FakeElement = None,
+                    required: bool = True):
+        return parent_element.children[name][0].get_attribute('innerText')
+
+    def sleep_and_scroll(self, *args, **kwargs):
+        pass
+
+
+def test_parse_article():
+    """
+    Test extracting an article's details from a page snapshot.
+    """
+
+    details = ArticleParser(ARTICLE_HTML).parse()
+
+    assert details['brand_name'] == 'Sir Raymond Tailor'
+    assert details['article_name'] == 'WILT - Shirt'
+    assert details['price_label'] == '39,95\xa0€ | Originally: | 79,95\xa0€ | -50%'
+    assert details['available_colors'] == ['white', 'light blue']
+    assert details['available_sizes'] == {'M': {'count': 'Only 1 left', 'price': ''},
+                                          'L': {'count': 'Notify Me', 'price': ''}}
+    assert details['other_details'] == {'Material & care': {'Outer fabric material':
+                                                            '100% cotton'}}
+
+
+def test_snapshot_pipeline():
+    """
+    Test parsing and cleaning snapshots in worker processes.
+    """
+
+    with SnapshotPipeline(workers=1, max_pending=1) as pipeline:
+        pipeline.submit('article', ARTICLE_HTML, URL, 'Apr 14, 2023 00:08:19')
+        pipeline.submit('broken', '<html></html>', URL, 'Apr 14, 2023 00:08:19')
+
+    results = {article_id: (details, cleaned, exception)
+               for article_id, details, cleaned, exception in pipeline.collect()}
+
+    details, cleaned, exception = results['article']
+    assert exception is None
+    assert details['url'] == URL
+    assert cleaned['Price'] == 79.95
+    assert cleaned['Available Sizes'] == 'M'
+    assert isinstance(results['broken'][2], ValueError)
+
+
+def test_details_parity():
+    """
+    Test that the details parsed from a snapshot are the ones extracted
+    through the driver (the entries' `innerHTML`).
+    """
+    page = FakeElement(details_items=[
+        FakeElement(details_name=[FakeElement(text="Material & care")],
+                    details_key=[FakeElement("Outer fabric material:")],
+                    details_value=[FakeElement("55% linen, 45% cotton &amp; more")]),
+        FakeElement(details_name=[FakeElement(text="Details")],
+                    details_key=[FakeElement("Collar<!-- -->:")],
+                    details_value=[FakeElement('Button&nbsp;down <span class="Kq1JPK">'
+                                               'collar</span>')])])
+    parser = ArticleParser(DETAILS_HTML)
+    details = parser._get_extra_details(parser._root)
+    assert details == ArticleScraper(FakeAssistant())._get_extra_details(page)
+    assert details['Details'] == {'Collar<!-- -->': 'Button&nbsp;down <span class="Kq1JPK">'
+                                                    'collar</span>'}
+
+
+def test_snapshot_pipeline_broken_pool():
+    """
+    Test that a snapshot failing to be submitted releases its slot.
+    """
+    with SnapshotPipeline(workers=1, max_pending=1) as pipeline:
+        pipeline._executor.shutdown(wait=True)
+        with pytest.raises(RuntimeError):
+            pipeline.submit('article', ARTICLE_HTML, URL, 'Apr 14, 2023 00:08:19')
+        assert pipeline._slots.acquire(blocking=False)
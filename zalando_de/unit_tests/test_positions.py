@@ -0,0 +1,167 @@
+from zalando_de.scrape import main
+from zalando_de.scrape.commun.positions import CrawlPosition
+from zalando_de.scrape.main import Scraper
+from zalando_de.utils.logging import Logger
+
+
+class FakeAssistant():
+
+    def __init__(self) -> None:
+        self.logger = Logger()
+        self.visited = []
+
+    def get(self, url: str):
+        self.visited.append(url)
+
+
+def test_position_round_trip(tmp_path):
+    """
+    Test persisting the crawl position, and reading it back.
+    """
+    path = str(tmp_path / "position.json")
+    position = CrawlPosition(path)
+    assert not position.is_resumable()
+    position.move_to("https://www.zalando.de/herrenhemden/?p=3", 3)
+    position.advance(12, 'PI922D00W-A11')
+    # The position is only persisted once saved.
+    assert not CrawlPosition(path).is_resumable()
+    assert position.save() == path
+    restored = CrawlPosition(path)
+    assert restored.is_resumable()
+    assert restored.as_dict() == {'url': "https://www.zalando.de/herrenhemden/?p=3",
+                                  'page': 3, 'offset': 12, 'last_id': 'PI922D00W-A11'}
+    restored.clear()
+    assert not CrawlPosition(path).is_resumable()
+
+
+def test_position_corrupted(tmp_path):
+    """
+    Test that a corrupted position file is ignored.
+    """
+    path = tmp_path / "position.json"
+    path.write_text('{"url": "https://www.zalando.de/herr', encoding='utf-8')
+    position = CrawlPosition(str(path))
+    assert not position.is_resumable() and position.page == 1
+
+
+def test_resume_from_saved_position(tmp_path):
+    """
+    Test that a restarted scraper resumes from the position saved
+    along with the articles, and not from an unsaved one.
+    """
+    details = {'brand_name': "Pier One",
+               'article_name': "Shirt",
+               'price_label': "29,99 €",
+               'available_sizes': {'M': {'count': '', 'price': ''}},
+               'available_colors': ['white'],
+               'other_details': {},
+               'url': "https://www.zalando.de/pier-one-shirt-pi922d00w-a11.html",
+               'scraped_in': "2026-10-19 10:00:00"}
+    scraper = Scraper(FakeAssistant(), str(tmp_path))
+    scraper._position.move_to("https://www.zalando.de/herrenhemden/?p=2", 2)
+    scraper._save_article('PI922D00W-A11', details)
+    scraper._position.advance(1, 'PI922D00W-A11')
+    # The position is not persisted past the unwritten article.
+    scraper._persist_position()
+    assert not CrawlPosition(scraper._position.path).is_resumable()
+    scraper._save()
+    # The next article's position is lost with it (e.g. a crash).
+    scraper._save_article('PI922D00W-A12',
+                          dict(details, url="https://www.zalando.de/pier-one-shirt-pi922d00w-a12.html"))
+    scraper._position.advance(2, 'PI922D00W-A12')
+    scraper._persist_position()
+    assistant = FakeAssistant()
+    restarted = Scraper(assistant, str(tmp_path))
+    assert 'PI922D00W-A11' in restarted._processed_articles
+    assert restarted._position.as_dict() == {'url': "https://www.zalando.de/herrenhemden/?p=2",
+                                             'page': 2, 'offset': 1,
+                                             'last_id': 'PI922D00W-A11'}
+    restarted._handle_cookies = lambda: None
+    restarted._high_level_details = lambda: None
+    restarted._is_next_page = lambda: False
+    restarted._process(lambda: True)
+    assert assistant.visited == ["https://www.zalando.de/herrenhemden/?p=2"]
+    # The crawl is finished.
+    assert not CrawlPosition(restarted._position.path).is_resumable()
+
+
+def test_position_held_tiles(tmp_path):
+    """
+    Test that the offset doesn't move past a held tile (e.g. a snapshot
+    being parsed) until it's released.
+    """
+    position = CrawlPosition(str(tmp_path / "position.json"))
+    position.move_to("https://www.zalando.de/herrenhemden/?p=2", 2)
+    position.hold('A', 1)
+    position.hold('B', 2)
+    # An already processed tile.
+    position.advance(3, 'C')
+    assert position.offset == 0
+    position.release('B')
+    assert position.offset == 0
+    position.release('A')
+    assert position.offset == 3 and position.last_id == 'C'
+    # The tiles of a previous page don't move the next page's offset.
+    position.hold('C', 4)
+    position.move_to("https://www.zalando.de/herrenhemden/?p=3", 3)
+    position.advance(1)
+    position.release('C')
+    assert position.offset == 1
+
+
+class TilesAssistant(FakeAssistant):
+
+    """
+    An assistant whose listing page shows the articles `ids`.
+
+    """
+
+    def __init__(self, ids: list) -> None:
+        super().__init__()
+        self.ids = ids
+
+    def _find_all(self, name: str):
+        return [f"https://en.zalando.de/{id}.html" for id in self.ids]
+
+
+def test_resume_after_last_article(tmp_path):
+    """
+    Test that a restarted page is resumed after the last handled
+    article even if the tiles shifted, and after the tile offset if
+    that article is no more listed.
+    """
+    scraper = Scraper(TilesAssistant(['NEW-1', 'A', 'B', 'C', 'D']), str(tmp_path))
+    scraper._get_article_link = lambda tile: tile
+    articles, _ = scraper._get_page_articles(2, 'B')
+    assert [index for (index, _, _) in articles] == [3, 4]
+    articles, _ = scraper._get_page_articles(2, 'GONE')
+    assert [index for (index, _, _) in articles] == [2, 3, 4]
+
+
+def test_position_persisted_continuously(tmp_path, monkeypatch):
+    """
+    Test that the position is persisted as it moves, once the articles
+    before it are written by a checkpoint.
+    """
+    monkeypatch.setattr(main, 'CHECKPOINT_SIZE', 2)
+    details = {'brand_name': "Pier One", 'article_name': "Shirt",
+               'price_label': "29,99 €", 'available_sizes': {},
+               'available_colors': ['white'], 'other_details': {},
+               'scraped_in': "2026-10-19 10:00:00"}
+    scraper = Scraper(FakeAssistant(), str(tmp_path))
+    scraper._position.move_to("https://www.zalando.de/herrenhemden/?p=2", 2)
+    # An already processed tile.
+    scraper._position.advance(1, 'A')
+    scraper._persist_position()
+    assert CrawlPosition(scraper._position.path).last_id == 'A'
+    scraper._save_article('B', dict(details, url="https://en.zalando.de/B.html"))
+    scraper._position.advance(2, 'B')
+    scraper._persist_position()
+    assert CrawlPosition(scraper._position.path).last_id == 'A'
+    # The checkpoint writes both articles.
+    scraper._save_article('C', dict(details, url="https://en.zalando.de/C.html"))
+    scraper._position.advance(3, 'C')
+    scraper._persist_position()
+    assert CrawlPosition(scraper._position.path).last_id == 'C'
+    restarted = Scraper(FakeAssistant(), str(tmp_path))
+    assert 'B' in restarted._processed_articles and 'C' in restarted._processed_articles
@@ -0,0 +1,20 @@
+import time
+
+from zalando_de.scrape.commun.queues import RetryQueue
+
+
+def test_retry_queue():
+    """
+    Test the re-tries are served once due, up to the maximum attempts.
+    """
+    queue = RetryQueue(max_attempts=2, delay=0.02, max_delay=0.1)
+    assert queue.push('a', 'a.html') == 1
+    # The re-try is not due yet.
+    assert queue.pop_due() is None
+    time.sleep(queue.wait_time())
+    assert queue.pop_due() == ('a', 'a.html')
+    assert not queue
+    # The article is given up after its second re-try.
+    assert queue.push('a', 'a.html') == 2
+    assert queue.push('a', 'a.html') == 0
+    assert len(queue) == 1
@@ -0,0 +1,48 @@
+from zalando_de.scrape.commun.cleaners import Cleaner
+from zalando_de.scrape.commun.records import ArticleRecord
+from zalando_de.scrape.main import Scraper
+from zalando_de.utils.logging import Logger
+
+
+def test_article_record():
+    """
+    Test that a record converts back to its raw details, and cleans alike.
+    """
+    details = {'brand_name': "OLYMP", 'article_name': "No. 6 - Formal shirt",
+               'price_label': "59,95\xa0€", 'available_colors': None,
+               'available_sizes': {'39': {'count': '', 'price': ''},
+                                   '40': {'count': 'Notify Me', 'price': ''}},
+               'other_details': {'Details': {'Collar': "Kent"}},
+               'url': "https://en.zalando.de/a.html",
+               'scraped_in': "Apr 12, 2023 10:00:00",
+               'missing_fields': ['available_colors']}
+    record = ArticleRecord.from_details(details)
+    assert record.to_details() == details
+    assert Cleaner().clean(record) == Cleaner().clean(details)
+    other = ArticleRecord.from_details(dict(details, url="https://en.zalando.de/b.html"))
+    assert other.available_sizes[1][1] is record.available_sizes[1][1]
+
+
+class FakeAssistant():
+
+    def __init__(self) -> None:
+        self.logger = Logger()
+
+
+def test_partial_articles_records(tmp_path):
+    """
+    Test that the partial articles are held as records, and persisted
+    (and read back) as their raw details.
+    """
+    details = {'brand_name': "OLYMP", 'article_name': "No. 6 - Formal shirt",
+               'price_label': "59,95\xa0€", 'available_colors': ["bleu"],
+               'available_sizes': None, 'other_details': {},
+               'url': "https://en.zalando.de/a.html",
+               'scraped_in': "Apr 12, 2023 10:00:00",
+               'missing_fields': ['available_sizes']}
+    scraper = Scraper(FakeAssistant(), str(tmp_path))
+    scraper._save_article('OL122D0A1-K11', details)
+    assert isinstance(scraper._partial_articles['OL122D0A1-K11'], ArticleRecord)
+    scraper._save()
+    restarted = Scraper(FakeAssistant(), str(tmp_path))
+    assert restarted._partial_articles['OL122D0A1-K11'].to_details() == details
@@ -0,0 +1,74 @@
+import main
+from main import (crawl_with_retries, EXIT_SUCCESS,
+                  EXIT_RETRIES_EXHAUSTED, EXIT_ABORTED)
+from zalando_de.scrape.commun.exceptions import UnableToConnectException
+from zalando_de.utils.logging import Logger
+
+
+class FakeCrawler():
+
+    """
+    A crawler whose crawls fail (the connection is lost) after having
+    processed the given numbers of articles, and then succeed.
+
+    """
+
+    def __init__(self, processed: list) -> None:
+        self._processed = list(processed)
+        self.processed_articles = 0
+        self.crawls = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        pass
+
+    def crawl(self):
+        self.crawls += 1
+        if not self._processed:
+            return
+        self.processed_articles = self._processed.pop(0)
+        raise UnableToConnectException("Probably the Internet connection is unstable.",
+                                       None)
+
+
+def _no_sleep(monkeypatch):
+    delays = []
+    monkeypatch.setattr(main.time, 'sleep', delays.append)
+    return delays
+
+
+def test_retries_exhausted(monkeypatch):
+    """
+    Test giving up (exit code 2) after the successive re-tries without
+    progress.
+    """
+    delays = _no_sleep(monkeypatch)
+    crawler = FakeCrawler([0] * 10)
+    assert crawl_with_retries(crawler, Logger(), unattended=True,
+                              max_retries=3, backoff=1, max_backoff=2) == EXIT_RETRIES_EXHAUSTED
+    assert crawler.crawls == 4
+    assert len(delays) == 3 and all(delay <= 2 for delay in delays)
+
+
+def test_retries_reset_after_progress(monkeypatch):
+    """
+    Test that the re-tries that made progress don't count toward the cap.
+    """
+    _no_sleep(monkeypatch)
+    crawler = FakeCrawler([0, 5, 0, 3, 0, 2])
+    assert crawl_with_retries(crawler, Logger(), unattended=True,
+                              max_retries=2, backoff=1) == EXIT_SUCCESS
+    assert crawler.crawls == 7
+
+
+def test_retry_aborted(monkeypatch):
+    """
+    Test stopping (exit code 3) when the re-try is declined.
+    """
+    _no_sleep(monkeypatch)
+    monkeypatch.setattr('builtins.input', lambda msg: 'n')
+    crawler = FakeCrawler([0])
+    assert crawl_with_retries(crawler, Logger()) == EXIT_ABORTED
+    assert crawler.crawls == 1
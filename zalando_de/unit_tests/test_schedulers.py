@@ -0,0 +1,44 @@
+from zalando_de.scrape import main
+from zalando_de.scrape.commun.schedulers import RecrawlScheduler
+from zalando_de.scrape.main import Scraper
+from zalando_de.utils.logging import Logger
+
+
+def test_recrawl_scheduler(tmp_path):
+    """
+    Test the articles that changed are re-crawled first, and that the
+    schedule is persisted.
+    """
+    path = str(tmp_path / "articles.schedule.json")
+    scheduler = RecrawlScheduler(path)
+    details = {'price_label': '29.99 €', 'available_sizes': {}, 'available_colors': []}
+    # Both articles are scraped twice, a day apart, but only one changed.
+    for article_id in ('stable', 'volatile'):
+        assert not scheduler.record(article_id, f"{article_id}.html", details, 0)
+    assert not scheduler.record('stable', "stable.html", details, 86400)
+    assert scheduler.record('volatile', "volatile.html",
+                            dict(details, price_label='19.99 €'), 86400)
+    assert [article_id for article_id, _ in scheduler.due()] == ['volatile', 'stable']
+    assert scheduler.due(1) == [('volatile', "volatile.html")]
+    # The schedule is read back from the file.
+    scheduler.save()
+    assert len(RecrawlScheduler(path)) == 2
+
+
+class FakeAssistant():
+
+    def __init__(self) -> None:
+        self.logger = Logger()
+
+
+def test_due_articles_last_seen(tmp_path, monkeypatch):
+    """
+    Test that the articles tracked from the outputs are scheduled from
+    the last time they were seen unchanged (not from their scrape date).
+    """
+    monkeypatch.setattr(main, 'read_scraped_times', lambda path, sep: {'a': 100, 'b': 100})
+    scraper = Scraper(FakeAssistant(), str(tmp_path))
+    scraper._hashes.seen('a', "0" * 40, 300)
+    assert list(scraper._due_articles()) == ["https://en.zalando.de/b.html",
+                                             "https://en.zalando.de/a.html"]
+    assert scraper._scheduler._articles['a']['scraped_at'] == 300
@@ -0,0 +1,35 @@
+import json
+import os
+
+from zalando_de.scrape.commun.selectors import SelectorRegistry
+from zalando_de.scrape.units.parsers import ArticleParser
+from zalando_de.unit_tests.test_parsers import ARTICLE_HTML
+
+
+def test_selector_registry(tmp_path):
+    """
+    Test overriding the selectors from a config, reloading it once it's
+    modified, and parsing an article using the fallbacks.
+    """
+    path = tmp_path / "selectors.json"
+    path.write_text(json.dumps({'brand_name': ["Xq0Ulx", "SZKKsK mt1kvu FxZV-M pVrzNP _5Yd-hZ"]}))
+    registry = SelectorRegistry(str(path))
+    assert registry.classes('brand_name')[0] == "Xq0Ulx"
+    assert registry.locators('brand_name')[0] == ('css selector', '.Xq0Ulx')
+    # The brand is found using the fallback.
+    details = ArticleParser(ARTICLE_HTML, registry.as_dict()).parse()
+    assert details['brand_name'] == "Sir Raymond Tailor"
+    # An invalid config is ignored.
+    path.write_text(json.dumps({'unknown': "Xq0Ulx"}))
+    os.utime(path, (1, 1))
+    assert not registry.reload()
+    assert registry.classes('brand_name')[0] == "Xq0Ulx"
+    # A modified config is reloaded.
+    path.write_text(json.dumps({'price': "Tg1pK"}))
+    os.utime(path, (2, 2))
+    assert registry.reload()
+    assert registry.classes('brand_name') == ["SZKKsK mt1kvu FxZV-M pVrzNP _5Yd-hZ"]
+    registry.record('price', 1, .002)
+    registry.record('price', None, .004)
+    assert registry.stats()['price'] == {'hits': 1, 'misses': 1,
+                                         'fallbacks': 1, 'avg_ms': 3.0}
@@ -0,0 +1,80 @@
+import gzip
+
+import pytest
+
+from zalando_de.scrape.commun.sitemaps import iter_sitemap, parse_lastmod
+
+
+URLSET = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url>
+    <loc>https://en.zalando.de/pier-one-shirt-dark-green-pi922d09r-m11.html</loc>
+    <lastmod>2023-04-14T00:08:19+00:00</lastmod>
+  </url>
+  <url>
+    <loc>https://en.zalando.de/mens-clothing-shirts/</loc>
+  </url>
+</urlset>
+"""
+
+SITEMAP_INDEX = """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>{}</loc></sitemap>
+  <sitemap><loc>{}</loc></sitemap>
+</sitemapindex>
+"""
+
+
+def test_iter_sitemap(tmp_path):
+    """
+    Test streaming a sitemap index pointing to plain and gzipped sitemaps.
+    """
+
+    plain_path = tmp_path / "sitemap_1.xml"
+    plain_path.write_text(URLSET, encoding='utf-8')
+    # NOTE : The gzipped sitemap is detected by its content, not its name.
+    gzipped_path = tmp_path / "sitemap_2.xml"
+    gzipped_path.write_bytes(gzip.compress(URLSET.replace('pi922d09r-m11',
+                                                          'pi922d05k-a11')
+                                                 .encode('utf-8')))
+    index_path = tmp_path / "sitemap_index.xml.gz"
+    index_path.write_bytes(gzip.compress(SITEMAP_INDEX.format(plain_path, gzipped_path)
+                                                      .encode('utf-8')))
+
+    urls = list(iter_sitemap(str(index_path)))
+
+    assert [url for url, _ in urls] == [
+        'https://en.zalando.de/pier-one-shirt-dark-green-pi922d09r-m11.html',
+        'https://en.zalando.de/mens-clothing-shirts/',
+        'https://en.zalando.de/pier-one-shirt-dark-green-pi922d05k-a11.html',
+        'https://en.zalando.de/mens-clothing-shirts/',
+    ]
+    assert urls[0][1] == parse_lastmod('2023-04-14T00:08:19Z')
+    assert urls[1][1] is None
+
+
+@pytest.mark.parametrize('lastmod, expected', [
+    ('2023-04-14T00:08:19Z', 1681430899),
+    ('2023-04-14T00:08:19+00:00', 1681430899),
+    ('2023-04-14T02:08:19+02:00', 1681430899),
+    ('2023-04-13T22:08:19-0200', 1681430899),
+    ('2023-04-14T00:08:19.5Z', 1681430899.5),
+    ('2023-04-14T00:08:19.25+00:00', 1681430899.25),
+    ('2023-04-14T00:08:19.1234567Z', 1681430899.123456),
+    ('2023-04-14T00:08Z', 1681430880),
+    ('2023-04-14', 1681430400),
+    ('2023-04', 1680307200),
+    (' 2023-04-14T00:08:19Z\n', 1681430899),
+    ('', None),
+    ('2023-13-01', None),
+    ('14/04/2023', None),
+])
+def test_parse_lastmod(lastmod, expected):
+    """
+    Test parsing the W3C datetimes of the sitemaps (including the ones
+    `fromisoformat` rejects before Python 3.11).
+    """
+    if expected is None:
+        assert parse_lastmod(lastmod) is None
+    else:
+        assert parse_lastmod(lastmod) == pytest.approx(expected)
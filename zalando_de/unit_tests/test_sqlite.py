@@ -0,0 +1,34 @@
+import sqlite3
+
+from zalando_de.storage.sqlite import SQLiteStore
+from zalando_de.storage.schema import is_missing, scraped_time
+
+
+def test_sqlite_upsert(tmp_path):
+    """
+    Test upserting the cleaned articles, and replacing their details.
+    """
+    path = str(tmp_path / "articles.sqlite")
+    article = {'URL': "https://en.zalando.de/a.html", 'Brand': "Pier One",
+               'Name': "Shirt", 'Price': 29.95, 'Sold (%)': 0,
+               'Available Sizes': "M;L", 'Available Colors': "white",
+               'Fit': "Slim Fit", 'Collar': "Kent",
+               'Scrape Date': "Apr 12, 2023 10:00:00"}
+    with SQLiteStore(path, batch_size=1) as store:
+        store.upsert({'a': article, 'b': dict(article, Price=float('nan'))})
+        store.upsert({'a': dict(article, Price=19.95, Collar=None)})
+        assert store.ids() == {'a', 'b'}
+    connection = sqlite3.connect(path)
+    assert connection.execute("SELECT id, price FROM articles ORDER BY id;").fetchall() == [('a', 19.95),
+                                                                                          ('b', None)]
+    assert connection.execute("SELECT key, value FROM details WHERE id = 'a';").fetchall() == [('Fit', "Slim Fit")]
+
+
+def test_schema_helpers():
+    """
+    Test the shared missing value and scrape date helpers.
+    """
+    assert is_missing(None) and is_missing(float('nan')) and not is_missing(0)
+    assert scraped_time("Apr 12, 2023 10:00:00") < scraped_time("Apr 13, 2023 10:00:00")
+    assert scraped_time("yesterday") is None
+    assert scraped_time(None, float('-inf')) == float('-inf')
@@ -0,0 +1,62 @@
+import csv
+import sqlite3
+
+from zalando_de.storage.tables import LongTablesWriter
+from zalando_de.utils.compression import open_input
+
+
+SIZES = [('M', True, 2, 29.95), ('L', False, None, None)]
+
+
+def test_long_tables_csv(tmp_path):
+    """
+    Test appending the sizes and colors rows to their CSV files.
+    """
+    with LongTablesWriter(str(tmp_path), "shirts", batch_size=1) as writer:
+        writer.write('a', "Apr 12, 2023 10:00:00", SIZES, [('white',)])
+        writer.write('b', "Apr 12, 2023 10:00:01", None, [('blue',), ('red',)])
+    with open(tmp_path / "shirts_sizes.csv", encoding='utf-8') as sf:
+        sizes = list(csv.DictReader(sf))
+    with open(tmp_path / "shirts_colors.csv", encoding='utf-8') as cf:
+        colors = list(csv.DictReader(cf))
+    assert [(row['ID'], row['Size'], row['Stock']) for row in sizes] == [('a', 'M', '2'), ('a', 'L', '')]
+    assert [row['Color'] for row in colors] == ['white', 'blue', 'red']
+
+
+def test_long_tables_sqlite(tmp_path):
+    """
+    Test replacing the re-processed articles' rows in the SQLite tables.
+    """
+    path = str(tmp_path / "shirts.sqlite")
+    with LongTablesWriter(str(tmp_path), "shirts", sqlite_path=path) as writer:
+        writer.write('a', "Apr 12, 2023 10:00:00", SIZES, [('white',)])
+        writer.flush()
+        writer.write('a', "Apr 13, 2023 10:00:00", SIZES[:1], None)
+    connection = sqlite3.connect(path)
+    assert connection.execute("SELECT size, available, stock FROM sizes;").fetchall() == [('M', 1, 2)]
+    assert connection.execute("SELECT color FROM colors;").fetchall() == [('white',)]
+
+
+def test_long_tables_gzip(tmp_path):
+    """
+    Test appending the batches to a gzipped CSV file (a member each).
+    """
+    with LongTablesWriter(str(tmp_path), "shirts", batch_size=1, compression='gzip') as writer:
+        writer.write('a', "Apr 12, 2023 10:00:00", None, [('white',)])
+        writer.write('b', "Apr 12, 2023 10:00:01", None, [('blue',)])
+    with open_input(str(tmp_path / "shirts_colors.csv.gz"), newline='') as cf:
+        assert [row['Color'] for row in csv.DictReader(cf)] == ['white', 'blue']
+
+
+def test_long_tables_compression_switched(tmp_path):
+    """
+    Test that the rows of a table written uncompressed are carried over
+    once it's written compressed, and that the stale file is removed.
+    """
+    with LongTablesWriter(str(tmp_path), "shirts") as writer:
+        writer.write('a', "Apr 12, 2023 10:00:00", None, [('white',)])
+    with LongTablesWriter(str(tmp_path), "shirts", compression='gzip') as writer:
+        writer.write('b', "Apr 13, 2023 10:00:00", None, [('blue',)])
+    assert not (tmp_path / "shirts_colors.csv").exists()
+    with open_input(str(tmp_path / "shirts_colors.csv.gz"), newline='') as cf:
+        assert [row['Color'] for row in csv.DictReader(cf)] == ['white', 'blue']
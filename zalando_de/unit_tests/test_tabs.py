@@ -0,0 +1,56 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from zalando_de.scrape.commun.exceptions import ArticleProcessingException
+from zalando_de.scrape.commun.tabs import TabPool
+from zalando_de.utils.logging import Logger
+
+
+class FakeSwitchTo():
+
+    def __init__(self, driver) -> None:
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver.current_window_handle = handle
+
+
+class FakeDriver():
+
+    def __init__(self) -> None:
+        self.current_window_handle = 'home'
+        self.window_handles = ['home']
+        self.switch_to = FakeSwitchTo(self)
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+
+class SlowAssistant():
+
+    def __init__(self) -> None:
+        self.driver = FakeDriver()
+        self.logger = Logger()
+
+    def _open_in_new_tab(self, link: str):
+        self.driver.window_handles.append(link)
+        return link
+
+    def _wait_until_ready(self):
+        raise TimeoutException("The tab is still loading.")
+
+
+def test_tab_ready_timeout():
+    """
+    Test that a prefetched tab's loading timeout skips the article (as
+    without prefetching), and that the tab is closed.
+    """
+    assistant = SlowAssistant()
+    with TabPool(assistant, 2) as tab_pool:
+        tab_pool.submit(['a', 'b'])
+        with pytest.raises(ArticleProcessingException) as e:
+            with tab_pool.tab('a'):
+                pass
+        assert isinstance(e.value.exc_error, TimeoutException)
+        assert assistant.driver.window_handles == ['home', 'b']
+        assert assistant.driver.current_window_handle == 'home'
@@ -0,0 +1,108 @@
+import gzip
+import io
+import os
+
+# Handle import error on zstandard module.
+try:
+    import zstandard as zstd
+    zstd_imported = True
+except ImportError:
+    zstd = None
+    zstd_imported = False
+
+
+# The compressions, and their files' extensions.
+COMPRESSIONS = {None: '',
+                'gzip': '.gz',
+                'zstd': '.zst'}
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def validate_compression(compression: str):
+    if compression not in COMPRESSIONS:
+        raise ValueError("Invalid compression : {}".format(compression))
+    if compression == 'zstd' and not zstd_imported:
+        raise ImportError("The zstd compression requires zstandard "
+                          "(pip install zstandard).")
+    return compression
+
+
+def compressed_path(path: str, compression: str = None):
+    """
+    Get the path of a compressed output (e.g. `metadata.json.gz`).
+
+    """
+    return path + COMPRESSIONS[validate_compression(compression)]
+
+
+def find_path(path: str):
+    """
+    Get the path of an output, compressed or not : the last modified
+    one among `path`, `path.gz`, and `path.zst` (None if none exists).
+
+    """
+    paths = [path + extension for extension in COMPRESSIONS.values()
+             if os.path.exists(path + extension)]
+    return max(paths, key=os.path.getmtime) if paths else None
+
+
+def discard_variants(path: str, kept_path: str):
+    """
+    Remove the other (stale) variants of an output, e.g. the
+    uncompressed one once it's re-written compressed.
+
+    """
+    for extension in COMPRESSIONS.values():
+        if path + extension != kept_path and os.path.exists(path + extension):
+            os.remove(path + extension)
+
+
+def open_output(path: str, compression: str = None, newline: str = None,
+                append: bool = False):
+    """
+    Open an output as a text stream, compressing it on the fly.
+
+    If `append` is True, the compressed output is appended as a new
+    gzip member (or zstd frame), which the readers decompress after
+    the previous ones.
+
+    NOTE : `path` is the compressed output's path (see
+    :func:`compressed_path`).
+
+    """
+    mode = 'a' if append else 'w'
+    if validate_compression(compression) == 'gzip':
+        return gzip.open(path, f'{mode}t', compresslevel=GZIP_LEVEL,
+                         encoding='utf-8', newline=newline)
+    if compression == 'zstd':
+        writer = zstd.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(open(path, f'{mode}b'),
+                                                                     closefd=True)
+        return io.TextIOWrapper(writer, encoding='utf-8', newline=newline)
+    return open(path, mode, encoding='utf-8', newline=newline)
+
+
+def open_input(path: str, newline: str = None):
+    """
+    Open an output as a text stream, detecting its compression using
+    the magic number (regardless of its name), and decompressing it on
+    the fly.
+
+    """
+    with open(path, 'rb') as stream:
+        magic = stream.read(4)
+    if magic[:2] == GZIP_MAGIC:
+        return gzip.open(path, 'rt', encoding='utf-8', newline=newline)
+    if magic == ZSTD_MAGIC:
+        if not zstd_imported:
+            raise ImportError("Reading {} requires zstandard "
+                              "(pip install zstandard).".format(path))
+        reader = zstd.ZstdDecompressor().stream_reader(open(path, 'rb'),
+                                                       read_across_frames=True,
+                                                       closefd=True)
+        return io.TextIOWrapper(reader, encoding='utf-8', newline=newline)
+    return open(path, 'r', encoding='utf-8', newline=newline)
@@ -1,3 +1,4 @@
+import random
 import time
 import os
 
@@ -110,6 +111,22 @@ def delta_datetime(t_1: float, t_2: float):
             "seconds".format(days, hours, minutes, seconds))
 
 
+### Retry helpers
+
+def backoff_delay(attempt: int, base: float = 5, cap: float = 600):
+    """
+    Compute the time to wait before the `attempt`th retry, using
+    an exponential backoff capped to `cap` seconds, with jitter.
+
+    Half of the delay is fixed and the other half is random, so
+    that several nodes restarting together do not hit the website
+    at the same time.
+
+    """
+    delay = min(cap, base * 2 ** max(attempt - 1, 0))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
 ### Selenium helpers
 
 def total_items(text: str):
@@ -168,6 +185,7 @@ __all__ = [
     'suffix_timer',
     'current_datetime',
     'delta_datetime',
+    'backoff_delay',
     'total_items',
     'total_pages'
 ]
\ No newline at end of file